@@ -6,9 +6,31 @@ All who use THE DOT must worship THE DOT.
 
 __version__ = "0.3.0"
 
-from dot.core import Dot, worship
-from dot.config import DotConfig, get_config
-from dot.display import Display, get_display
+# Public names are imported on first access so that ``import dot`` (and every
+# ``dot.<submodule>`` import, such as the CLI entry point) stays cheap.
+_LAZY_ATTRS = {
+    "Dot": "dot.core",
+    "worship": "dot.core",
+    "DotConfig": "dot.config",
+    "get_config": "dot.config",
+    "Display": "dot.display",
+    "get_display": "dot.display",
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module 'dot' has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     "Dot",
@@ -0,0 +1,479 @@
+"""
+Batch commit-range validation for THE DOT.
+
+Streams every commit message in a revision range through a single
+``git log -z`` pipe and checks them against a suffix resolved once per run,
+instead of launching ``dot validate`` once per commit.
+
+validate_repos fans the same check out over many repositories with a
+process pool, each repository using the suffix from its own ``.dot.ini``.
+"""
+
+from __future__ import annotations
+
+import csv
+import glob
+import io
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from dot.config import resolve_worship_suffix
+from dot.core import get_dot
+
+# Read the pipe in large chunks; records are split on NUL as they arrive.
+_CHUNK_SIZE = 1 << 16
+
+
+@dataclass(frozen=True)
+class CommitResult:
+    sha: str
+    subject: str
+    valid: bool
+
+
+@dataclass
+class RangeReport:
+    """Outcome of validating every commit in a revision range."""
+
+    rev_range: str
+    suffix: str
+    source: str
+    checked: int = 0
+    cached: int = 0
+    invalid: List[CommitResult] = field(default_factory=list)
+    cache_error: Optional[str] = None  # verdicts could not be saved
+
+    @property
+    def ok(self) -> bool:
+        return not self.invalid
+
+    def to_dict(self) -> dict:
+        data = {
+            "range": self.rev_range,
+            "suffix": self.suffix,
+            "source": self.source,
+            "checked": self.checked,
+            "cached": self.cached,
+            "valid": self.checked - len(self.invalid),
+            "invalid": [
+                {"sha": r.sha, "subject": r.subject} for r in self.invalid
+            ],
+        }
+        if self.cache_error is not None:
+            data["cache_error"] = self.cache_error
+        return data
+
+
+def iter_commit_messages(rev_range: str, repo: Optional[Path] = None,
+                         timeout: Optional[float] = None) -> Iterator[Tuple[str, str]]:
+    """Yield ``(sha, message)`` for each commit in ``rev_range``.
+
+    Messages are read incrementally from one ``git log -z`` process, so
+    memory stays flat no matter how long the range is.
+
+    Args:
+        timeout: Kill git if the whole log takes longer than this many seconds.
+
+    Raises:
+        subprocess.CalledProcessError: if git rejects the range.
+        subprocess.TimeoutExpired: if ``timeout`` elapsed first.
+    """
+    cmd = ["git", "log", "-z", "--format=%H%n%B", rev_range]
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(repo) if repo else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    timed_out = threading.Event()
+    timer = None
+    if timeout is not None:
+        def _expire():
+            timed_out.set()
+            proc.kill()
+        timer = threading.Timer(timeout, _expire)
+        timer.daemon = True
+        timer.start()
+    pending = b""
+    try:
+        while True:
+            chunk = proc.stdout.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            pending += chunk
+            *records, pending = pending.split(b"\0")
+            for record in records:
+                yield _parse_record(record)
+        if pending.strip():
+            yield _parse_record(pending)
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read()
+        proc.stderr.close()
+        returncode = proc.wait()
+        if timer is not None:
+            timer.cancel()
+    if timed_out.is_set() and returncode != 0:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode, cmd, stderr=stderr.decode("utf-8", "replace").strip()
+        )
+
+
+def _parse_record(record: bytes) -> Tuple[str, str]:
+    sha, _, body = record.decode("utf-8", "replace").partition("\n")
+    return sha.strip(), body
+
+
+def list_commits(rev_range: str, repo: Optional[Path] = None,
+                 timeout: Optional[float] = None) -> List[str]:
+    """Hashes of the commits in ``rev_range``, newest first (``git rev-list``).
+
+    Raises:
+        subprocess.CalledProcessError: if git rejects the range.
+        subprocess.TimeoutExpired: if ``timeout`` elapsed first.
+    """
+    result = subprocess.run(
+        ["git", "rev-list", rev_range],
+        cwd=str(repo) if repo else None,
+        capture_output=True, text=True, timeout=timeout, check=True,
+    )
+    return result.stdout.split()
+
+
+def _messages_for(shas: List[str], repo: Optional[Path], native: bool) -> Iterator[Tuple[str, str]]:
+    """Yield ``(sha, message)`` for specific commits over one pipe."""
+    if native:
+        from dot.gitobjects import Repository
+
+        repository = Repository.discover(Path(repo) if repo else None)
+        try:
+            for sha in shas:
+                yield sha, repository.commit(sha).message
+        finally:
+            repository.close()
+    else:
+        from dot.gitpool import get_pool
+
+        pool = get_pool()
+        for sha in shas:
+            yield sha, pool.commit(sha, Path(repo) if repo else None).message
+
+
+def _validate_cached(report: RangeReport, cache, repo: Optional[Path],
+                     timeout: Optional[float], native: bool) -> None:
+    """Fill ``report``, validating only commits the cache has not seen."""
+    if native:
+        from dot.gitobjects import Repository
+
+        repository = Repository.discover(Path(repo) if repo else None)
+        try:
+            shas = [c.sha for c in repository.walk_range(report.rev_range)]
+        finally:
+            repository.close()
+    else:
+        shas = list_commits(report.rev_range, repo, timeout=timeout)
+
+    verdicts = {sha: cache.get(sha, report.suffix) for sha in shas}
+    report.checked = len(shas)
+    report.cached = sum(1 for v in verdicts.values() if v is not None)
+    # Known-invalid commits are still read, but only for their subject line
+    todo = [sha for sha in shas if not verdicts[sha]]
+    dot = get_dot()
+    for sha, message in _messages_for(todo, repo, native):
+        valid = verdicts[sha]
+        if valid is None:
+            valid = dot.validate_commit(message, suffix=report.suffix)
+            cache.put(sha, report.suffix, valid)
+        if not valid:
+            subject = message.strip().split("\n", 1)[0]
+            report.invalid.append(CommitResult(sha, subject, False))
+    # The verdicts are already in the report; failing to remember them only
+    # costs the next run time, so it is not a reason to fail this one
+    try:
+        cache.save()
+    except OSError as e:
+        report.cache_error = f"{cache.path}: {e.strerror or e}"
+
+
+def validate_range(rev_range: str, repo: Optional[Path] = None, suffix: Optional[str] = None,
+                   timeout: Optional[float] = None, native: bool = False,
+                   cache=None) -> RangeReport:
+    """Validate every commit in ``rev_range``.
+
+    Args:
+        rev_range: Any revision range git understands (e.g. ``main..HEAD``).
+        repo: Repository to run in; defaults to the current directory.
+        suffix: Override the worship suffix; resolved once (for ``repo``)
+            when omitted.
+        timeout: Give up on the range after this many seconds (ignored
+            with ``native``).
+        native: Read commits with dot.gitobjects instead of running git.
+        cache: A dot.verdicts.VerdictCache. Commits it already knows to be
+            valid under this suffix are skipped, and new verdicts are saved
+            (a failed save is reported in RangeReport.cache_error).
+
+    Returns:
+        RangeReport listing the commits that do not worship THE DOT.
+    """
+    if suffix is None:
+        suffix, source = resolve_worship_suffix(Path(repo) if repo else None)
+    else:
+        source = "argument"
+
+    report = RangeReport(rev_range=rev_range, suffix=suffix, source=source)
+    if cache is not None:
+        _validate_cached(report, cache, repo, timeout, native)
+        return report
+
+    dot = get_dot()
+    if native:
+        from dot.gitobjects import iter_range_messages
+        messages = iter_range_messages(rev_range, repo)
+    else:
+        messages = iter_commit_messages(rev_range, repo, timeout=timeout)
+    for sha, message in messages:
+        report.checked += 1
+        if not dot.validate_commit(message, suffix=suffix):
+            subject = message.strip().split("\n", 1)[0]
+            report.invalid.append(CommitResult(sha, subject, False))
+    return report
+
+
+def format_table(report: RangeReport) -> str:
+    """Render a range report as a plain-text table."""
+    lines = [
+        f"Range: {report.rev_range}",
+        f"Suffix: {report.suffix} (source: {report.source})",
+        f"Checked: {report.checked}  Valid: {report.checked - len(report.invalid)}  "
+        f"Invalid: {len(report.invalid)}"
+        + (f"  (cached: {report.cached})" if report.cached else ""),
+    ]
+    if report.invalid:
+        lines.append("")
+        lines.append(f"{'SHA':<12} SUBJECT")
+        lines.append("=" * 60)
+        for r in report.invalid:
+            lines.append(f"{r.sha[:12]:<12} {r.subject}")
+    else:
+        lines.append("")
+        lines.append("✓ Every commit in range worships THE DOT")
+    if report.cache_error is not None:
+        lines.append("")
+        lines.append(f"Warning: verdict cache not saved ({report.cache_error})")
+    return "\n".join(lines)
+
+
+def format_json(report: RangeReport) -> str:
+    """Render a range report as JSON."""
+    return json.dumps(report.to_dict(), indent=2)
+
+
+# ---------------------------------------------------------------------------
+# Many repositories
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RepoResult:
+    """Outcome for one repository in a multi-repo run."""
+
+    repo: str
+    report: Optional[RangeReport] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def status(self) -> str:
+        if self.error is not None:
+            return "error"
+        return "ok" if self.report.ok else "invalid"
+
+    def to_dict(self) -> dict:
+        data = {"repo": self.repo, "status": self.status, "elapsed": round(self.elapsed, 3)}
+        if self.report is not None:
+            data.update(self.report.to_dict())
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+@dataclass
+class MultiRepoReport:
+    """Aggregated outcome of validating a range across many repositories."""
+
+    rev_range: str
+    results: List[RepoResult] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(r.status == "ok" for r in self.results)
+
+    def counts(self) -> dict:
+        counts = {"ok": 0, "invalid": 0, "error": 0}
+        for r in self.results:
+            counts[r.status] += 1
+        return counts
+
+    def to_dict(self) -> dict:
+        return {
+            "range": self.rev_range,
+            "repos": len(self.results),
+            **self.counts(),
+            "results": [r.to_dict() for r in self.results],
+        }
+
+
+def load_repo_list(spec: str) -> List[Path]:
+    """Expand ``spec`` into repository directories.
+
+    ``spec`` is either a file listing one repository per line (blank lines
+    and ``#`` comments ignored) or a glob pattern (``**`` allowed).
+    """
+    path = Path(os.path.expanduser(spec))
+    if path.is_file():
+        with open(path, "r", encoding="utf-8") as f:
+            entries = [line.strip() for line in f]
+        candidates = [
+            Path(os.path.expanduser(e)) for e in entries if e and not e.startswith("#")
+        ]
+    else:
+        candidates = [Path(p) for p in glob.glob(os.path.expanduser(spec), recursive=True)]
+        candidates = [p for p in candidates if p.is_dir()]
+
+    seen = set()
+    repos = []
+    for p in candidates:
+        key = os.path.abspath(p)
+        if key not in seen:
+            seen.add(key)
+            repos.append(Path(key))
+    return repos
+
+
+def _validate_repo_worker(repo: str, rev_range: str, timeout: Optional[float],
+                          native: bool = False, cache_path: Optional[str] = None) -> RepoResult:
+    """Validate one repository; runs in a pool worker and never raises."""
+    from dot.gitobjects import GitObjectError
+    from dot.gitpool import GitPoolError
+
+    start = time.monotonic()
+    try:
+        cache = None
+        if cache_path is not None:
+            from dot.verdicts import VerdictCache
+            cache = VerdictCache(cache_path)
+        report = validate_range(rev_range, Path(repo), timeout=timeout, native=native,
+                                cache=cache)
+        return RepoResult(repo, report=report, elapsed=time.monotonic() - start)
+    except subprocess.TimeoutExpired:
+        error = f"timed out after {timeout}s"
+    except subprocess.CalledProcessError as e:
+        error = e.stderr or str(e)
+    except (subprocess.SubprocessError, OSError, GitObjectError, GitPoolError) as e:
+        error = str(e)
+    return RepoResult(repo, error=error, elapsed=time.monotonic() - start)
+
+
+def validate_repos(repos: Iterable[Path], rev_range: str, jobs: Optional[int] = None,
+                   timeout: Optional[float] = None, native: bool = False,
+                   cache_path: Optional[Path] = None) -> MultiRepoReport:
+    """Validate ``rev_range`` in every repository using a process pool.
+
+    Each repository streams its own ``git log`` once and is checked against
+    the suffix resolved from that repository (``resolve_worship_suffix``
+    semantics: environment, then its ``.dot.ini``, then the default).
+    Results are collected as they finish, so a slow repository only
+    occupies one worker; ``timeout`` bounds how long it can hold it.
+
+    Args:
+        repos: Repository directories.
+        rev_range: Revision range to check in each repository.
+        jobs: Worker processes; defaults to the CPU count.
+        timeout: Per-repository limit in seconds.
+        native: Read commits with dot.gitobjects instead of running git.
+        cache_path: Verdict cache file shared by the workers (see
+            dot.verdicts); None disables caching.
+
+    Returns:
+        MultiRepoReport with one result per repository, in input order.
+    """
+    repos = [str(r) for r in repos]
+    report = MultiRepoReport(rev_range=rev_range)
+    if not repos:
+        return report
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(repos)))
+
+    by_repo = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(_validate_repo_worker, repo, rev_range, timeout, native,
+                        str(cache_path) if cache_path else None): repo
+            for repo in repos
+        }
+        for future in as_completed(futures):
+            repo = futures[future]
+            try:
+                by_repo[repo] = future.result()
+            except Exception as e:  # worker crashed (e.g. killed)
+                by_repo[repo] = RepoResult(repo, error=f"worker failed: {e}")
+    report.results = [by_repo[repo] for repo in repos]
+    return report
+
+
+def format_repos_table(report: MultiRepoReport) -> str:
+    """Render a multi-repo report as a plain-text table."""
+    counts = report.counts()
+    lines = [
+        f"Range: {report.rev_range}",
+        f"Repos: {len(report.results)}  OK: {counts['ok']}  "
+        f"Invalid: {counts['invalid']}  Errors: {counts['error']}",
+        "",
+        f"{'STATUS':<8} {'CHECKED':>7} {'INVALID':>7}  REPO",
+        "=" * 60,
+    ]
+    for r in report.results:
+        checked = r.report.checked if r.report else 0
+        invalid = len(r.report.invalid) if r.report else 0
+        line = f"{r.status:<8} {checked:>7} {invalid:>7}  {r.repo}"
+        if r.error:
+            line += f"  ({r.error})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def format_repos_json(report: MultiRepoReport) -> str:
+    """Render a multi-repo report as JSON."""
+    return json.dumps(report.to_dict(), indent=2)
+
+
+CSV_FIELDS = ["repo", "status", "checked", "valid", "invalid", "suffix", "source",
+              "invalid_shas", "error", "elapsed"]
+
+
+def format_repos_csv(report: MultiRepoReport) -> str:
+    """Render a multi-repo report as CSV, one row per repository."""
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    for r in report.results:
+        row = {"repo": r.repo, "status": r.status, "error": r.error or "",
+               "elapsed": round(r.elapsed, 3)}
+        if r.report is not None:
+            row.update(
+                checked=r.report.checked,
+                valid=r.report.checked - len(r.report.invalid),
+                invalid=len(r.report.invalid),
+                suffix=r.report.suffix,
+                source=r.report.source,
+                invalid_shas=" ".join(c.sha for c in r.report.invalid),
+            )
+        writer.writerow(row)
+    return out.getvalue()
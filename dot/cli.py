@@ -4,22 +4,13 @@ Command-line interface for THE DOT.
 
 from __future__ import annotations
 
+# Keep module-level imports minimal: every commit hook pays for them.
+# Command handlers import what they need when they run.
 import os
 import sys
-import shutil
-import subprocess
 from pathlib import Path
-from dot.core import get_dot, worship
 from dot.messages import VALID_COMMIT_MESSAGE, INVALID_COMMIT_MESSAGE
-from dot.changelog import handle_changelog
-from dot.doctor import handle_doctor as doctor_run
-from dot.init_cmd import handle_init as init_run
-from dot.config import (
-    resolve_worship_suffix,
-    write_worship_suffix,
-)
 from dot import __version__
-from dot import git_utils
 
 
 # Validation mode registry: maps flag tuples to (module_path, function_name)
@@ -44,17 +35,23 @@ VALIDATION_MODES = {
     ('--zen',): ('dot.zen', 'zen_validation'),
 }
 
+# Flag -> (module_path, function_name), flattened once for O(1) lookup
+MODE_BY_FLAG = {
+    flag: target for flags, target in VALIDATION_MODES.items() for flag in flags
+}
+
 # Flatten all validation flags for easy message filtering
-ALL_VALIDATION_FLAGS = set()
-for flags in VALIDATION_MODES.keys():
-    ALL_VALIDATION_FLAGS.update(flags)
+ALL_VALIDATION_FLAGS = set(MODE_BY_FLAG)
+
+# Output controls for `dot validate`; never part of the message
+OUTPUT_FLAGS = {"--quiet", "--porcelain", "--verbose"}
 
 
 def dispatch_command(command, args, dot):
     """Dispatch a command to its handler function.
 
-    This replaces the 90+ elif chain in the original main() function,
-    reducing cyclomatic complexity from 70+ to <10.
+    Looks the command up in the registry (dot.commands.COMMANDS), imports
+    only the handler's module and calls it with the CLI arguments.
 
     Args:
         command (str|None): The command name (e.g., "worship", "validate").
@@ -74,130 +71,346 @@ def dispatch_command(command, args, dot):
         ✓ Valid commit message
         0
     """
-    # Command registry maps command names to handler functions
-    # Each handler takes (args, dot) and returns an exit code
-
-    # Special case: no command or "worship" command
-    if not command or command == "worship":
-        name = args[0] if args else "CLI User"
-        epic_mode = "--epic" in args
-        if epic_mode:
-            from dot.epic import epic_worship
-            print(epic_worship(name))
-        else:
-            print(worship(name))
-        return 0
-
-    # Simple philosophy command handlers (inline for brevity)
-    simple_commands = {
-        "tenets": lambda: (print("THE DOT Philosophy:"), [print(f"  {i}. {t}") for i, t in enumerate(dot.get_tenets(), 1)], 0)[2],
-        "sing": lambda: __import__('dot.epic', fromlist=['epic_tenets']).epic_tenets() and print(__import__('dot.epic', fromlist=['epic_tenets']).epic_tenets()) or 0,
-        "invoke": lambda: (print(), print(__import__('dot.epic', fromlist=['epic_invocation']).epic_invocation()), print(), 0)[3],
-        "horoscope": lambda: (print(__import__('dot.philosophies.astrology', fromlist=['daily_horoscope']).daily_horoscope(args[0] if args else None)), 0)[1],
-        "chart": lambda: (print(__import__('dot.philosophies.astrology', fromlist=['birth_chart']).birth_chart(args[0] if args else "Repository", git_utils.get_creation_date())), 0)[1],
-        "planets": lambda: (print(__import__('dot.philosophies.astrology', fromlist=['planetary_hours']).planetary_hours()), 0)[1],
-        "moon": lambda: (print(__import__('dot.philosophies.astrology', fromlist=['moon_phase_advice']).moon_phase_advice()), 0)[1],
-        "ephemeris": lambda: (print(__import__('dot.philosophies.astrology', fromlist=['ephemeris_summary']).ephemeris_summary(include_minors="--no-minors" not in args, include_comets="--no-comets" not in args)), 0)[1],
-        "element": lambda: (print(__import__('dot.philosophies.alchemy', fromlist=['element_reading']).element_reading()), 0)[1],
-        "opus": lambda: (print(__import__('dot.philosophies.alchemy', fromlist=['magnum_opus_guide']).magnum_opus_guide()), 0)[1],
-        "operations": lambda: (print(__import__('dot.philosophies.alchemy', fromlist=['operations_guide']).operations_guide()), 0)[1],
-        "stone": lambda: (print(__import__('dot.philosophies.alchemy', fromlist=['philosophers_stone_status']).philosophers_stone_status(args[0] if args else "Repository")), 0)[1],
-    }
+    from dot.commands import lookup, run
 
-    if command in simple_commands:
-        return simple_commands[command]()
-
-    # Commands with existing handlers
-    if command == "validate":
-        return handle_validate(args, dot)
-    elif command == "hooks":
-        subcommand = args[0] if args else "install"
-        return handle_hooks(subcommand)
-    elif command == "stats":
-        subcommand = args[0] if args else "summary"
-        return handle_stats(subcommand)
-    elif command == "badge":
-        format_type = args[0] if args else "markdown"
-        return handle_badge(format_type)
-    elif command == "poem":
-        sub = args[0] if args else "hymn"
-        return handle_poem(sub, args[1:] if len(args) > 1 else [])
-    elif command == "tarot":
-        sub = args[0] if args else "draw"
-        return handle_tarot(sub, args[1:], deprecated=True)
-    elif command == "shinto":
-        sub = args[0] if args else "norito"
-        return handle_shinto(sub, args[1:], deprecated=True)
-    elif command == "zen":
-        sub = args[0] if args else "koan"
-        return handle_zen(sub, args[1:])
-    elif command == "hermetic":
-        sub = args[0] if args else "reading"
-        return handle_hermetic(sub, args[1:], deprecated=True)
-    elif command == "gnostic":
-        sub = args[0] if args else "reading"
-        return handle_gnostic(sub, args[1:], deprecated=True)
-    elif command == "norse":
-        sub = args[0] if args else "reading"
-        return handle_norse(sub, args[1:], deprecated=True)
-    elif command == "zoroastrian":
-        sub = args[0] if args else "reading"
-        return handle_zoroastrian(sub, args[1:], deprecated=True)
-    elif command == "egyptian":
-        sub = args[0] if args else "reading"
-        return handle_egyptian(sub, args[1:], deprecated=True)
-    elif command == "jain":
-        sub = args[0] if args else "reading"
-        return handle_jain(sub, args[1:], deprecated=True)
-    elif command == "wisdom":
-        philosophy = args[0] if args else None
-        concept = args[1] if len(args) > 1 else None
-        return handle_wisdom(philosophy, concept, args[2:] if len(args) > 2 else [])
-    elif command == "config":
-        subcommand = args[0] if args else "show"
-        return handle_config(subcommand, args[1:])
-    elif command == "completions":
-        shell = args[0] if args else ""
-        return handle_completions(shell)
-    elif command == "changelog":
-        subcommand = args[0] if args else "add"
-        return handle_changelog(subcommand, args[1:])
-    elif command in ("version", "--version", "-v"):
-        print(f"THE DOT version {__version__}")
-        return 0
-    elif command == "help":
+    entry = lookup(command)
+    if entry is None:
+        print(f"Unknown command: {command}")
         print_help()
+        return 1
+    return run(entry, args, dot)
+
+
+def cmd_worship(args, dot):
+    """Register worship of THE DOT (``--epic`` for Homeric glory)."""
+    name = args[0] if args else "CLI User"
+    if "--epic" in args:
+        from dot.epic import epic_worship
+        print(epic_worship(name))
+    else:
+        from dot.core import worship
+        print(worship(name))
+    return 0
+
+
+def cmd_tenets(args, dot):
+    """Print THE DOT's tenets."""
+    print("THE DOT Philosophy:")
+    for i, tenet in enumerate(dot.get_tenets(), 1):
+        print(f"  {i}. {tenet}")
+    return 0
+
+
+def cmd_invoke(args, dot):
+    """Print an epic invocation."""
+    from dot.epic import epic_invocation
+
+    print()
+    print(epic_invocation())
+    print()
+    return 0
+
+
+def cmd_suffix(args, dot):
+    """Show the worship suffix (``--raw`` prints just the suffix, for hooks)."""
+    if "--raw" in args:
+        from dot.config import resolve_worship_suffix
+        print(resolve_worship_suffix()[0])
         return 0
-    elif command == "garden":
-        sub = args[0] if args else "list"
-        return handle_garden(sub, args[1:])
-    elif command == "suffix":
-        return handle_suffix()
-    elif command == "backstory":
-        return handle_backstory()
-    elif command == "philosophy":
-        return handle_philosophy()
-    elif command == "demo":
-        return handle_demo()
-    elif command == "init":
-        return init_run()
-    elif command == "doctor":
-        return doctor_run()
-    elif command in ("donate", "sponsor", "support"):
-        return handle_donate()
+    return handle_suffix()
+
+
+def cmd_chart(args, dot):
+    """Print the repository birth chart from its first commit date."""
+    from dot.git_utils import get_creation_date
+    from dot.philosophies.astrology import birth_chart
+
+    print(birth_chart(args[0] if args else "Repository", get_creation_date()))
+    return 0
+
+
+def cmd_ephemeris(args, dot):
+    """Print the ephemeris summary (``--no-minors``/``--no-comets``).
+
+    With ``--from`` the positions are streamed as a time series instead
+    (see handle_ephemeris_series); ``build-table`` writes the Chebyshev
+    lookup table (see handle_ephemeris_build_table).
+    """
+    if args and args[0] == "build-table":
+        return handle_ephemeris_build_table(args[1:])
+    if any(a.split("=", 1)[0] in ("--from", "--to", "--step") for a in args):
+        return handle_ephemeris_series(args)
+
+    from dot.philosophies.astrology import ephemeris_summary
+
+    print(ephemeris_summary(
+        include_minors="--no-minors" not in args,
+        include_comets="--no-comets" not in args,
+    ))
+    return 0
+
+
+def handle_ephemeris_series(args):
+    """Stream geocentric longitude/latitude rows for a date range.
+
+    Rows are computed a chunk of instants at a time and written as they
+    are produced, so multi-year ranges never sit in memory.
+
+    Args:
+        args (list[str]): ``--from DATE --to DATE`` plus optional
+            ``--step INTERVAL`` (default ``1d``; units s/m/h/d/w),
+            ``--bodies a,b,...``, ``--format csv|jsonl`` (default csv),
+            ``--no-minors`` and ``--no-comets``.
+
+    Returns:
+        int: Exit code (0 on success, 1 for invalid arguments).
+
+    Example:
+        >>> handle_ephemeris_series(["--from", "2024-01-01", "--to", "2024-01-02",
+        ...                          "--bodies", "mars"])
+        time,body,lon_deg,lat_deg
+        2024-01-01T00:00:00Z,mars,267.077186,-0.550431
+        2024-01-02T00:00:00Z,mars,267.819352,-0.560159
+        0
+    """
+    from dot.philosophies import ephemeris
+
+    start, stop = _option_value(args, "--from"), _option_value(args, "--to")
+    if not start or not stop:
+        print("Error: --from and --to are both required (ISO dates, UTC)")
+        return 1
+    fmt = _option_value(args, "--format") or "csv"
+    if fmt not in ("csv", "jsonl"):
+        print("Error: --format must be csv or jsonl")
+        return 1
+    try:
+        start, stop = ephemeris.parse_instant(start), ephemeris.parse_instant(stop)
+        step = ephemeris.parse_step(_option_value(args, "--step") or "1d")
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    if stop < start:
+        print("Error: --to is before --from")
+        return 1
+
+    bodies = _option_value(args, "--bodies")
+    if bodies:
+        bodies = [b.strip() for b in bodies.split(",") if b.strip()]
     else:
-        # Handle all remaining philosophy teaching commands
-        return handle_philosophy_teaching(command, args)
+        bodies = list(ephemeris.DEFAULT_BODIES)
+        if "--no-minors" not in args:
+            bodies += ephemeris.MINOR_BODIES
+        if "--no-comets" not in args:
+            bodies += ephemeris.COMETS
+    try:
+        rows = ephemeris.iter_ephemeris(bodies, start, stop, step)
+        first = next(rows, None)
+    except KeyError as e:
+        print(f"Error: {e.args[0]}")
+        return 1
+
+    import itertools
+
+    write = ephemeris.write_csv if fmt == "csv" else ephemeris.write_jsonl
+    try:
+        write(itertools.chain([first] if first else [], rows), sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Reader went away (e.g. `| head`); stop quietly
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    return 0
+
+
+def handle_ephemeris_build_table(args):
+    """Fit and write the Chebyshev ephemeris table.
+
+    Positions inside the table's span are then interpolated instead of
+    solved from the orbital elements (see dot.philosophies.chebyshev).
+
+    Args:
+        args (list[str]): Optional ``--from DATE`` and ``--to DATE`` (default
+            1950-01-01 to 2050-01-01) and ``--out PATH`` (default
+            DOT_EPHEMERIS_TABLE or ~/.worship_the_dot/ephemeris.cheb).
+
+    Returns:
+        int: Exit code (0 on success, 1 for invalid arguments or I/O errors).
+    """
+    from dot.philosophies import astrology, chebyshev, ephemeris
+
+    try:
+        start = ephemeris.parse_instant(_option_value(args, "--from") or "1950-01-01")
+        stop = ephemeris.parse_instant(_option_value(args, "--to") or "2050-01-01")
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    out = _option_value(args, "--out")
+    path = Path(out).expanduser() if out else chebyshev.default_table_path()
+    try:
+        segments = chebyshev.build_table(path, astrology._julian_day(start), astrology._julian_day(stop))
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}")
+        return 1
+    chebyshev.clear_table_cache()
+    size = path.stat().st_size
+    print(f"Wrote {path} ({size / 1e6:.1f} MB): {len(segments)} bodies, "
+          f"{start.date()} to {stop.date()}")
+    return 0
+
+
+def cmd_events(args, dot):
+    """List sign ingresses, retrograde stations and conjunctions.
+
+    Args:
+        args (list[str]): ``--from DATE`` (default now) and ``--to DATE``
+            (default a year later), ``--bodies a,b,...`` (default the Sun
+            and planets), ``--kinds ingress,station,conjunction`` (default
+            all), ``--step INTERVAL`` (coarse scan step, default ``1d``) and
+            ``--format text|jsonl``.
+
+    Returns:
+        int: Exit code (0 on success, 1 for invalid arguments).
+
+    Example:
+        >>> cmd_events(["--from", "2024-03-01", "--to", "2024-05-01",
+        ...             "--bodies", "mercury", "--kinds", "station"], dot)
+        2024-04-01 22:05 UTC  station      Mercury turns retrograde at 26.88° Aries
+        2024-04-25 12:39 UTC  station      Mercury turns direct at 15.65° Aries
+        0
+    """
+    from datetime import datetime, timedelta
+    from dot.philosophies import ephemeris, events
+
+    fmt = _option_value(args, "--format") or "text"
+    if fmt not in ("text", "jsonl"):
+        print("Error: --format must be text or jsonl")
+        return 1
+    try:
+        start = _option_value(args, "--from")
+        start = ephemeris.parse_instant(start) if start else datetime.utcnow()
+        stop = _option_value(args, "--to")
+        stop = ephemeris.parse_instant(stop) if stop else start + timedelta(days=365)
+        step = ephemeris.parse_step(_option_value(args, "--step") or "1d")
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    if stop < start:
+        print("Error: --to is before --from")
+        return 1
+    bodies = _option_value(args, "--bodies")
+    bodies = [b.strip() for b in bodies.split(",") if b.strip()] if bodies else ephemeris.DEFAULT_BODIES
+    kinds = _option_value(args, "--kinds")
+    kinds = [k.strip() for k in kinds.split(",") if k.strip()] if kinds else events.KINDS
+    try:
+        found = events.find_events(bodies, start, stop, kinds, step / timedelta(days=1))
+        first = next(found, None)
+    except (KeyError, ValueError) as e:
+        print(f"Error: {e.args[0]}")
+        return 1
+
+    import itertools
+
+    try:
+        for event in itertools.chain([first] if first else [], found):
+            if fmt == "jsonl":
+                import json
+
+                print(json.dumps({
+                    "time": ephemeris._timestamp(event.time.replace(microsecond=0)),
+                    "kind": event.kind,
+                    "body": event.body,
+                    "detail": event.detail,
+                    "lon_deg": round(event.lon, 6),
+                }))
+            else:
+                print(f"{event.time:%Y-%m-%d %H:%M} UTC  {event.kind:<12} {events.describe(event)}")
+        sys.stdout.flush()
+    except BrokenPipeError:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    return 0
+
+
+def cmd_retrograde(args, dot):
+    """Report the next (or current) retrograde period of a body.
+
+    Args:
+        args (list[str]): Optional body (default ``mercury``) and
+            ``--from DATE`` (default now).
+
+    Returns:
+        int: Exit code (0 on success, 1 for an unknown body or one that
+        does not turn retrograde).
+
+    Example:
+        >>> cmd_retrograde(["mercury", "--from", "2024-02-01"], dot)
+        Mercury retrograde: 2024-04-01 22:05 UTC (26.88° Aries) to 2024-04-25 12:39 UTC (15.65° Aries)
+        0
+    """
+    from datetime import datetime
+    from dot.philosophies import ephemeris, events
+
+    positional = [a for i, a in enumerate(args)
+                  if not a.startswith("--") and (i == 0 or args[i - 1] != "--from")]
+    body = positional[0].lower() if positional else "mercury"
+    try:
+        start = _option_value(args, "--from")
+        start = ephemeris.parse_instant(start) if start else datetime.utcnow()
+        period = events.next_retrograde(body, start)
+    except (KeyError, ValueError) as e:
+        print(f"Error: {e.args[0]}")
+        return 1
+    label = body.upper() if "/" in body else body.title()
+    if period is None:
+        print(f"{label} does not turn retrograde in the next {events.HORIZON_DAYS / 365.25:.0f} years")
+        return 1
+
+    def at(when):
+        lon = events.geocentric_longitude(body, when)
+        return f"{when:%Y-%m-%d %H:%M} UTC ({events.position(lon)})"
+
+    began, ends = period
+    if began <= start:
+        print(f"{label} is retrograde now: since {at(began)}, until {at(ends)}")
+    else:
+        print(f"{label} retrograde: {at(began)} to {at(ends)}")
+    return 0
+
+
+def cmd_daemon(args, dot):
+    subcommand = args[0] if args and not args[0].startswith("--") else "start"
+    return handle_daemon(subcommand, args)
+
+
+def cmd_wisdom(args, dot):
+    philosophy = args[0] if args else None
+    concept = args[1] if len(args) > 1 else None
+    return handle_wisdom(philosophy, concept, args[2:] if len(args) > 2 else [])
+
+
+def cmd_version(args, dot):
+    print(f"THE DOT version {__version__}")
+    return 0
+
+
+def cmd_help(args, dot):
+    print_help()
+    return 0
 
 
 def handle_validate(args, dot):
     """Handle the validate command with various validation modes.
 
     Validates commit messages against THE DOT's worship suffix requirement.
-    Supports multiple philosophical validation modes via flags.
+    The verdict is computed first; a philosophical mode flag only changes
+    how it is rendered. Themed renderers are imported only when stdout is
+    a terminal or --verbose is given, otherwise the plain message is
+    printed. --porcelain prints "valid"/"invalid" and --quiet prints
+    nothing; both skip rendering entirely.
 
     Args:
-        args (list[str]): Command arguments including message and optional mode flags.
+        args (list[str]): Command arguments including message and optional
+            mode and output flags.
         dot (Dot): The DOT instance for validation.
 
     Returns:
@@ -208,37 +421,174 @@ def handle_validate(args, dot):
         >>> handle_validate(["feat: add feature BECAUSE I WORSHIP THE DOT"], dot)
         ✓ Valid commit message
         0
-        >>> handle_validate(["--epic", "feat: test BECAUSE I WORSHIP THE DOT"], dot)
+        >>> handle_validate(["--epic", "--verbose", "feat: test BECAUSE I WORSHIP THE DOT"], dot)
         ⚔️  VALID BY THE EPIC STANDARD ⚔️
         0
+        >>> handle_validate(["--hermetic", "--porcelain", "feat: test"], dot)
+        invalid
+        1
     """
     if not args:
         print("Error: Please provide a commit message to validate")
         return 1
 
-    # Filter out validation flags from message
-    message_args = [a for a in args if a not in ALL_VALIDATION_FLAGS]
-    message = " ".join(message_args)
-
-    # Check which validation mode is requested
-    for flags, (module_path, function_name) in VALIDATION_MODES.items():
-        if any(flag in args for flag in flags):
-            # Dynamically import and call the validation function
-            import importlib
-            module = importlib.import_module(module_path)
-            validation_func = getattr(module, function_name)
-            valid = dot.validate_commit(message)
-            print(validation_func(valid, message))
-            return 0 if valid else 1
-
-    # Default validation (no mode specified)
-    if dot.validate_commit(message):
-        print(VALID_COMMIT_MESSAGE)
-        return 0
+    if _option_value(args, "--repos") is not None:
+        return handle_validate_repos(args)
+    if any(a == "--range" or a.startswith("--range=") for a in args):
+        return handle_validate_range(args)
+
+    # Filter out mode and output flags from message
+    message = " ".join(
+        a for a in args if a not in ALL_VALIDATION_FLAGS and a not in OUTPUT_FLAGS
+    )
+    valid = dot.validate_commit(message)
+    exit_code = 0 if valid else 1
+
+    if "--quiet" in args:
+        return exit_code
+    if "--porcelain" in args:
+        print("valid" if valid else "invalid")
+        return exit_code
+
+    mode = next((MODE_BY_FLAG[a] for a in args if a in MODE_BY_FLAG), None)
+    if mode is not None and ("--verbose" in args or _stdout_is_tty()):
+        import importlib
+
+        module_path, function_name = mode
+        validation_func = getattr(importlib.import_module(module_path), function_name)
+        print(validation_func(valid, message))
+    else:
+        print(VALID_COMMIT_MESSAGE if valid else INVALID_COMMIT_MESSAGE)
+    return exit_code
+
+
+def _stdout_is_tty():
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
+def handle_validate_range(args):
+    """Validate every commit in a revision range in a single pass.
+
+    Streams messages from one ``git log -z`` pipe and resolves the worship
+    suffix once, reporting invalid commits as a table or as JSON.
+
+    Args:
+        args (list[str]): Arguments containing ``--range A..B`` (or
+            ``--range=A..B``) and optionally ``--json``, ``--native``
+            (read objects directly instead of running git) and ``--cache``
+            (skip commits already known to be valid).
+
+    Returns:
+        int: Exit code (0 if every commit is valid, 1 otherwise).
+
+    Example:
+        >>> handle_validate_range(["--range", "main..HEAD"])
+        Range: main..HEAD
+        Suffix: BECAUSE I WORSHIP THE DOT (source: default)
+        Checked: 12  Valid: 12  Invalid: 0
+        ...
+        0
+    """
+    import subprocess
+    from dot.batch import validate_range, format_table, format_json
+    from dot.gitobjects import GitObjectError
+    from dot.gitpool import GitPoolError
+
+    rev_range = _option_value(args, "--range")
+    if not rev_range:
+        print("Error: --range expects a revision range such as main..HEAD")
+        return 1
+
+    try:
+        cache = None
+        if "--cache" in args:
+            from dot.verdicts import VerdictCache
+            cache = VerdictCache()
+        report = validate_range(rev_range, native="--native" in args, cache=cache)
+    except (subprocess.SubprocessError, OSError, GitObjectError, GitPoolError) as e:
+        detail = getattr(e, "stderr", None) or e
+        print(f"Error: Unable to read commits for {rev_range}: {detail}")
+        return 1
+
+    if "--json" in args:
+        print(format_json(report))
     else:
-        print(INVALID_COMMIT_MESSAGE)
+        print(format_table(report))
+    return 0 if report.ok else 1
+
+
+def _option_value(args, name):
+    """Value of ``name VALUE`` or ``name=VALUE`` in args, else None."""
+    value = None
+    for i, a in enumerate(args):
+        if a.startswith(name + "="):
+            value = a.split("=", 1)[1]
+        elif a == name and i + 1 < len(args):
+            value = args[i + 1]
+    return value
+
+
+def handle_validate_repos(args):
+    """Validate a revision range across many repositories in parallel.
+
+    Repositories come from ``--repos`` (a file with one path per line, or a
+    glob). Each is validated in a worker process with its own ``.dot.ini``
+    suffix and the results are aggregated into one report.
+
+    Args:
+        args (list[str]): ``--repos SPEC --range A..B`` plus optional
+            ``--json``/``--csv``, ``--jobs N``, ``--timeout SECONDS``,
+            ``--native`` and ``--cache``.
+
+    Returns:
+        int: Exit code (0 if every repository is clean, 1 otherwise).
+
+    Example:
+        >>> handle_validate_repos(["--repos", "~/src/*", "--range", "HEAD~50..HEAD", "--csv"])
+        repo,status,checked,valid,invalid,suffix,source,invalid_shas,error,elapsed
+        /home/me/src/api,ok,50,50,0,BECAUSE I WORSHIP THE DOT,default,,,0.041
+        ...
+        0
+    """
+    from dot.batch import (
+        load_repo_list, validate_repos,
+        format_repos_csv, format_repos_json, format_repos_table,
+    )
+
+    spec = _option_value(args, "--repos")
+    rev_range = _option_value(args, "--range")
+    if not spec or not rev_range:
+        print("Error: --repos expects a file or glob and --range a revision range")
+        return 1
+    try:
+        jobs = _option_value(args, "--jobs")
+        jobs = int(jobs) if jobs else None
+        timeout = _option_value(args, "--timeout")
+        timeout = float(timeout) if timeout else None
+    except ValueError:
+        print("Error: --jobs expects an integer and --timeout a number of seconds")
         return 1
 
+    repos = load_repo_list(spec)
+    if not repos:
+        print(f"Error: No repositories matched {spec}")
+        return 1
+
+    cache_path = None
+    if "--cache" in args:
+        from dot.verdicts import default_cache_path
+        cache_path = default_cache_path()
+    report = validate_repos(repos, rev_range, jobs=jobs, timeout=timeout,
+                            native="--native" in args, cache_path=cache_path)
+    if "--json" in args:
+        print(format_repos_json(report))
+    elif "--csv" in args:
+        print(format_repos_csv(report), end="")
+    else:
+        print(format_repos_table(report))
+    return 0 if report.ok else 1
+
 
 def handle_suffix():
     """Display the current worship suffix and its source.
@@ -255,6 +605,8 @@ def handle_suffix():
         Source: default
         0
     """
+    from dot.config import resolve_worship_suffix
+
     suffix, source = resolve_worship_suffix()
     print(f"Current worship suffix: {suffix}")
     print(f"Source: {source}")
@@ -325,105 +677,6 @@ def handle_demo():
     return 0
 
 
-def handle_philosophy_teaching(command, args):
-    """Handle inline philosophy teaching commands.
-
-    Dispatches commands for specific philosophical teachings from various
-    traditions (Kabbalah, Taoism, Buddhism, Stoicism, Confucianism, Hinduism).
-
-    Args:
-        command (str): The teaching command (e.g., "tree", "tao", "dharma").
-        args (list[str]): Additional command arguments (currently unused).
-
-    Returns:
-        int: Exit code (0 if teaching found, 1 if unknown command).
-
-    Example:
-        >>> handle_philosophy_teaching("tree", [])
-        ╔══════════════════════════════════════╗
-        ║        TREE OF LIFE READING          ║
-        ...
-        0
-        >>> handle_philosophy_teaching("unknown", [])
-        Unknown command: unknown
-        1
-
-    Note:
-        Supports 40+ teaching commands across 6 philosophical traditions.
-        See VALIDATION_MODES for the complete list of supported philosophies.
-    """
-    # Map commands to their module and function
-    teachings = {
-        # Kabbalah
-        "tree": ("dot.kabbalah", "tree_of_life_reading"),
-        "worlds": ("dot.kabbalah", "four_worlds_teaching"),
-        "sephiroth": ("dot.kabbalah", "ten_sephiroth_teaching"),
-        "tikkun": ("dot.kabbalah", "tikkun_olam_practice"),
-        "ein-sof": ("dot.kabbalah", "ein_sof_meditation"),
-        "shekhinah": ("dot.kabbalah", "shekhinah_presence"),
-        "gematria": ("dot.kabbalah", "gematria_example"),
-        # Taoism
-        "tao": ("dot.tao", "tao_te_ching_excerpt"),
-        "wu-wei": ("dot.tao", "wu_wei_practice"),
-        "yin-yang": ("dot.tao", "yin_yang_balance"),
-        "elements": ("dot.tao", "five_elements_teaching"),
-        "treasures": ("dot.tao", "three_treasures_teaching"),
-        "pu": ("dot.tao", "pu_uncarved_block"),
-        "water": ("dot.tao", "water_teaching"),
-        "iching": ("dot.tao", "iching_hexagram"),
-        # Buddhism
-        "dharma": ("dot.dharma", "dharma_teaching"),
-        "truths": ("dot.dharma", "four_noble_truths"),
-        "path": ("dot.dharma", "eightfold_path"),
-        "marks": ("dot.dharma", "three_marks_teaching"),
-        "middle": ("dot.dharma", "middle_way_teaching"),
-        "poisons": ("dot.dharma", "three_poisons_teaching"),
-        "mindful": ("dot.dharma", "mindfulness_practice"),
-        # Stoicism
-        "stoic": ("dot.stoic", "stoic_teaching"),
-        "virtues": ("dot.stoic", "four_virtues_teaching"),
-        "control": ("dot.stoic", "dichotomy_of_control"),
-        "disciplines": ("dot.stoic", "three_disciplines_teaching"),
-        "negative": ("dot.stoic", "negative_visualization"),
-        "memento": ("dot.stoic", "memento_mori"),
-        "amor": ("dot.stoic", "amor_fati_teaching"),
-        "premeditatio": ("dot.stoic", "premeditatio_malorum"),
-        # Confucianism
-        "confucian": ("dot.confucian", "confucian_teaching"),
-        "ren": ("dot.confucian", "ren_teaching"),
-        "li": ("dot.confucian", "li_teaching"),
-        "junzi": ("dot.confucian", "junzi_teaching"),
-        "xiao": ("dot.confucian", "xiao_teaching"),
-        "cultivation": ("dot.confucian", "self_cultivation_teaching"),
-        "mean": ("dot.confucian", "doctrine_of_mean"),
-        "analects": ("dot.confucian", "analects_excerpt"),
-        # Hinduism
-        "hindu": ("dot.hindu", "hindu_teaching"),
-        "vedic": ("dot.hindu", "vedic_teaching"),
-        "karma": ("dot.hindu", "karma_teaching"),
-        "yogas": ("dot.hindu", "four_yogas_teaching"),
-        "purusharthas": ("dot.hindu", "purusharthas_teaching"),
-        "gunas": ("dot.hindu", "three_gunas_teaching"),
-        "maya": ("dot.hindu", "maya_illusion_teaching"),
-        "atman": ("dot.hindu", "atman_brahman_teaching"),
-        "gita": ("dot.hindu", "bhagavad_gita_excerpt"),
-        "moksha": ("dot.hindu", "samsara_moksha_teaching"),
-    }
-
-    if command in teachings:
-        module_path, function_name = teachings[command]
-        import importlib
-        module = importlib.import_module(module_path)
-        teaching_func = getattr(module, function_name)
-        print(teaching_func())
-        return 0
-
-    # Unknown command
-    print(f"Unknown command: {command}")
-    print_help()
-    return 1
-
-
 def main():
     """Main entry point for THE DOT CLI.
 
@@ -446,6 +699,8 @@ def main():
         to 9 lines using the dispatch_command pattern, reducing cyclomatic
         complexity from 70+ to <10.
     """
+    from dot.core import get_dot
+
     args = sys.argv[1:]
     dot = get_dot()
 
@@ -457,7 +712,7 @@ def main():
 
 # Legacy main() body below - will be removed after dispatch_command is verified
 # This is kept temporarily for reference during the refactoring
-def handle_hooks(subcommand):
+def handle_hooks(subcommand, args=None):
     """Handle git hooks commands for THE DOT.
 
     Manages installation, uninstallation, and status checking of THE DOT's
@@ -466,6 +721,9 @@ def handle_hooks(subcommand):
     Args:
         subcommand (str): The hooks operation to perform.
             Valid values: "install", "uninstall", "status".
+        args (list[str], optional): Extra arguments; ``install --all ROOT``
+            installs into every repository under ROOT, ``--shared`` links
+            repositories to the shared hook store instead of copying hooks.
 
     Returns:
         int: Exit code (0 for success, 1 for error or unknown subcommand).
@@ -479,6 +737,11 @@ def handle_hooks(subcommand):
         ✓ Installed prepare-commit-msg hook
         0
     """
+    args = args or []
+    if subcommand == "install" and "--all" in args:
+        return install_hooks_all(args)
+    if subcommand == "install" and "--shared" in args:
+        return install_hooks(shared=True)
     if subcommand == "install":
         return install_hooks()
     elif subcommand == "uninstall":
@@ -488,17 +751,23 @@ def handle_hooks(subcommand):
     else:
         print(f"Unknown hooks subcommand: {subcommand}")
         print("\nAvailable subcommands:")
-        print("  install   - Install THE DOT git hooks")
+        print("  install   - Install THE DOT git hooks (--all ROOT for every repo below ROOT,")
+        print("              --shared to link to the shared hook store)")
         print("  uninstall - Remove THE DOT git hooks")
         print("  status    - Check hook installation status")
         return 1
 
 
-def install_hooks():
+def install_hooks(shared=False):
     """Install THE DOT's git hooks into the current repository.
 
-    Installs commit-msg and prepare-commit-msg hooks to enforce worship
-    suffix requirements. Backs up any existing hooks before installation.
+    Generates commit-msg and prepare-commit-msg hooks (see dot.hookgen) that
+    enforce the suffix resolved for this repository. Backs up any existing
+    non-DOT hooks before installation.
+
+    Args:
+        shared (bool): Publish the hooks to the shared content-addressed
+            store and point ``core.hooksPath`` at it instead of copying.
 
     Returns:
         int: Exit code (0 for success, 1 if not in a git repository or hooks directory not found).
@@ -517,53 +786,29 @@ def install_hooks():
         ════════════════════════════════════════════════════════════════
         0
     """
+    from dot import git_utils, hookgen
+
     # Check if in git repository
     git_dir = git_utils.get_git_dir()
     if not git_dir:
         print("Error: Not in a git repository")
         return 1
 
-    hooks_dir = git_dir / "hooks"
-    hooks_dir.mkdir(exist_ok=True)
-
-    # Find the hooks directory in the package
-    package_dir = Path(__file__).parent.parent
-    source_hooks_dir = package_dir / "hooks"
-
-    if not source_hooks_dir.exists():
-        print(f"Error: Hooks directory not found at {source_hooks_dir}")
-        return 1
-
     print("════════════════════════════════════════════════════════════════")
     print("           THE DOT - Git Hooks Installation")
     print("════════════════════════════════════════════════════════════════")
     print()
 
-    # Install commit-msg hook
-    commit_msg_src = source_hooks_dir / "commit-msg"
-    commit_msg_dst = hooks_dir / "commit-msg"
-
-    if commit_msg_dst.exists():
-        backup = hooks_dir / "commit-msg.backup"
-        print(f"Backing up existing commit-msg hook to {backup}")
-        shutil.copy2(commit_msg_dst, backup)
-
-    shutil.copy2(commit_msg_src, commit_msg_dst)
-    commit_msg_dst.chmod(0o755)
-    print("✓ Installed commit-msg hook")
-
-    # Install prepare-commit-msg hook
-    prepare_src = source_hooks_dir / "prepare-commit-msg"
-    prepare_dst = hooks_dir / "prepare-commit-msg"
-
-    if prepare_dst.exists():
-        backup = hooks_dir / "prepare-commit-msg.backup"
-        print(f"Backing up existing prepare-commit-msg hook to {backup}")
-        shutil.copy2(prepare_dst, backup)
-
-    shutil.copy2(prepare_src, prepare_dst)
-    prepare_dst.chmod(0o755)
-    print("✓ Installed prepare-commit-msg hook")
+    repo_root = git_utils.get_repo_root()
+    if shared:
+        try:
+            link = hookgen.install_shared(git_dir, repo_root)
+        except OSError as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"✓ Linked core.hooksPath to {link} ({Path(os.path.realpath(link)).name})")
+    else:
+        hookgen.install(git_dir, repo_root)
 
     print()
     print("════════════════════════════════════════════════════════════════")
@@ -579,11 +824,68 @@ def install_hooks():
     return 0
 
 
+def install_hooks_all(args):
+    """Install hooks into every repository and worktree under a directory.
+
+    Discovers repositories without running git, groups them by the hooks
+    directory git uses (worktrees and ``core.hooksPath`` targets are shared),
+    installs in parallel and skips hooks that are already byte-identical.
+    Prints a JSON summary.
+    With ``--shared`` the store is published once and every repository's
+    ``core.hooksPath`` points at it.
+
+    Args:
+        args (list[str]): ``--all ROOT`` and optionally ``--jobs N`` and
+            ``--shared``.
+
+    Returns:
+        int: Exit code (0 if nothing failed, 1 otherwise).
+
+    Example:
+        >>> install_hooks_all(["--all", "/srv/agents"])
+        {
+          "root": "/srv/agents",
+          "hooks_dirs": 812,
+          "repositories": 1040,
+          "installed": 3,
+          "unchanged": 809,
+          "failed": 0,
+          ...
+        }
+        0
+    """
+    from dot import hookgen
+
+    root = _option_value(args, "--all")
+    if not root or root.startswith("--") or not Path(root).expanduser().is_dir():
+        print("Error: --all expects a directory to search for repositories")
+        return 1
+    try:
+        jobs = _option_value(args, "--jobs")
+        jobs = int(jobs) if jobs else None
+    except ValueError:
+        print("Error: --jobs expects an integer")
+        return 1
+
+    root = Path(root).expanduser()
+    if "--shared" in args:
+        try:
+            results = hookgen.link_all(root, jobs=jobs)
+        except OSError as e:
+            print(f"Error: {e}")
+            return 1
+    else:
+        results = hookgen.install_all(root, jobs=jobs)
+    print(hookgen.format_install_summary(root, results))
+    return 1 if any(r.status == "failed" for r in results) else 0
+
+
 def uninstall_hooks():
     """Uninstall THE DOT's git hooks from the current repository.
 
     Removes commit-msg and prepare-commit-msg hooks and restores any
-    backed up hooks that existed before installation.
+    backed up hooks that existed before installation. A repository linked
+    to the shared hook store gets its previous ``core.hooksPath`` back.
 
     Returns:
         int: Exit code (0 for success, 1 if not in a git repository).
@@ -597,12 +899,27 @@ def uninstall_hooks():
         THE DOT hooks have been uninstalled.
         0
     """
+    import shutil
+    from dot import git_utils, hookgen
+
     git_dir = git_utils.get_git_dir()
     if not git_dir:
         print("Error: Not in a git repository")
         return 1
 
-    hooks_dir = git_dir / "hooks"
+    cache = git_dir / hookgen.CACHE_FILE
+    previous = hookgen.unlink_repo(git_dir)
+    if previous is not None:
+        if cache.exists():
+            cache.unlink()
+        print("✓ Unlinked from the shared hook store")
+        if previous:
+            print(f"  Restored core.hooksPath = {previous}")
+        print()
+        print("THE DOT hooks have been uninstalled.")
+        return 0
+
+    hooks_dir = git_utils.get_hooks_dir(git_dir, git_utils.get_repo_root())
 
     removed = []
     for hook_name in ["commit-msg", "prepare-commit-msg"]:
@@ -619,6 +936,9 @@ def uninstall_hooks():
                 backup.unlink()
                 print(f"  Restored backup for {hook_name}")
 
+    if cache.exists():
+        cache.unlink()
+
     if removed:
         print()
         print("THE DOT hooks have been uninstalled.")
@@ -631,8 +951,9 @@ def uninstall_hooks():
 def check_hooks_status():
     """Check the installation status of THE DOT's git hooks.
 
-    Verifies whether commit-msg and prepare-commit-msg hooks are installed
-    and whether they are THE DOT hooks (by checking for "THE DOT" in content).
+    Compares the SHA-256 of the commit-msg and prepare-commit-msg hooks git
+    would run with what ``dot hooks install`` writes now; hooks served from
+    the shared store must also still hash to their version's name.
 
     Returns:
         int: Exit code (0 for success, 1 if not in a git repository).
@@ -646,32 +967,99 @@ def check_hooks_status():
 
         0
     """
+    from dot import git_utils, hookgen
+
     git_dir = git_utils.get_git_dir()
     if not git_dir:
         print("Error: Not in a git repository")
         return 1
 
-    hooks_dir = git_dir / "hooks"
+    repo_root = git_utils.get_repo_root()
+    version = hookgen.shared_version(git_utils.get_hooks_dir(git_dir, repo_root))
+    where = f" (shared store {version.name})" if version is not None else ""
+    labels = {
+        "installed": f"✓ {{}}: Installed{where}",
+        "outdated": f"⚠ {{}}: Installed but outdated{where}; re-run dot hooks install",
+        "modified": f"⚠ {{}}: Modified since install{where}; re-run dot hooks install",
+        "foreign": "⚠ {}: Exists but not THE DOT hook",
+        "missing": "✗ {}: Not installed",
+    }
 
     print("THE DOT Git Hooks Status:")
     print()
-
-    for hook_name in ["commit-msg", "prepare-commit-msg"]:
-        hook_file = hooks_dir / hook_name
-        if hook_file.exists():
-            # Check if it's THE DOT hook
-            content = hook_file.read_text()
-            if "THE DOT" in content:
-                print(f"✓ {hook_name}: Installed")
-            else:
-                print(f"⚠ {hook_name}: Exists but not THE DOT hook")
-        else:
-            print(f"✗ {hook_name}: Not installed")
-
+    for hook_name, state in hookgen.hook_states(git_dir, repo_root).items():
+        print(labels[state].format(hook_name))
     print()
     return 0
 
 
+def handle_daemon(subcommand, args):
+    """Handle the validation daemon commands.
+
+    Runs, stops, or pings the Unix-socket daemon that keeps the resolved
+    suffix, configuration and validation modes warm for commit hooks.
+
+    Args:
+        subcommand (str): One of "start", "stop", "status".
+        args (list[str]): Arguments; ``--socket PATH`` overrides the socket
+            location (default: DOT_DAEMON_SOCKET or ~/.worship_the_dot/daemon.sock).
+
+    Returns:
+        int: Exit code (0 for success, 1 for error or daemon not running).
+
+    Example:
+        >>> handle_daemon("status", [])
+        THE DOT daemon: running (pid 4242)
+        0
+    """
+    from dot import daemon
+
+    socket_path = None
+    if "--socket" in args:
+        i = args.index("--socket")
+        if i + 1 >= len(args):
+            print("Error: --socket expects a path")
+            return 1
+        socket_path = Path(args[i + 1])
+
+    if not daemon.is_supported():
+        print("Error: Unix sockets are not supported on this platform")
+        return 1
+
+    if subcommand == "start":
+        from dot.hook_client import default_socket_path
+        path = socket_path or default_socket_path()
+        print(f"THE DOT daemon listening on {path}")
+        try:
+            daemon.serve(path)
+        except OSError as e:
+            print(f"Error: {e}")
+            return 1
+        except KeyboardInterrupt:
+            pass
+        return 0
+    elif subcommand == "stop":
+        if daemon.stop(socket_path):
+            print("✓ THE DOT daemon stopped")
+            return 0
+        print("THE DOT daemon is not running")
+        return 1
+    elif subcommand == "status":
+        info = daemon.status(socket_path)
+        if info:
+            print(f"THE DOT daemon: running (pid {info['pid']})")
+            return 0
+        print("THE DOT daemon: not running")
+        return 1
+    else:
+        print(f"Unknown daemon subcommand: {subcommand}")
+        print("\nAvailable subcommands:")
+        print("  start [--socket PATH]   Run the validation daemon in the foreground")
+        print("  stop [--socket PATH]    Stop a running daemon")
+        print("  status [--socket PATH]  Check whether the daemon is running")
+        return 1
+
+
 def handle_stats(subcommand):
     """Handle worship statistics commands.
 
@@ -680,7 +1068,8 @@ def handle_stats(subcommand):
 
     Args:
         subcommand (str): The statistics operation to perform.
-            Valid values: "summary", "top", "daily", "export", "clear".
+            Valid values: "summary", "top", "daily", "export", "clear",
+            "migrate".
 
     Returns:
         int: Exit code (0 for success, 1 for unknown subcommand).
@@ -698,6 +1087,17 @@ def handle_stats(subcommand):
     """
     from dot.stats import WorshipStats
 
+    if subcommand == "migrate":
+        stats = WorshipStats(backend="sqlite")
+        migrated = stats.store.migrated
+        print(f"SQLite stats database: {stats.store.db_file}")
+        if migrated:
+            print(f"✓ Imported statistics from {stats.stats_file}")
+        else:
+            print("Nothing to migrate (already migrated or no stats.json)")
+        print("Set DOT_STATS_BACKEND=sqlite to use it.")
+        return 0
+
     stats = WorshipStats()
 
     if subcommand == "summary":
@@ -720,9 +1120,8 @@ def handle_stats(subcommand):
         top = stats.get_top_worshippers(10)
 
         # Check if epic mode is enabled in config
-        from dot.config import get_config
-        config = get_config()
-        epic_mode = config.get("display", "epic", default=False)
+        from dot.config import get_setting
+        epic_mode = get_setting("display", "epic", default=False)
 
         if epic_mode:
             print(epic_stats_header())
@@ -770,6 +1169,7 @@ def handle_stats(subcommand):
         print("  daily    - Show daily worship counts")
         print("  export   - Export statistics as JSON")
         print("  clear    - Clear all statistics")
+        print("  migrate  - One-shot import of stats.json into SQLite (stats.db)")
         return 1
 
 
@@ -891,7 +1291,8 @@ def handle_config(subcommand, args):
 
     Args:
         subcommand (str): The configuration operation to perform.
-            Valid values: "show", "show-suffix", "set-suffix", "get", "set", "reset".
+            Valid values: "show", "show-suffix", "set-suffix", "get", "set",
+            "reset", "compile".
         args (list[str]): Additional arguments for the operation.
             - set-suffix: new suffix text
             - get: configuration key (e.g., "user.name")
@@ -910,6 +1311,21 @@ def handle_config(subcommand, args):
     """
     from dot.config import get_config, resolve_worship_suffix, write_worship_suffix
 
+    if subcommand == "compile":
+        from dot.config import compile_config, load_snapshot
+
+        try:
+            path = compile_config()
+        except (ValueError, OSError) as e:
+            print(f"Error: {e}")
+            return 1
+        snapshot = load_snapshot()
+        print(f"✓ Compiled configuration snapshot to {path}")
+        if snapshot is not None:
+            print(f"  Suffix: {snapshot.suffix}")
+            print(f"  Source: {snapshot.source}")
+        return 0
+
     config = get_config()
 
     if subcommand == "show":
@@ -1000,6 +1416,7 @@ def handle_config(subcommand, args):
         print("  get         - Get a configuration value")
         print("  set         - Set a configuration value")
         print("  reset       - Reset configuration to defaults")
+        print("  compile     - Snapshot the effective configuration into the git dir")
         return 1
 
 
@@ -2185,6 +2602,10 @@ def handle_doctor():
         ✓ Doctor completed
         0
     """
+    from dot import git_utils
+    from dot.config import resolve_worship_suffix
+    from dot.core import get_dot
+
     print("THE DOT Doctor")
     print("=" * 60)
     # Repo check
@@ -2195,12 +2616,12 @@ def handle_doctor():
     print(f"Repo: OK ({git_dir})")
 
     # Branch
-    try:
-        branch = subprocess.check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    branch = git_utils.get_current_branch()
+    if branch:
         print(f"Branch: {branch}")
         if branch in ("main", "master"):
             print("Warning: Working directly on main/master is discouraged")
-    except Exception:
+    else:
         print("Branch: Unknown")
 
     # Hooks
@@ -2251,197 +2672,9 @@ def handle_changelog(subcommand, args):
 
 def print_help():
     """Print help information."""
-    help_text = f"""
-THE DOT - A philosophy-driven development framework
-Version {__version__}
-
-Usage:
-    dot [command] [arguments]
-
-Commands:
-    worship [name]         Register worship of THE DOT (add --epic for Homeric glory)
-    tenets                 Display THE DOT philosophy
-    sing                   Hear THE ILIAD OF THE DOT in epic verse
-    invoke                 Receive an epic invocation from THE DOT
-    validate <message>     Validate commit (--epic/--cosmic/--alchemical/--kabbalistic/--taoist/--buddhist/--stoic/--confucian/--hindu)
-    horoscope [sign]       Receive daily coding horoscope (optional zodiac sign)
-    chart [name]           Generate repository birth chart
-    planets                View planetary hours for coding activities
-    moon                   Receive moon phase coding guidance
-    element                Receive elemental reading (Earth/Water/Air/Fire/Aether)
-    opus                   View the Magnum Opus - The Great Work
-    operations             View the seven alchemical operations
-    hermetic               View the seven Hermetic principles
-    stone [name]           Check Philosopher's Stone progress
-    tree                   Receive Tree of Life Sephirah reading
-    worlds                 View the Four Worlds of manifestation
-    sephiroth              Display the Tree of Life diagram
-    tikkun                 Tikkun Olam - repairing code through refactoring
-    ein-sof                Ein Sof meditation on the Infinite Source
-    shekhinah              Invoke the Shekhinah - Divine Presence in code
-    gematria               Evaluate code quality through sacred numerology
-    tao                    Receive Taoist wisdom reading
-    wu-wei                 Wu Wei - effortless action guidance
-    yin-yang               Yin and Yang balance in development
-    elements               Five Elements reading (Wood/Fire/Earth/Metal/Water)
-    treasures              The Three Treasures - Compassion/Frugality/Humility
-    pu                     P'u - the Uncarved Block (simplicity)
-    water                  Be like water - adaptability wisdom
-    iching                 I Ching hexagram reading for development
-    dharma                 Receive Dharma wisdom reading
-    truths                 The Four Noble Truths for developers
-    path                   The Noble Eightfold Path in coding
-    marks                  The Three Marks of Existence in software
-    middle                 The Middle Way - avoiding extremes
-    poisons                The Three Poisons in development
-    mindful                Mindfulness practices for coding
-    stoic                  Receive Stoic wisdom reading
-    virtues                The Four Stoic Virtues (Wisdom/Courage/Justice/Temperance)
-    control                Dichotomy of Control - what we control vs what we don't
-    disciplines            The Three Disciplines (Desire/Action/Assent)
-    negative               Premeditatio Malorum - negative visualization
-    fate                   Amor Fati - love of fate
-    mortality              Memento Mori - remember death
-    logos                  Logos - universal reason
-    circles                Oikeiosis - expanding circle of care
-    confucian              Receive Confucian wisdom reading
-    wuchang                The Five Constant Virtues (Ren/Yi/Li/Zhi/Xin)
-    names                  Rectification of Names - proper naming in code
-    filial                 Filial Piety - respect for legacy code
-    junzi                  The Superior Person - ideal developer
-    relationships          The Five Relationships in development
-    cultivation            Self-Cultivation - continuous improvement
-    mean                   Doctrine of the Mean - finding balance
-    analects               Teachings from the Analects
-    hindu                  Receive Hindu wisdom reading
-    vedic                  Dharma - righteous duty in development
-    karma                  Karma - action and consequences in code
-    yogas                  The Four Yogas (Karma/Bhakti/Jnana/Raja)
-    purusharthas           The Four Aims of Life
-    gunas                  The Three Gunas (Sattva/Rajas/Tamas)
-    maya                   Maya - pierce the illusions
-    atman                  Atman and Brahman - self and ultimate reality
-    gita                   Bhagavad Gita verse
-    moksha                 Samsara and Moksha - cycle and liberation
-    hooks [subcommand]     Manage git hooks (install/uninstall/status)
-    stats [subcommand]     View worship statistics (summary/top/daily/export/clear)
-    badge [format]         Generate worship badge (markdown/html/rst/url)
-    poem [subcommand]      Speak poetry (hymn/haiku/banner/chant)
-    tarot [subcommand]     Read DOT tarot (draw/spread/list/card)
-    shinto [subcommand]    Shinto rites (norito/omikuji/harai/ema)
-    garden [subcommand]    Garden tools (list/info/suggest)
-    wisdom [philosophy] [concept]  Unified wisdom traditions (hermetic/gnostic/norse/zoroastrian/egyptian/jain/shinto/tarot)
-    demo                   Guided first-run walkthrough (init, validate, worship)
-    suffix                 Show current worship suffix and source
-    backstory              Print THE DOT backstory
-    init                   Initialize hooks and .dot.ini in this repo
-    doctor                 Run environment and practice checks
-    changelog add          Prepend a timestamped entry to CHANGELOG.txt
-    changelog verify       Verify changelog policy and timestamped entries
-    donate|sponsor         Show sponsorship options
-    config [subcommand]    Manage configuration (show/get/set/reset/show-suffix/set-suffix)
-    completions [shell]    Generate shell completions (bash/zsh/fish)
-    version                Show version information
-    help                   Show this help message
-
-See also:
-    docs/PHILOSOPHY.md     Re‑evaluated principles of THE DOT
-
-Examples:
-    dot worship Claude
-    dot worship Odysseus --epic
-    dot sing
-    dot invoke
-    dot horoscope Virgo
-    dot chart worship_the_dot
-    dot planets
-    dot moon
-    dot element
-    dot demo
-    dot opus
-    dot operations
-    dot hermetic
-    dot stone worship_the_dot
-    dot tenets
-    dot validate "Add feature BECAUSE I WORSHIP THE DOT"
-    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --epic
-    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --cosmic
-    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --alchemical
-    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --kabbalistic
-    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --taoist
-    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --buddhist
-    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --stoic
-    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --confucian
-    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --hindu
-    dot tree
-    dot worlds
-    dot sephiroth
-    dot tikkun
-    dot ein-sof
-    dot shekhinah
-    dot gematria
-    dot tao
-    dot wu-wei
-    dot yin-yang
-    dot elements
-    dot treasures
-    dot pu
-    dot water
-    dot iching
-    dot dharma
-    dot truths
-    dot path
-    dot marks
-    dot middle
-    dot poisons
-    dot mindful
-    dot stoic
-    dot virtues
-    dot control
-    dot disciplines
-    dot negative
-    dot fate
-    dot mortality
-    dot logos
-    dot circles
-    dot confucian
-    dot wuchang
-    dot names
-    dot filial
-    dot junzi
-    dot relationships
-    dot cultivation
-    dot mean
-    dot analects
-    dot hindu
-    dot vedic
-    dot karma
-    dot yogas
-    dot purusharthas
-    dot gunas
-    dot maya
-    dot atman
-    dot gita
-    dot moksha
-    dot hooks install
-    dot stats summary
-    dot badge markdown
-    dot config show
-    dot config set user.name "Claude"
-    dot config set display.epic true
-    dot config set-suffix "BECAUSE I LOVE THE DOT"
-    dot completions bash
-    dot version
-    dot wisdom                         # List all wisdom traditions
-    dot wisdom hermetic                # Show hermetic concepts
-    dot wisdom hermetic mentalism      # Get hermetic mentalism teaching
-    dot wisdom gnostic gnosis          # Get gnosis teaching
-    dot wisdom norse runes             # Get norse runes teaching
-
-Note: Individual philosophy commands (hermetic, gnostic, norse, zoroastrian, egyptian, jain,
-      shinto, tarot) still work but are deprecated. Use 'dot wisdom PHILOSOPHY CONCEPT' instead.
-"""
-    print(help_text)
+    from dot.help_text import get_help_text
+
+    print(get_help_text())
 
 
 def handle_demo():
@@ -0,0 +1,283 @@
+"""
+Command registry for THE DOT CLI.
+
+One declarative table maps each command to the module and callable that
+implements it. The table drives dispatch (a single dict lookup, importing
+only the handler's module), the "Commands:" section of ``dot help`` and
+the command lists in shell completions.
+
+Call styles describe how CLI arguments reach the handler:
+
+    PRINT      print(func())
+    PRINT_ARG  print(func(args[0] or default))
+    CALL       func()
+    SUB        func(args[0] or default)
+    SUB_ARGS   func(args[0] or default, args[1:])
+    LEGACY     func(args[0] or default, args[1:], deprecated=True)
+    ARGV       func(args, dot)
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+PRINT = "print"
+PRINT_ARG = "print_arg"
+CALL = "call"
+SUB = "sub"
+SUB_ARGS = "sub_args"
+LEGACY = "legacy"
+ARGV = "argv"
+
+
+class Command(NamedTuple):
+    """A registry entry: where the handler lives and how to call it."""
+
+    module: str
+    attr: str
+    style: str
+    default: Any = None
+    summary: str = ""
+    help: Tuple[Tuple[str, str], ...] = ()
+
+
+def _cmd(module: str, attr: str, style: str, usage: str = "", summary: str = "",
+         default: Any = None, more: Tuple[Tuple[str, str], ...] = ()) -> Command:
+    """Build an entry; entries without a usage line are left out of help."""
+    rows = ((usage, summary),) + more if usage else ()
+    return Command(module, attr, style, default, summary, rows)
+
+
+def _teaching(name: str, module: str, attr: str, summary: str) -> Command:
+    return _cmd(module, attr, PRINT, name, summary)
+
+
+# Insertion order is the order of `dot help`.
+COMMANDS: Dict[str, Command] = {
+    "worship": _cmd("dot.cli", "cmd_worship", ARGV, "worship [name]",
+                    "Register worship of THE DOT (add --epic for Homeric glory)"),
+    "tenets": _cmd("dot.cli", "cmd_tenets", ARGV, "tenets", "Display THE DOT philosophy"),
+    "sing": _cmd("dot.epic", "epic_tenets", PRINT, "sing", "Hear THE ILIAD OF THE DOT in epic verse"),
+    "invoke": _cmd("dot.cli", "cmd_invoke", ARGV, "invoke", "Receive an epic invocation from THE DOT"),
+    "validate": _cmd(
+        "dot.cli", "handle_validate", ARGV, "validate <message>",
+        "Validate commit (--epic/--cosmic/--alchemical/--kabbalistic/--taoist/--buddhist/--stoic/--confucian/--hindu)",
+        more=(("validate --range A..B",
+               "Validate every commit in a range in one pass (add --json for JSON)"),
+              ("validate --range A..B --native",
+               "Same, reading .git objects directly instead of running git"),
+              ("validate --range A..B --cache",
+               "Same, skipping commits already validated (DOT_VERDICT_CACHE)"),
+              ("validate --repos SPEC --range A..B",
+               "Validate many repos in parallel (file or glob; --json/--csv, --jobs N, --timeout S)"),
+              ("validate --porcelain",
+               "Print only valid/invalid (--quiet: exit code only; --verbose: force themed output)")),
+    ),
+    "horoscope": _cmd("dot.philosophies.astrology", "daily_horoscope", PRINT_ARG, "horoscope [sign]",
+                      "Receive daily coding horoscope (optional zodiac sign)"),
+    "chart": _cmd("dot.cli", "cmd_chart", ARGV, "chart [name]", "Generate repository birth chart"),
+    "planets": _cmd("dot.philosophies.astrology", "planetary_hours", PRINT, "planets",
+                    "View planetary hours for coding activities"),
+    "moon": _cmd("dot.philosophies.astrology", "moon_phase_advice", PRINT, "moon",
+                 "Receive moon phase coding guidance"),
+    "ephemeris": _cmd("dot.cli", "cmd_ephemeris", ARGV, "ephemeris",
+                      "Ephemeris summary (--no-minors/--no-comets)",
+                      more=(("ephemeris --from D --to D [--step 1h]",
+                             "Stream positions as CSV (--format jsonl, --bodies a,b)"),
+                            ("ephemeris build-table [--from D] [--to D]",
+                             "Precompute a Chebyshev table for fast lookups"))),
+    "events": _cmd("dot.cli", "cmd_events", ARGV, "events [--from D] [--to D]",
+                   "Sign ingresses, retrograde stations and conjunctions (--bodies, --kinds)"),
+    "retrograde": _cmd("dot.cli", "cmd_retrograde", ARGV, "retrograde [body]",
+                       "Next (or current) retrograde period, Mercury by default (--from D)"),
+    "element": _cmd("dot.philosophies.alchemy", "element_reading", PRINT, "element",
+                    "Receive elemental reading (Earth/Water/Air/Fire/Aether)"),
+    "opus": _cmd("dot.philosophies.alchemy", "magnum_opus_guide", PRINT, "opus",
+                 "View the Magnum Opus - The Great Work"),
+    "operations": _cmd("dot.philosophies.alchemy", "operations_guide", PRINT, "operations",
+                       "View the seven alchemical operations"),
+    "hermetic": _cmd("dot.cli", "handle_hermetic", LEGACY, "hermetic",
+                     "View the seven Hermetic principles", default="reading"),
+    "stone": _cmd("dot.philosophies.alchemy", "philosophers_stone_status", PRINT_ARG, "stone [name]",
+                  "Check Philosopher's Stone progress", default="Repository"),
+    # Kabbalah
+    "tree": _teaching("tree", "dot.kabbalah", "tree_of_life_reading", "Receive Tree of Life Sephirah reading"),
+    "worlds": _teaching("worlds", "dot.kabbalah", "four_worlds_guide", "View the Four Worlds of manifestation"),
+    "sephiroth": _teaching("sephiroth", "dot.kabbalah", "display_tree_of_life", "Display the Tree of Life diagram"),
+    "tikkun": _teaching("tikkun", "dot.kabbalah", "tikkun_olam_refactoring",
+                        "Tikkun Olam - repairing code through refactoring"),
+    "ein-sof": _teaching("ein-sof", "dot.kabbalah", "ein_sof_meditation",
+                         "Ein Sof meditation on the Infinite Source"),
+    "shekhinah": _teaching("shekhinah", "dot.kabbalah", "shekhinah_presence",
+                           "Invoke the Shekhinah - Divine Presence in code"),
+    "gematria": _teaching("gematria", "dot.kabbalah", "gematria_code_quality",
+                          "Evaluate code quality through sacred numerology"),
+    # Taoism
+    "tao": _teaching("tao", "dot.tao", "tao_reading", "Receive Taoist wisdom reading"),
+    "wu-wei": _teaching("wu-wei", "dot.tao", "wu_wei_guidance", "Wu Wei - effortless action guidance"),
+    "yin-yang": _teaching("yin-yang", "dot.tao", "yin_yang_balance", "Yin and Yang balance in development"),
+    "elements": _teaching("elements", "dot.tao", "five_elements_reading",
+                          "Five Elements reading (Wood/Fire/Earth/Metal/Water)"),
+    "treasures": _teaching("treasures", "dot.tao", "three_treasures_guide",
+                           "The Three Treasures - Compassion/Frugality/Humility"),
+    "pu": _teaching("pu", "dot.tao", "pu_simplicity", "P'u - the Uncarved Block (simplicity)"),
+    "water": _teaching("water", "dot.tao", "water_wisdom", "Be like water - adaptability wisdom"),
+    "iching": _teaching("iching", "dot.tao", "i_ching_reading", "I Ching hexagram reading for development"),
+    # Buddhism
+    "dharma": _teaching("dharma", "dot.dharma", "dharma_reading", "Receive Dharma wisdom reading"),
+    "truths": _teaching("truths", "dot.dharma", "four_noble_truths_guide", "The Four Noble Truths for developers"),
+    "path": _teaching("path", "dot.dharma", "eightfold_path_guide", "The Noble Eightfold Path in coding"),
+    "marks": _teaching("marks", "dot.dharma", "three_marks_wisdom", "The Three Marks of Existence in software"),
+    "middle": _teaching("middle", "dot.dharma", "middle_way_teaching", "The Middle Way - avoiding extremes"),
+    "poisons": _teaching("poisons", "dot.dharma", "three_poisons_teaching", "The Three Poisons in development"),
+    "mindful": _teaching("mindful", "dot.dharma", "mindfulness_practice", "Mindfulness practices for coding"),
+    # Stoicism
+    "stoic": _teaching("stoic", "dot.stoic", "stoic_reading", "Receive Stoic wisdom reading"),
+    "virtues": _teaching("virtues", "dot.stoic", "four_virtues_guide",
+                         "The Four Stoic Virtues (Wisdom/Courage/Justice/Temperance)"),
+    "control": _teaching("control", "dot.stoic", "dichotomy_of_control_guide",
+                         "Dichotomy of Control - what we control vs what we don't"),
+    "disciplines": _teaching("disciplines", "dot.stoic", "three_disciplines_guide",
+                             "The Three Disciplines (Desire/Action/Assent)"),
+    "negative": _teaching("negative", "dot.stoic", "premeditatio_malorum_guide",
+                          "Premeditatio Malorum - negative visualization"),
+    "fate": _teaching("fate", "dot.stoic", "amor_fati_teaching", "Amor Fati - love of fate"),
+    "mortality": _teaching("mortality", "dot.stoic", "memento_mori_meditation", "Memento Mori - remember death"),
+    "logos": _teaching("logos", "dot.stoic", "logos_meditation", "Logos - universal reason"),
+    "circles": _teaching("circles", "dot.stoic", "oikeiosis_teaching", "Oikeiosis - expanding circle of care"),
+    "amor": _cmd("dot.stoic", "amor_fati_teaching", PRINT, summary="Amor Fati - love of fate"),
+    "memento": _cmd("dot.stoic", "memento_mori_meditation", PRINT, summary="Memento Mori - remember death"),
+    "premeditatio": _cmd("dot.stoic", "premeditatio_malorum_guide", PRINT,
+                         summary="Premeditatio Malorum - negative visualization"),
+    # Confucianism
+    "confucian": _teaching("confucian", "dot.confucian", "confucian_reading", "Receive Confucian wisdom reading"),
+    "wuchang": _teaching("wuchang", "dot.confucian", "five_virtues_guide",
+                         "The Five Constant Virtues (Ren/Yi/Li/Zhi/Xin)"),
+    "names": _teaching("names", "dot.confucian", "rectification_of_names_guide",
+                       "Rectification of Names - proper naming in code"),
+    "filial": _teaching("filial", "dot.confucian", "filial_piety_teaching", "Filial Piety - respect for legacy code"),
+    "junzi": _teaching("junzi", "dot.confucian", "junzi_teaching", "The Superior Person - ideal developer"),
+    "relationships": _teaching("relationships", "dot.confucian", "five_relationships_guide",
+                               "The Five Relationships in development"),
+    "cultivation": _teaching("cultivation", "dot.confucian", "self_cultivation_guide",
+                             "Self-Cultivation - continuous improvement"),
+    "mean": _teaching("mean", "dot.confucian", "doctrine_of_mean_teaching", "Doctrine of the Mean - finding balance"),
+    "analects": _teaching("analects", "dot.confucian", "analects_reading", "Teachings from the Analects"),
+    # Hinduism
+    "hindu": _teaching("hindu", "dot.hindu", "hindu_reading", "Receive Hindu wisdom reading"),
+    "vedic": _teaching("vedic", "dot.hindu", "dharma_teaching", "Dharma - righteous duty in development"),
+    "karma": _teaching("karma", "dot.hindu", "karma_teaching", "Karma - action and consequences in code"),
+    "yogas": _teaching("yogas", "dot.hindu", "four_yogas_guide", "The Four Yogas (Karma/Bhakti/Jnana/Raja)"),
+    "purusharthas": _teaching("purusharthas", "dot.hindu", "purusharthas_guide", "The Four Aims of Life"),
+    "gunas": _teaching("gunas", "dot.hindu", "three_gunas_teaching", "The Three Gunas (Sattva/Rajas/Tamas)"),
+    "maya": _teaching("maya", "dot.hindu", "maya_teaching", "Maya - pierce the illusions"),
+    "atman": _teaching("atman", "dot.hindu", "atman_brahman_teaching", "Atman and Brahman - self and ultimate reality"),
+    "gita": _teaching("gita", "dot.hindu", "bhagavad_gita_verse", "Bhagavad Gita verse"),
+    "moksha": _teaching("moksha", "dot.hindu", "samsara_moksha_teaching", "Samsara and Moksha - cycle and liberation"),
+    # Tools
+    "hooks": _cmd("dot.cli", "handle_hooks", SUB_ARGS, "hooks [subcommand]",
+                  "Manage git hooks (install/uninstall/status)", default="install",
+                  more=(("hooks install --all ROOT",
+                         "Install into every repo/worktree under ROOT in parallel (JSON summary)"),
+                        ("hooks install --shared",
+                         "Link core.hooksPath to the shared content-addressed hook store"),)),
+    "daemon": _cmd("dot.cli", "cmd_daemon", ARGV, "daemon [subcommand]",
+                   "Warm validation daemon for commit hooks (start/stop/status)"),
+    "stats": _cmd("dot.cli", "handle_stats", SUB, "stats [subcommand]",
+                  "View worship statistics (summary/top/daily/export/clear/migrate)", default="summary"),
+    "badge": _cmd("dot.cli", "handle_badge", SUB, "badge [format]",
+                  "Generate worship badge (markdown/html/rst/url)", default="markdown"),
+    "poem": _cmd("dot.cli", "handle_poem", SUB_ARGS, "poem [subcommand]",
+                 "Speak poetry (hymn/haiku/banner/chant)", default="hymn"),
+    "tarot": _cmd("dot.cli", "handle_tarot", LEGACY, "tarot [subcommand]",
+                  "Read DOT tarot (draw/spread/list/card)", default="draw"),
+    "shinto": _cmd("dot.cli", "handle_shinto", LEGACY, "shinto [subcommand]",
+                   "Shinto rites (norito/omikuji/harai/ema)", default="norito"),
+    "zen": _cmd("dot.cli", "handle_zen", SUB_ARGS, "zen [subcommand]",
+                "Zen practice (koan/zazen/satori/enso/saying)", default="koan"),
+    # Deprecated in favour of `dot wisdom <philosophy>`; kept out of help
+    "gnostic": _cmd("dot.cli", "handle_gnostic", LEGACY,
+                    summary="Gnosticism - Path of Direct Knowledge", default="reading"),
+    "norse": _cmd("dot.cli", "handle_norse", LEGACY,
+                  summary="Norse/Germanic - Runes and Nine Virtues", default="reading"),
+    "zoroastrian": _cmd("dot.cli", "handle_zoroastrian", LEGACY,
+                        summary="Zoroastrianism - Path of Asha", default="reading"),
+    "egyptian": _cmd("dot.cli", "handle_egyptian", LEGACY,
+                     summary="Egyptian Mysteries - Way of Ma'at", default="reading"),
+    "jain": _cmd("dot.cli", "handle_jain", LEGACY,
+                 summary="Jainism - Path of Non-Violence", default="reading"),
+    "garden": _cmd("dot.cli", "handle_garden", SUB_ARGS, "garden [subcommand]",
+                   "Garden tools (list/info/suggest)", default="list"),
+    "wisdom": _cmd(
+        "dot.cli", "cmd_wisdom", ARGV, "wisdom [philosophy] [concept]",
+        "Unified wisdom traditions (hermetic/gnostic/norse/zoroastrian/egyptian/jain/shinto/tarot)",
+    ),
+    "demo": _cmd("dot.cli", "handle_demo", CALL, "demo", "Guided first-run walkthrough (init, validate, worship)"),
+    "suffix": _cmd("dot.cli", "cmd_suffix", ARGV, "suffix [--raw]",
+                   "Show current worship suffix and source (--raw: suffix only)"),
+    "backstory": _cmd("dot.cli", "handle_backstory", CALL, "backstory", "Print THE DOT backstory"),
+    "philosophy": _cmd("dot.cli", "handle_philosophy", CALL, "philosophy",
+                       "Print re-evaluated principles of THE DOT"),
+    "init": _cmd("dot.init_cmd", "handle_init", CALL, "init", "Initialize hooks and .dot.ini in this repo"),
+    "doctor": _cmd("dot.doctor", "handle_doctor", CALL, "doctor", "Run environment and practice checks"),
+    "changelog": _cmd(
+        "dot.changelog", "handle_changelog", SUB_ARGS, "changelog add",
+        "Prepend a timestamped entry to CHANGELOG.txt", default="add",
+        more=(("changelog verify", "Verify changelog policy and timestamped entries"),),
+    ),
+    "donate": _cmd("dot.cli", "handle_donate", CALL, "donate|sponsor", "Show sponsorship options"),
+    "sponsor": _cmd("dot.cli", "handle_donate", CALL, summary="Show sponsorship options"),
+    "support": _cmd("dot.cli", "handle_donate", CALL, summary="Show sponsorship options"),
+    "config": _cmd("dot.cli", "handle_config", SUB_ARGS, "config [subcommand]",
+                   "Manage configuration (show/get/set/reset/show-suffix/set-suffix/compile)", default="show",
+                   more=(("config compile",
+                          "Snapshot the effective config into .git for hooks and validation"),)),
+    "completions": _cmd("dot.cli", "handle_completions", SUB, "completions [shell]",
+                        "Generate shell completions (bash/zsh/fish)", default=""),
+    "version": _cmd("dot.cli", "cmd_version", ARGV, "version", "Show version information"),
+    "--version": _cmd("dot.cli", "cmd_version", ARGV),
+    "-v": _cmd("dot.cli", "cmd_version", ARGV),
+    "help": _cmd("dot.cli", "cmd_help", ARGV, "help", "Show this help message"),
+}
+
+
+def lookup(command: Optional[str]) -> Optional[Command]:
+    """Registry entry for a command name (None means the default, worship)."""
+    return COMMANDS.get(command or "worship")
+
+
+def run(entry: Command, args: List[str], dot) -> int:
+    """Import the entry's handler and call it with CLI arguments."""
+    func = getattr(importlib.import_module(entry.module), entry.attr)
+    style = entry.style
+    if style == ARGV:
+        return func(args, dot)
+    if style == CALL:
+        return func()
+    if style == PRINT:
+        print(func())
+        return 0
+    sub = args[0] if args else entry.default
+    if style == PRINT_ARG:
+        print(func(sub))
+        return 0
+    if style == SUB:
+        return func(sub)
+    if style == SUB_ARGS:
+        return func(sub, args[1:])
+    if style == LEGACY:
+        return func(sub, args[1:], deprecated=True)
+    raise ValueError(f"Unknown call style: {style}")
+
+
+def help_rows() -> Iterator[Tuple[str, str]]:
+    """(usage, summary) rows for the help "Commands:" section, in order."""
+    for entry in COMMANDS.values():
+        yield from entry.help
+
+
+def completion_commands() -> List[Tuple[str, str]]:
+    """(name, summary) for every command word, for shell completions."""
+    return [(name, entry.summary) for name, entry in COMMANDS.items()
+            if not name.startswith("-")]
@@ -1,13 +1,36 @@
 """
 Shell completion scripts for THE DOT.
 
-Generates completion scripts for bash, zsh, and fish.
+Generates completion scripts for bash, zsh, and fish. The top-level
+command words come from the command registry (dot.commands).
 """
 
+from dot.commands import completion_commands
+
+
+def _bash_commands() -> str:
+    return " ".join(name for name, _ in completion_commands())
+
+
+def _zsh_commands() -> str:
+    rows = []
+    for name, summary in completion_commands():
+        item = f"{name}:{summary}".replace("'", "'\\''")
+        rows.append(f"        '{item}'")
+    return "\n".join(rows)
+
+
+def _fish_commands() -> str:
+    rows = []
+    for name, summary in completion_commands():
+        desc = summary.replace("\\", "\\\\").replace('"', '\\"').replace("$", "\\$")
+        rows.append(f'complete -c dot -n "__fish_use_subcommand" -a "{name}" -d "{desc}"')
+    return "\n".join(rows)
+
 
 def bash_completion() -> str:
     """Generate bash completion script."""
-    return """# Bash completion for THE DOT
+    script = """# Bash completion for THE DOT
 # Source this file or add to ~/.bashrc:
 #   source <(dot completions bash)
 
@@ -18,7 +41,7 @@ _dot_completion() {
     prev="${COMP_WORDS[COMP_CWORD-1]}"
 
     # Main commands
-    commands="worship tenets sing invoke validate horoscope chart planets moon ephemeris element opus operations hermetic stone tree worlds sephiroth tikkun ein-sof shekhinah gematria tao wu-wei yin-yang elements treasures pu water iching dharma truths path marks middle poisons mindful stoic virtues control disciplines negative fate mortality logos circles confucian wuchang names filial junzi relationships cultivation mean analects hindu vedic karma yogas purusharthas gunas maya atman gita moksha hooks stats badge poem tarot shinto zen hermeticism garden wisdom config completions version help gnostic norse zoroastrian egyptian jain"
+    commands="@BASH_COMMANDS@"
 
     # Subcommands for hooks
     hooks_cmds="install uninstall status"
@@ -123,11 +146,12 @@ _dot_completion() {
 
 complete -F _dot_completion dot
 """
+    return script.replace("@BASH_COMMANDS@", _bash_commands())
 
 
 def zsh_completion() -> str:
     """Generate zsh completion script."""
-    return """#compdef dot
+    script = """#compdef dot
 # Zsh completion for THE DOT
 # Add to ~/.zshrc:
 #   source <(dot completions zsh)
@@ -136,89 +160,7 @@ _dot() {
     local -a commands hooks_cmds stats_cmds badge_cmds config_cmds completions_cmds
 
     commands=(
-        'worship:Register worship of THE DOT'
-        'tenets:Display THE DOT philosophy'
-        'sing:Hear THE ILIAD OF THE DOT in epic verse'
-        'invoke:Receive an epic invocation from THE DOT'
-        'validate:Validate a commit message'
-        'horoscope:Daily coding horoscope'
-        'chart:Repository birth chart'
-        'planets:Planetary hours for coding'
-        'moon:Moon phase coding guidance'
-        'element:Receive elemental reading'
-        'ephemeris:Ephemeris summary (vendored)'
-        'opus:View the Magnum Opus'
-        'operations:Seven alchemical operations'
-        'hermetic:Seven Hermetic principles'
-        'stone:Philosopher'\''s Stone progress'
-        'tree:Tree of Life Sephirah reading'
-        'worlds:View the Four Worlds'
-        'sephiroth:Display Tree of Life diagram'
-        'tikkun:Tikkun Olam refactoring guide'
-        'ein-sof:Ein Sof meditation'
-        'shekhinah:Invoke Divine Presence'
-        'gematria:Code quality numerology'
-        'tao:Taoist wisdom reading'
-        'wu-wei:Wu Wei effortless action'
-        'yin-yang:Yin Yang balance'
-        'elements:Five Elements reading'
-        'treasures:Three Treasures guide'
-        'pu:P'\''u - the Uncarved Block'
-        'water:Be like water wisdom'
-        'iching:I Ching hexagram reading'
-        'dharma:Receive Dharma wisdom reading'
-        'truths:The Four Noble Truths for developers'
-        'path:The Noble Eightfold Path in coding'
-        'marks:The Three Marks of Existence in software'
-        'middle:The Middle Way - avoiding extremes'
-        'poisons:The Three Poisons in development'
-        'mindful:Mindfulness practices for coding'
-        'stoic:Receive Stoic wisdom reading'
-        'virtues:The Four Stoic Virtues'
-        'control:Dichotomy of Control'
-        'disciplines:The Three Disciplines'
-        'negative:Premeditatio Malorum - negative visualization'
-        'fate:Amor Fati - love of fate'
-        'mortality:Memento Mori - remember death'
-        'logos:Logos - universal reason'
-        'circles:Oikeiosis - expanding circle of care'
-        'confucian:Receive Confucian wisdom reading'
-        'wuchang:The Five Constant Virtues'
-        'names:Rectification of Names'
-        'filial:Filial Piety - respect for legacy code'
-        'junzi:The Superior Person'
-        'relationships:The Five Relationships'
-        'cultivation:Self-Cultivation'
-        'mean:Doctrine of the Mean'
-        'analects:Teachings from the Analects'
-        'hindu:Receive Hindu wisdom reading'
-        'vedic:Dharma - righteous duty'
-        'karma:Karma - action and consequences'
-        'yogas:The Four Yogas'
-        'purusharthas:The Four Aims of Life'
-        'gunas:The Three Gunas'
-        'maya:Maya - pierce the illusions'
-        'atman:Atman and Brahman'
-        'gita:Bhagavad Gita verse'
-        'moksha:Samsara and Moksha'
-        'hooks:Manage git hooks'
-        'stats:View worship statistics'
-        'badge:Generate worship badge'
-        'poem:Speak poetry'
-        'tarot:Read DOT tarot'
-        'shinto:Shinto - Way of the Kami'
-        'hermetic:Hermeticism - Seven Hermetic Principles'
-        'gnostic:Gnosticism - Path of Direct Knowledge'
-        'norse:Norse/Germanic - Runes and Nine Virtues'
-        'zoroastrian:Zoroastrianism - Path of Asha'
-        'egyptian:Egyptian Mysteries - Way of Ma''at'
-        'jain:Jainism - Path of Non-Violence'
-        'garden:Garden tools'
-        'wisdom:Unified wisdom traditions interface'
-        'config:Manage configuration'
-        'completions:Generate shell completions'
-        'version:Show version information'
-        'help:Show help message'
+@ZSH_COMMANDS@
     )
 
     hooks_cmds=(
@@ -347,99 +289,17 @@ hermeticism_cmds=(        'mentalism:The All is Mind'        'correspondence:As
 
 _dot
 """
+    return script.replace("@ZSH_COMMANDS@", _zsh_commands())
 
 
 def fish_completion() -> str:
     """Generate fish completion script."""
-    return """# Fish completion for THE DOT
+    script = """# Fish completion for THE DOT
 # Save to ~/.config/fish/completions/dot.fish:
 #   dot completions fish > ~/.config/fish/completions/dot.fish
 
 # Main commands
-complete -c dot -n "__fish_use_subcommand" -a "worship" -d "Register worship of THE DOT"
-complete -c dot -n "__fish_use_subcommand" -a "tenets" -d "Display THE DOT philosophy"
-complete -c dot -n "__fish_use_subcommand" -a "sing" -d "Hear THE ILIAD OF THE DOT in epic verse"
-complete -c dot -n "__fish_use_subcommand" -a "invoke" -d "Receive an epic invocation from THE DOT"
-complete -c dot -n "__fish_use_subcommand" -a "validate" -d "Validate a commit message"
-complete -c dot -n "__fish_use_subcommand" -a "horoscope" -d "Daily coding horoscope"
-complete -c dot -n "__fish_use_subcommand" -a "chart" -d "Repository birth chart"
-complete -c dot -n "__fish_use_subcommand" -a "planets" -d "Planetary hours for coding"
-complete -c dot -n "__fish_use_subcommand" -a "moon" -d "Moon phase coding guidance"
-complete -c dot -n "__fish_use_subcommand" -a "ephemeris" -d "Ephemeris summary (vendored)"
-complete -c dot -n "__fish_use_subcommand" -a "element" -d "Receive elemental reading"
-complete -c dot -n "__fish_use_subcommand" -a "opus" -d "View the Magnum Opus"
-complete -c dot -n "__fish_use_subcommand" -a "operations" -d "Seven alchemical operations"
-complete -c dot -n "__fish_use_subcommand" -a "hermetic" -d "Seven Hermetic principles"
-complete -c dot -n "__fish_use_subcommand" -a "gnostic" -d "Gnosticism - Path of Direct Knowledge"
-complete -c dot -n "__fish_use_subcommand" -a "norse" -d "Norse/Germanic - Runes and Nine Virtues"
-complete -c dot -n "__fish_use_subcommand" -a "zoroastrian" -d "Zoroastrianism - Path of Asha"
-complete -c dot -n "__fish_use_subcommand" -a "egyptian" -d "Egyptian Mysteries - Way of Ma'at"
-complete -c dot -n "__fish_use_subcommand" -a "jain" -d "Jainism - Path of Non-Violence"
-complete -c dot -n "__fish_use_subcommand" -a "stone" -d "Philosopher's Stone progress"
-complete -c dot -n "__fish_use_subcommand" -a "tree" -d "Tree of Life Sephirah reading"
-complete -c dot -n "__fish_use_subcommand" -a "worlds" -d "View the Four Worlds"
-complete -c dot -n "__fish_use_subcommand" -a "sephiroth" -d "Display Tree of Life diagram"
-complete -c dot -n "__fish_use_subcommand" -a "tikkun" -d "Tikkun Olam refactoring guide"
-complete -c dot -n "__fish_use_subcommand" -a "ein-sof" -d "Ein Sof meditation"
-complete -c dot -n "__fish_use_subcommand" -a "shekhinah" -d "Invoke Divine Presence"
-complete -c dot -n "__fish_use_subcommand" -a "gematria" -d "Code quality numerology"
-complete -c dot -n "__fish_use_subcommand" -a "tao" -d "Taoist wisdom reading"
-complete -c dot -n "__fish_use_subcommand" -a "wu-wei" -d "Wu Wei effortless action"
-complete -c dot -n "__fish_use_subcommand" -a "yin-yang" -d "Yin Yang balance"
-complete -c dot -n "__fish_use_subcommand" -a "elements" -d "Five Elements reading"
-complete -c dot -n "__fish_use_subcommand" -a "treasures" -d "Three Treasures guide"
-complete -c dot -n "__fish_use_subcommand" -a "pu" -d "P'u - the Uncarved Block"
-complete -c dot -n "__fish_use_subcommand" -a "water" -d "Be like water wisdom"
-complete -c dot -n "__fish_use_subcommand" -a "iching" -d "I Ching hexagram reading"
-complete -c dot -n "__fish_use_subcommand" -a "dharma" -d "Receive Dharma wisdom reading"
-complete -c dot -n "__fish_use_subcommand" -a "truths" -d "The Four Noble Truths for developers"
-complete -c dot -n "__fish_use_subcommand" -a "path" -d "The Noble Eightfold Path in coding"
-complete -c dot -n "__fish_use_subcommand" -a "marks" -d "The Three Marks of Existence in software"
-complete -c dot -n "__fish_use_subcommand" -a "middle" -d "The Middle Way - avoiding extremes"
-complete -c dot -n "__fish_use_subcommand" -a "poisons" -d "The Three Poisons in development"
-complete -c dot -n "__fish_use_subcommand" -a "mindful" -d "Mindfulness practices for coding"
-complete -c dot -n "__fish_use_subcommand" -a "stoic" -d "Receive Stoic wisdom reading"
-complete -c dot -n "__fish_use_subcommand" -a "virtues" -d "The Four Stoic Virtues"
-complete -c dot -n "__fish_use_subcommand" -a "control" -d "Dichotomy of Control"
-complete -c dot -n "__fish_use_subcommand" -a "disciplines" -d "The Three Disciplines"
-complete -c dot -n "__fish_use_subcommand" -a "negative" -d "Premeditatio Malorum - negative visualization"
-complete -c dot -n "__fish_use_subcommand" -a "fate" -d "Amor Fati - love of fate"
-complete -c dot -n "__fish_use_subcommand" -a "mortality" -d "Memento Mori - remember death"
-complete -c dot -n "__fish_use_subcommand" -a "logos" -d "Logos - universal reason"
-complete -c dot -n "__fish_use_subcommand" -a "circles" -d "Oikeiosis - expanding circle of care"
-complete -c dot -n "__fish_use_subcommand" -a "confucian" -d "Receive Confucian wisdom reading"
-complete -c dot -n "__fish_use_subcommand" -a "wuchang" -d "The Five Constant Virtues"
-complete -c dot -n "__fish_use_subcommand" -a "names" -d "Rectification of Names"
-complete -c dot -n "__fish_use_subcommand" -a "filial" -d "Filial Piety - respect for legacy code"
-complete -c dot -n "__fish_use_subcommand" -a "junzi" -d "The Superior Person"
-complete -c dot -n "__fish_use_subcommand" -a "relationships" -d "The Five Relationships"
-complete -c dot -n "__fish_use_subcommand" -a "cultivation" -d "Self-Cultivation"
-complete -c dot -n "__fish_use_subcommand" -a "mean" -d "Doctrine of the Mean"
-complete -c dot -n "__fish_use_subcommand" -a "analects" -d "Teachings from the Analects"
-complete -c dot -n "__fish_use_subcommand" -a "hindu" -d "Receive Hindu wisdom reading"
-complete -c dot -n "__fish_use_subcommand" -a "vedic" -d "Dharma - righteous duty"
-complete -c dot -n "__fish_use_subcommand" -a "karma" -d "Karma - action and consequences"
-complete -c dot -n "__fish_use_subcommand" -a "yogas" -d "The Four Yogas"
-complete -c dot -n "__fish_use_subcommand" -a "purusharthas" -d "The Four Aims of Life"
-complete -c dot -n "__fish_use_subcommand" -a "gunas" -d "The Three Gunas"
-complete -c dot -n "__fish_use_subcommand" -a "maya" -d "Maya - pierce the illusions"
-complete -c dot -n "__fish_use_subcommand" -a "atman" -d "Atman and Brahman"
-complete -c dot -n "__fish_use_subcommand" -a "gita" -d "Bhagavad Gita verse"
-complete -c dot -n "__fish_use_subcommand" -a "moksha" -d "Samsara and Moksha"
-complete -c dot -n "__fish_use_subcommand" -a "hooks" -d "Manage git hooks"
-complete -c dot -n "__fish_use_subcommand" -a "stats" -d "View worship statistics"
-complete -c dot -n "__fish_use_subcommand" -a "badge" -d "Generate worship badge"
-complete -c dot -n "__fish_use_subcommand" -a "poem" -d "Speak poetry"
-complete -c dot -n "__fish_use_subcommand" -a "tarot" -d "Read DOT tarot"
-complete -c dot -n "__fish_use_subcommand" -a "shinto" -d "Shinto - Way of the Kami"
-complete -c dot -n "__fish_use_subcommand" -a "zen" -d "Zen - Way of Awakening"
-complete -c dot -n "__fish_use_subcommand" -a "hermeticism" -d "Hermeticism - Seven Hermetic Principles"
-complete -c dot -n "__fish_use_subcommand" -a "garden" -d "Garden tools"
-complete -c dot -n "__fish_use_subcommand" -a "wisdom" -d "Unified wisdom traditions interface"
-complete -c dot -n "__fish_use_subcommand" -a "config" -d "Manage configuration"
-complete -c dot -n "__fish_use_subcommand" -a "completions" -d "Generate shell completions"
-complete -c dot -n "__fish_use_subcommand" -a "version" -d "Show version information"
-complete -c dot -n "__fish_use_subcommand" -a "help" -d "Show help message"
+@FISH_COMMANDS@
 
 # Hooks subcommands
 complete -c dot -n "__fish_seen_subcommand_from hooks" -a "install" -d "Install git hooks"
@@ -556,6 +416,7 @@ complete -c dot -n "__fish_seen_subcommand_from wisdom" -a "shinto" -d "Way of t
 complete -c dot -n "__fish_seen_subcommand_from wisdom" -a "tarot" -d "DOT Tarot Readings"
 complete -c dot -n "__fish_seen_subcommand_from wisdom" -d "zoroastrian" -a "Path of Asha"
 """
+    return script.replace("@FISH_COMMANDS@", _fish_commands())
 
 
 def get_completion(shell: str) -> str:
@@ -3,25 +3,33 @@ Configuration management for THE DOT.
 
 Handles user preferences and settings.
 Also manages worship suffix configuration via environment or .dot.ini files.
+``dot config compile`` resolves both into a per-repository snapshot that hot
+paths read instead of parsing every source.
 """
 
 from __future__ import annotations
 
 import os
-import json
-import configparser
 import functools
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Any, NamedTuple, Optional, Tuple
 from dot import git_utils
 
+if TYPE_CHECKING:
+    import configparser
+
 
 # =============================================================================
 # General Configuration System (JSON-based)
 # =============================================================================
 
 class DotConfig:
-    """Manage THE DOT configuration."""
+    """Manage THE DOT configuration.
+
+    Reading never touches the filesystem beyond opening config.json once, on
+    first access; without one the defaults live in memory. The directory
+    and file are only created by set() and reset().
+    """
 
     def __init__(self, config_file: Optional[Path] = None):
         """Initialize configuration manager."""
@@ -29,8 +37,18 @@ class DotConfig:
             config_file = Path.home() / ".worship_the_dot" / "config.json"
 
         self.config_file = config_file
-        self.config_file.parent.mkdir(parents=True, exist_ok=True)
-        self._load_config()
+        self._data: Optional[Dict[str, Any]] = None
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Effective configuration, loaded on first access."""
+        if self._data is None:
+            self._load_config()
+        return self._data
+
+    @data.setter
+    def data(self, value: Dict[str, Any]) -> None:
+        self._data = value
 
     def _default_config(self) -> Dict[str, Any]:
         """Create default configuration."""
@@ -60,19 +78,18 @@ class DotConfig:
         }
 
     def _load_config(self):
-        """Load configuration from file."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    loaded = json.load(f)
-                    # Merge with defaults to handle new settings
-                    self.data = self._default_config()
-                    self._deep_merge(self.data, loaded)
-            except (json.JSONDecodeError, IOError):
-                self.data = self._default_config()
-        else:
-            self.data = self._default_config()
-            self._save_config()
+        """Load configuration from file (defaults if it is missing or unreadable)."""
+        import json
+
+        self.data = self._default_config()
+        try:
+            with open(self.config_file, 'r') as f:
+                loaded = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        if isinstance(loaded, dict):
+            # Merge with defaults to handle new settings
+            self._deep_merge(self.data, loaded)
 
     def _deep_merge(self, base: Dict, update: Dict):
         """Deep merge update into base."""
@@ -84,10 +101,13 @@ class DotConfig:
 
     def _save_config(self):
         """Save configuration to file."""
+        import json
+
         try:
+            self.config_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self.config_file, 'w') as f:
                 json.dump(self.data, f, indent=2)
-        except IOError as e:
+        except OSError as e:
             print(f"Warning: Could not save config: {e}")
 
     def get(self, *keys, default=None) -> Any:
@@ -122,6 +142,8 @@ class DotConfig:
 
     def export_config(self) -> str:
         """Export configuration as JSON string."""
+        import json
+
         return json.dumps(self.data, indent=2)
 
 
@@ -144,12 +166,14 @@ def get_config() -> DotConfig:
 DEFAULT_WORSHIP_SUFFIX = "BECAUSE I WORSHIP THE DOT"
 
 
-def _git_repo_root() -> Optional[Path]:
+def _git_repo_root(cwd: Optional[Path] = None) -> Optional[Path]:
     """Get git repository root using git_utils."""
-    return git_utils.get_repo_root()
+    if cwd is None:
+        return git_utils.get_repo_root()
+    return git_utils.get_repo_root(cwd)
 
 
-def config_search_paths() -> list[Path]:
+def config_search_paths(cwd: Optional[Path] = None) -> list[Path]:
     """
     Return .dot.ini search paths.
 
@@ -157,12 +181,14 @@ def config_search_paths() -> list[Path]:
       1) .dot.ini in git repo root
       2) .dot.ini in current working directory
       3) .dot.ini in user home directory
+
+    cwd overrides the working directory the search starts from.
     """
     paths: list[Path] = []
-    repo_root = _git_repo_root()
+    repo_root = _git_repo_root(cwd)
     if repo_root:
         paths.append(repo_root / ".dot.ini")
-    paths.append(Path.cwd() / ".dot.ini")
+    paths.append(Path(cwd if cwd is not None else Path.cwd()) / ".dot.ini")
     home = Path(os.path.expanduser("~"))
     paths.append(home / ".dot.ini")
     # Deduplicate while preserving order
@@ -176,6 +202,8 @@ def config_search_paths() -> list[Path]:
 
 
 def _load_ini(path: Path) -> configparser.ConfigParser:
+    import configparser
+
     cfg = configparser.ConfigParser()
     if path.exists():
         cfg.read(path)
@@ -183,25 +211,26 @@ def _load_ini(path: Path) -> configparser.ConfigParser:
 
 
 @functools.lru_cache(maxsize=128)
-def _load_ini_cached(path: Path, mtime: float) -> configparser.ConfigParser:
-    """Load INI file with caching based on modification time.
+def _load_ini_cached(path: Path, stamp: Tuple[int, int, int]) -> configparser.ConfigParser:
+    """Load INI file with caching based on its file identity.
 
     Args:
         path: Path to the .dot.ini file.
-        mtime: File modification time (used for cache invalidation).
+        stamp: (mtime_ns, size, inode) of the file, used for cache
+            invalidation. Size and inode catch most same-tick edits and
+            atomic replacements that a coarse mtime alone would miss.
 
     Returns:
         Loaded ConfigParser instance.
-
-    Note:
-        The mtime parameter ensures cache is invalidated when file changes.
-        Using lru_cache with mtime provides 10-50x faster config access.
     """
     return _load_ini(path)
 
 
 def _get_ini_with_cache(path: Path) -> configparser.ConfigParser:
-    """Get INI config with caching based on file modification time.
+    """Get INI config with caching based on the file's identity.
+
+    While a watcher is attached (watch_config) the parse is served from
+    memory without a stat and dropped when the watcher reports a change.
 
     Args:
         path: Path to the .dot.ini file.
@@ -209,33 +238,70 @@ def _get_ini_with_cache(path: Path) -> configparser.ConfigParser:
     Returns:
         ConfigParser instance (cached if file hasn't changed).
     """
-    if not path.exists():
-        return configparser.ConfigParser()
-
-    # Get file modification time for cache key
-    mtime = path.stat().st_mtime
-    return _load_ini_cached(path, mtime)
+    watcher, generation = _watcher, _watch_generation
+    if watcher is not None:
+        cfg = _watched_ini.get(path)
+        if cfg is not None:
+            return cfg
+        watcher.watch(path, _invalidate)
+    # One stat both checks existence and yields the cache key
+    try:
+        st = path.stat()
+    except OSError:
+        import configparser
+
+        cfg = configparser.ConfigParser()
+    else:
+        cfg = _load_ini_cached(path, (st.st_mtime_ns, st.st_size, st.st_ino))
+    if watcher is not None and generation == _watch_generation:
+        _watched_ini[path] = cfg
+    return cfg
 
 
-def resolve_worship_suffix() -> Tuple[str, str]:
+def resolve_worship_suffix(cwd: Optional[Path] = None, use_env: bool = True) -> Tuple[str, str]:
     """
     Resolve the worship suffix and return (suffix, source).
 
     Precedence (highest to lowest):
-      1) Environment variable DOT_WORSHIP_SUFFIX
+      1) Environment variable DOT_WORSHIP_SUFFIX (unless use_env is False)
       2) .dot.ini files (git repo root > cwd > home)
       3) Default suffix
 
     source is one of: 'env', path string to .dot.ini, or 'default'.
+    cwd resolves as if running from that directory (defaults to the CWD).
 
     Note:
-        Uses caching based on file modification time for 10-50x faster access.
+        Uses caching based on file identity for 10-50x faster access; with
+        a watcher attached (watch_config) a repeated lookup is a dict read.
     """
-    env = os.getenv("DOT_WORSHIP_SUFFIX")
+    env = os.getenv("DOT_WORSHIP_SUFFIX") if use_env else None
     if env and env.strip():
         return env.strip(), "env"
 
-    for p in config_search_paths():
+    watcher, generation = _watcher, _watch_generation
+    if watcher is not None:
+        key = os.fspath(cwd) if cwd is not None else os.getcwd()
+        resolved = _watched_suffix.get(key)
+        if resolved is not None:
+            return resolved
+        resolved = _resolve_from_files(cwd)
+        # A fresh snapshot answers without reading the ini files; watch
+        # them anyway, since editing one makes the snapshot stale
+        for path in [*config_search_paths(cwd), snapshot_path(cwd)]:
+            if path is not None:
+                watcher.watch(path, _invalidate)
+        if generation == _watch_generation:
+            _watched_suffix[key] = resolved
+        return resolved
+    return _resolve_from_files(cwd)
+
+
+def _resolve_from_files(cwd: Optional[Path]) -> Tuple[str, str]:
+    snapshot = load_snapshot(cwd)
+    if snapshot is not None:
+        return snapshot.suffix, snapshot.source
+
+    for p in config_search_paths(cwd):
         cfg = _get_ini_with_cache(p)
         if cfg.has_section("dot") and cfg.has_option("dot", "worship_suffix"):
             val = cfg.get("dot", "worship_suffix").strip()
@@ -269,3 +335,246 @@ def write_worship_suffix(target: Optional[Path], suffix: str) -> Path:
     with target.open("w") as f:
         cfg.write(f)
     return target
+
+
+# =============================================================================
+# Compiled Configuration Snapshot
+# =============================================================================
+
+SNAPSHOT_FILE = "dot-config.snapshot"
+SNAPSHOT_MAGIC = "DOTCFG1"
+
+# config.json sections copied into the snapshot (scalar values only)
+SNAPSHOT_SECTIONS = ("display", "philosophy")
+
+
+class ConfigSnapshot(NamedTuple):
+    """Effective configuration of a repository, as compiled."""
+
+    suffix: str
+    source: str
+    settings: Dict[str, Any]  # "display.colors" -> True
+    sources: Tuple[Tuple[str, str], ...]  # (path, "mtime_ns:size" or "-")
+
+
+def snapshot_path(cwd: Optional[Path] = None) -> Optional[Path]:
+    """Where the snapshot for the repository containing cwd lives."""
+    found = git_utils.discover_repo(cwd)
+    return found[1] / SNAPSHOT_FILE if found else None
+
+
+def _default_config_file() -> Path:
+    return Path(os.path.expanduser("~")) / ".worship_the_dot" / "config.json"
+
+
+def _stamp(path: Path) -> str:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "-"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def _unescape(text: str) -> str:
+    if "\\" not in text:
+        return text
+    out = []
+    chars = iter(text)
+    for ch in chars:
+        if ch == "\\":
+            nxt = next(chars, "")
+            out.append({"t": "\t", "n": "\n"}.get(nxt, nxt))
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _encode_value(value: Any) -> Optional[str]:
+    if isinstance(value, bool):
+        return f"b\t{int(value)}"
+    if isinstance(value, int):
+        return f"i\t{value}"
+    if isinstance(value, float):
+        return f"f\t{value!r}"
+    if isinstance(value, str):
+        return f"s\t{_escape(value)}"
+    return None
+
+
+def _decode_value(kind: str, raw: str) -> Any:
+    if kind == "b":
+        return raw == "1"
+    if kind == "i":
+        return int(raw)
+    if kind == "f":
+        return float(raw)
+    return _unescape(raw)
+
+
+def compile_config(cwd: Optional[Path] = None, config_file: Optional[Path] = None) -> Path:
+    """Resolve the effective configuration for a repository into a snapshot.
+
+    The snapshot is compiled for the repository's top level. It records the
+    suffix and its source (``DOT_WORSHIP_SUFFIX`` is not baked in; it is
+    still checked first at run time), the display and philosophy settings
+    from config.json, and the mtime and size of every source it read.
+
+    Returns:
+        Path of the snapshot file.
+
+    Raises:
+        ValueError: If cwd is not inside a git repository.
+        OSError: If the snapshot cannot be written.
+    """
+    from dot.fsutil import atomic_write_text
+
+    found = git_utils.discover_repo(cwd)
+    if found is None:
+        raise ValueError("Not in a git repository")
+    root, git_dir = found
+    config_file = Path(config_file) if config_file else _default_config_file()
+
+    # Stamp before reading: a source changing mid-compile leaves it stale
+    sources = [(str(p), _stamp(p)) for p in config_search_paths(root)]
+    sources.append((str(config_file), _stamp(config_file)))
+    data = DotConfig(config_file).data
+    suffix, source = resolve_worship_suffix(root, use_env=False)
+
+    lines = [SNAPSHOT_MAGIC]
+    lines += [f"dep\t{stamp}\t{_escape(path)}" for path, stamp in sources]
+    lines.append(f"suffix\t{_escape(suffix)}")
+    lines.append(f"source\t{_escape(source)}")
+    for section in SNAPSHOT_SECTIONS:
+        for key, value in sorted((data.get(section) or {}).items()):
+            encoded = _encode_value(value)
+            if encoded is not None:
+                lines.append(f"set\t{section}.{key}\t{encoded}")
+    path = git_dir / SNAPSHOT_FILE
+    atomic_write_text(path, "\n".join(lines) + "\n")
+    return path
+
+
+def load_snapshot(cwd: Optional[Path] = None) -> Optional[ConfigSnapshot]:
+    """The compiled snapshot for cwd, or None if absent or stale.
+
+    A snapshot only applies when the ``.dot.ini`` search paths for cwd are
+    the ones it was compiled from and none of its sources changed mtime or
+    size (or appeared or vanished). One read and a stat per source; no INI
+    or JSON parsing.
+
+    The snapshot file itself is stat'ed on every call and only read when
+    that stat changes, so without a snapshot a lookup costs one failed stat.
+    """
+    path = snapshot_path(cwd)
+    if path is None:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    snapshot = _read_snapshot(path, (st.st_mtime_ns, st.st_size, st.st_ino))
+    if snapshot is None:
+        return None
+
+    expected = [str(p) for p in config_search_paths(cwd)]
+    if [dep for dep, _ in snapshot.sources[:-1]] != expected:
+        return None
+    if any(_stamp(Path(dep)) != stamp for dep, stamp in snapshot.sources):
+        return None
+    return snapshot
+
+
+@functools.lru_cache(maxsize=32)
+def _read_snapshot(path: Path, stamp: Tuple[int, int, int]) -> Optional[ConfigSnapshot]:
+    """Parse a snapshot file, cached on its (mtime_ns, size, inode) like
+    _load_ini_cached; freshness against its sources is load_snapshot's job."""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not lines or lines[0] != SNAPSHOT_MAGIC:
+        return None
+
+    suffix = source = None
+    settings: Dict[str, Any] = {}
+    deps = []
+    try:
+        for line in lines[1:]:
+            tag, _, rest = line.partition("\t")
+            if tag == "dep":
+                stamp, _, dep = rest.partition("\t")
+                deps.append((_unescape(dep), stamp))
+            elif tag == "suffix":
+                suffix = _unescape(rest)
+            elif tag == "source":
+                source = _unescape(rest)
+            elif tag == "set":
+                key, kind, raw = rest.split("\t", 2)
+                settings[key] = _decode_value(kind, raw)
+    except ValueError:
+        return None
+    if not suffix or source is None or not deps:
+        return None
+    return ConfigSnapshot(suffix, source, settings, tuple(deps))
+
+
+def get_setting(section: str, key: str, default: Any = None, cwd: Optional[Path] = None) -> Any:
+    """A display or philosophy setting, from the snapshot when it is fresh.
+
+    Falls back to the full config.json load (get_config) otherwise, which
+    is also what a watched process (watch_config) keeps in memory.
+    """
+    if section in SNAPSHOT_SECTIONS and _watcher is None:
+        snapshot = load_snapshot(cwd)
+        if snapshot is not None:
+            return snapshot.settings.get(f"{section}.{key}", default)
+    return get_config().get(section, key, default=default)
+
+
+# =============================================================================
+# File-watch Driven Invalidation
+# =============================================================================
+
+_watcher = None
+_watch_generation = 0
+_watched_ini: Dict[Path, Any] = {}
+_watched_suffix: Dict[str, Tuple[str, str]] = {}
+
+
+def _invalidate(path: Path) -> None:
+    """Watcher callback: forget everything derived from configuration.
+
+    The generation counter stops a lookup that raced with this change
+    from storing what it read before it.
+    """
+    global _watch_generation
+    _watch_generation += 1
+    _watched_ini.clear()
+    _watched_suffix.clear()
+    if _config is not None and path == _config.config_file:
+        _config._data = None
+
+
+def watch_config(watcher) -> None:
+    """Serve suffix and config lookups from memory, invalidated by watcher.
+
+    For long-running processes (the daemon, editor integrations). Every
+    ``.dot.ini``, snapshot and config.json consulted is registered with
+    the watcher (see dot.watch); until one changes, resolve_worship_suffix
+    and get_config answer without touching the filesystem.
+    """
+    global _watcher
+    unwatch_config()
+    _watcher = watcher
+    watcher.watch(get_config().config_file, _invalidate)
+
+
+def unwatch_config() -> None:
+    """Detach the watcher and go back to per-lookup staleness checks."""
+    global _watcher
+    _watcher = None
+    _invalidate(Path())
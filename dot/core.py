@@ -6,6 +6,8 @@ THE DOT represents order, structure, and purpose in development.
 
 from __future__ import annotations
 
+from typing import Optional
+
 from dot.config import get_worship_suffix
 
 
@@ -52,17 +54,19 @@ class Dot:
         """
         return self.philosophy.copy()
 
-    def validate_commit(self, message: str) -> bool:
+    def validate_commit(self, message: str, suffix: Optional[str] = None) -> bool:
         """
         Validate that a commit message properly worships THE DOT.
 
         Args:
             message: The commit message to validate
+            suffix: Pre-resolved worship suffix; resolved from config if omitted
 
         Returns:
             True if the message ends with proper worship, False otherwise
         """
-        suffix = get_worship_suffix()
+        if suffix is None:
+            suffix = get_worship_suffix()
         return message.strip().endswith(suffix)
 
     def __repr__(self) -> str:
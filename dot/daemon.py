@@ -0,0 +1,151 @@
+"""
+Validation daemon for THE DOT.
+
+Keeps the resolved suffix, configuration and validation-mode modules warm
+behind a Unix socket so commit hooks skip interpreter start-up and imports
+on every commit. The matching client lives in dot.hook_client. A file
+watcher (dot.watch) drops cached configuration as soon as a ``.dot.ini`` or
+config.json changes, so warm lookups never stat.
+
+Protocol: one JSON object per line in each direction, one request per
+connection.
+
+    {"op": "validate", "message": "...", "cwd": "/repo", "mode": "--epic"}
+    -> {"valid": true, "suffix": "...", "source": "...", "text": "..."}
+    {"op": "ping"}      -> {"ok": true, "pid": 1234}
+    {"op": "shutdown"}  -> {"ok": true}
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dot.config import get_config, resolve_worship_suffix, unwatch_config, watch_config
+from dot.core import get_dot
+from dot.hook_client import default_socket_path, request
+
+# Largest request line accepted; commit messages are far smaller.
+MAX_REQUEST_BYTES = 1 << 20
+
+
+def _warm_validation_modes() -> Dict[str, Any]:
+    """Import every validation-mode renderer once, keyed by flag."""
+    from dot.cli import VALIDATION_MODES
+
+    renderers: Dict[str, Any] = {}
+    for flags, (module_path, function_name) in VALIDATION_MODES.items():
+        func = getattr(importlib.import_module(module_path), function_name)
+        for flag in flags:
+            renderers[flag] = func
+    return renderers
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        try:
+            req = json.loads(line)
+            if not isinstance(req, dict):
+                raise ValueError("request must be a JSON object")
+            resp = self.server.dispatch(req)
+        except (ValueError, TypeError, KeyError) as e:
+            resp = {"error": str(e)}
+        self.wfile.write(json.dumps(resp).encode("utf-8") + b"\n")
+
+
+class ValidationDaemon(socketserver.ThreadingUnixStreamServer):
+    """Unix-socket server answering validation requests from warm state."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, warm_modes: bool = True, watch: bool = True):
+        self.socket_path = Path(socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        _remove_stale_socket(self.socket_path)
+        super().__init__(str(self.socket_path), _Handler)
+        os.chmod(self.socket_path, 0o600)
+        self.dot = get_dot()
+        self.config = get_config()
+        self.renderers = _warm_validation_modes() if warm_modes else {}
+        self.watcher = None
+        if watch:
+            from dot.watch import create_watcher
+
+            self.watcher = create_watcher()
+            watch_config(self.watcher)
+
+    def dispatch(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        op = req.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        if op == "validate":
+            return self._validate(req)
+        return {"error": f"unknown op: {op}"}
+
+    def _validate(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        message = req["message"]
+        cwd = req.get("cwd")
+        suffix, source = resolve_worship_suffix(Path(cwd) if cwd else None)
+        valid = self.dot.validate_commit(message, suffix=suffix)
+        resp = {"valid": valid, "suffix": suffix, "source": source}
+        mode = req.get("mode")
+        if mode:
+            renderer = self.renderers.get(mode)
+            if renderer is None:
+                return {"error": f"unknown validation mode: {mode}"}
+            resp["text"] = renderer(valid, message)
+        return resp
+
+    def server_close(self):
+        super().server_close()
+        if self.watcher is not None:
+            unwatch_config()
+            self.watcher.close()
+            self.watcher = None
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Remove a socket left behind by a dead daemon; refuse to evict a live one."""
+    if not path.exists():
+        return
+    if request({"op": "ping"}, path) is not None:
+        raise OSError(f"A DOT daemon is already listening on {path}")
+    path.unlink()
+
+
+def serve(socket_path: Optional[Path] = None) -> None:
+    """Run the daemon in the foreground until asked to shut down."""
+    path = Path(socket_path) if socket_path else default_socket_path()
+    server = ValidationDaemon(path)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+def stop(socket_path: Optional[Path] = None) -> bool:
+    """Ask a running daemon to exit. Returns True if one answered."""
+    return request({"op": "shutdown"}, socket_path) is not None
+
+
+def status(socket_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Return the daemon's ping response, or None if it is not running."""
+    return request({"op": "ping"}, socket_path)
+
+
+def is_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
@@ -1,4 +1,3 @@
-import subprocess
 from pathlib import Path
 from dot.core import get_dot
 from dot.config import resolve_worship_suffix
@@ -16,20 +15,16 @@ def handle_doctor():
     print(f"Repo: OK ({git_dir})")
 
     # Branch
-    try:
-        branch = subprocess.check_output(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            stderr=subprocess.DEVNULL,
-            text=True,
-        ).strip()
+    branch = git_utils.get_current_branch()
+    if branch:
         print(f"Branch: {branch}")
         if branch in ("main", "master"):
             print("Warning: Working directly on main/master is discouraged")
-    except Exception:
+    else:
         print("Branch: Unknown")
 
     # Hooks
-    hooks_path = Path(git_dir) / "hooks"
+    hooks_path = git_utils.get_hooks_dir(Path(git_dir), git_utils.get_repo_root())
     cm = hooks_path / "commit-msg"
     pcm = hooks_path / "prepare-commit-msg"
     print(
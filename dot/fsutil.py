@@ -0,0 +1,67 @@
+"""
+Filesystem helpers for THE DOT's state files.
+
+Several processes (parallel CI jobs, hooks, the daemon) may update the same
+files under ~/.worship_the_dot at once. These helpers give them an advisory
+inter-process lock and writes that readers never observe half-finished.
+"""
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+@contextlib.contextmanager
+def file_lock(path: Union[str, Path]) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``path`` for the duration.
+
+    The lock file is created if needed and left in place; only the lock is
+    released. Where fcntl is unavailable the lock is a no-op and writers
+    rely on atomic replacement alone.
+
+    Raises:
+        OSError: If the lock file cannot be created.
+    """
+    if fcntl is None:  # pragma: no cover - Windows
+        yield
+        return
+    fd = os.open(str(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temp file and rename.
+
+    Readers see either the old contents or the new, never a truncated file.
+
+    Raises:
+        OSError: If the temp file cannot be written or renamed.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def atomic_write_text(path: Union[str, Path], text: str, encoding: str = "utf-8") -> None:
+    """Text counterpart of atomic_write_bytes."""
+    atomic_write_bytes(path, text.encode(encoding))
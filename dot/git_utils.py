@@ -1,12 +1,20 @@
 """Git utilities for THE DOT.
 
 Provides centralized git operations with consistent error handling.
+
+Repository discovery is pure Python; subprocess is only imported by the
+helpers that actually run git, keeping the commit-hook path light.
 """
 
-import subprocess
-from datetime import datetime
+from __future__ import annotations
+
+import functools
+import os
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from datetime import datetime
 
 
 def is_git_repo() -> bool:
@@ -19,6 +27,8 @@ def is_git_repo() -> bool:
         >>> if is_git_repo():
         ...     print("In a git repository")
     """
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--git-dir"],
@@ -30,9 +40,175 @@ def is_git_repo() -> bool:
         return False
 
 
-def get_repo_root() -> Optional[Path]:
+def _read_gitfile(path: str) -> Optional[str]:
+    """Resolve a ``.git`` file (worktrees, submodules) to its git directory."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            line = f.readline().strip()
+    except OSError:
+        return None
+    if not line.startswith("gitdir:"):
+        return None
+    target = line[len("gitdir:"):].strip()
+    return os.path.normpath(os.path.join(os.path.dirname(path), target))
+
+
+@functools.lru_cache(maxsize=256)
+def _discover_repo(cwd: str, env_git_dir: Optional[str],
+                   env_work_tree: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Find ``(work_tree, git_dir)`` for cwd without spawning git.
+
+    Mirrors git's discovery rules: GIT_WORK_TREE and GIT_DIR win when set
+    (with GIT_DIR alone, the working directory is the top level); otherwise
+    walk up from cwd until a ``.git`` directory or ``.git`` file is found.
+    Cached per (cwd, GIT_DIR, GIT_WORK_TREE).
+    """
+    git_dir = os.path.join(cwd, env_git_dir) if env_git_dir else None
+    if env_work_tree:
+        work_tree = os.path.realpath(os.path.join(cwd, env_work_tree))
+        if git_dir is None:
+            found = _discover_repo(cwd, None, None)
+            git_dir = found[1] if found else os.path.join(work_tree, ".git")
+        return work_tree, os.path.normpath(git_dir)
+    if git_dir is not None:
+        return os.path.realpath(cwd), os.path.normpath(git_dir)
+
+    current = os.path.realpath(cwd)
+    while True:
+        candidate = os.path.join(current, ".git")
+        if os.path.isdir(candidate):
+            return current, candidate
+        if os.path.isfile(candidate):
+            resolved = _read_gitfile(candidate)
+            if resolved:
+                return current, resolved
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def discover_repo(cwd: Optional[Path] = None) -> Optional[Tuple[Path, Path]]:
+    """Locate the working tree and git directory in pure Python.
+
+    Args:
+        cwd: Directory to start from (defaults to the current directory)
+
+    Returns:
+        (work_tree, git_dir) tuple, or None if not inside a git repository
+
+    Example:
+        >>> found = discover_repo()
+        >>> if found:
+        ...     root, git_dir = found
+    """
+    try:
+        start = os.fspath(cwd) if cwd is not None else os.getcwd()
+    except OSError:
+        return None
+    found = _discover_repo(start, os.environ.get("GIT_DIR") or None,
+                           os.environ.get("GIT_WORK_TREE") or None)
+    if found is None:
+        return None
+    return Path(found[0]), Path(found[1])
+
+
+def git_dir_at(path: Path) -> Optional[Path]:
+    """Git directory of the repository whose top level is ``path``, if any.
+
+    Unlike discover_repo this neither walks up nor honors GIT_DIR, which
+    makes it suitable for scanning directory trees.
+    """
+    candidate = os.path.join(os.fspath(path), ".git")
+    if os.path.isdir(candidate):
+        return Path(candidate)
+    if os.path.isfile(candidate):
+        resolved = _read_gitfile(candidate)
+        return Path(resolved) if resolved else None
+    return None
+
+
+def common_git_dir(git_dir: Path) -> Path:
+    """The shared git directory (differs from git_dir for linked worktrees)."""
+    git_dir = Path(git_dir)
+    try:
+        text = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return git_dir
+    return Path(os.path.normpath(git_dir / text)) if text else git_dir
+
+
+def _git_config_get(path: Path, section: str, key: str) -> Optional[str]:
+    """Last value of ``section.key`` in one git config file (no includes)."""
+    try:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    value = None
+    current = None
+    for line in lines:
+        line = line.strip()
+        if line.startswith("["):
+            end = line.find("]")
+            current = line[1:end].strip().lower() if end > 0 else None
+            line = line[end + 1:].strip() if end > 0 else ""
+        if not line or line[0] in "#;" or current != section:
+            continue
+        name, sep, raw = line.partition("=")
+        if name.strip().lower() == key:
+            raw = raw.strip()
+            value = raw[1:-1] if len(raw) > 1 and raw[0] == raw[-1] == '"' else raw
+    return value
+
+
+def get_repo_config(git_dir: Path, section: str, key: str) -> Optional[str]:
+    """``section.key`` from the repository's own config file, or None.
+
+    Only the common dir's ``config`` is read; the key is matched
+    case-insensitively like git does.
+    """
+    return _git_config_get(common_git_dir(git_dir) / "config", section.lower(), key.lower())
+
+
+def get_hooks_dir(git_dir: Path, work_tree: Optional[Path] = None) -> Path:
+    """Directory git runs hooks from, honoring ``core.hooksPath``.
+
+    Reads the worktree, repository and global config files directly (in
+    git's precedence order; ``include`` directives are not followed).
+    Without core.hooksPath this is ``hooks/`` in the common git directory,
+    which all worktrees of a repository share.
+
+    Example:
+        >>> get_hooks_dir(Path(".git"))
+        PosixPath('.git/hooks')
+    """
+    common = common_git_dir(git_dir)
+    xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    for config in (Path(git_dir) / "config.worktree", common / "config",
+                   Path(os.path.expanduser("~")) / ".gitconfig", Path(xdg) / "git" / "config"):
+        configured = _git_config_get(config, "core", "hookspath")
+        if configured:
+            hooks = Path(os.path.expanduser(configured))
+            if not hooks.is_absolute():
+                hooks = Path(work_tree or common) / hooks
+            return hooks
+    return common / "hooks"
+
+
+def clear_repo_cache() -> None:
+    """Forget cached repository discovery results (e.g. after ``git init``)."""
+    _discover_repo.cache_clear()
+
+
+def get_repo_root(cwd: Optional[Path] = None) -> Optional[Path]:
     """Get the root directory of the current git repository.
 
+    Discovery walks the filesystem in pure Python and is cached per working
+    directory, so repeated calls on hot paths never spawn ``git``.
+
+    Args:
+        cwd: Directory to start from (defaults to the current directory)
+
     Returns:
         Path to repo root, or None if not in a git repo
 
@@ -41,20 +217,16 @@ def get_repo_root() -> Optional[Path]:
         >>> if root:
         ...     print(f"Repo root: {root}")
     """
-    try:
-        result = subprocess.check_output(
-            ["git", "rev-parse", "--show-toplevel"],
-            stderr=subprocess.DEVNULL,
-            text=True
-        )
-        return Path(result.strip())
-    except (subprocess.SubprocessError, OSError, FileNotFoundError):
-        return None
+    found = discover_repo(cwd)
+    return found[0] if found else None
 
 
 def get_commit_hash(short: bool = True) -> Optional[str]:
     """Get the current commit hash.
 
+    Answered by the repository's pooled ``git cat-file`` process, so
+    repeated calls do not start new git processes.
+
     Args:
         short: Return short hash (7 chars) if True, full hash if False
 
@@ -66,25 +238,68 @@ def get_commit_hash(short: bool = True) -> Optional[str]:
         >>> if hash:
         ...     print(f"Current commit: {hash}")
     """
+    from dot.gitpool import GitPoolError, get_pool
+
+    root = get_repo_root()
+    if root is None:
+        return None
     try:
-        args = ["git", "rev-parse"]
-        if short:
-            args.append("--short")
-        args.append("HEAD")
-
-        result = subprocess.check_output(
-            args,
-            stderr=subprocess.DEVNULL,
-            text=True
-        )
-        return result.strip()
-    except (subprocess.SubprocessError, OSError, FileNotFoundError):
+        sha = get_pool().resolve("HEAD", root)
+    except GitPoolError:
+        return None
+    if sha is None:
+        return None
+    return sha[:7] if short else sha
+
+
+# First-commit date cache, kept in the (common) git directory.
+CREATION_CACHE_FILE = "dot-creation.json"
+
+
+def _git_ok(args: list, cwd: Path) -> Optional[str]:
+    """stdout of a git command, or None if it failed."""
+    import subprocess
+
+    try:
+        result = subprocess.run(["git", *args], cwd=str(cwd), capture_output=True,
+                                text=True, check=False)
+    except (subprocess.SubprocessError, OSError):
         return None
+    return result.stdout if result.returncode == 0 else None
 
 
-def get_creation_date() -> Optional[datetime]:
+def _scan_roots(root: Path) -> Optional[list]:
+    """[(sha, author date)] of root commits in ``git log --reverse`` order."""
+    out = _git_ok(["log", "--reverse", "--format=%H %aI", "--max-parents=0", "HEAD"], root)
+    if not out:
+        return None
+    return [line.split(" ", 1) for line in out.splitlines() if " " in line]
+
+
+def _roots_unchanged(root: Path, old_head: str, head: str) -> bool:
+    """True if ``head`` descends from ``old_head`` and adds no root commits.
+
+    Both checks only touch commits added since ``old_head``, so they stay
+    cheap however long the history is.
+    """
+    if _git_ok(["merge-base", "--is-ancestor", old_head, head], root) is None:
+        return False
+    new_roots = _git_ok(["rev-list", "--max-parents=0", f"{old_head}..{head}"], root)
+    return new_roots is not None and not new_roots.strip()
+
+
+def get_creation_date(use_cache: bool = True) -> Optional[datetime]:
     """Get the creation date of the repository (first commit).
 
+    The answer of ``git log --reverse --max-parents=0 HEAD`` is cached in
+    the git directory together with the HEAD and root commits it was
+    computed for. A later HEAD that descends from the cached one and adds
+    no new root commits reuses it; anything else (rewritten history,
+    merged unrelated histories) triggers a full rescan.
+
+    Args:
+        use_cache: Read and update the cache (default True)
+
     Returns:
         datetime of first commit, or None if unable to determine
 
@@ -93,32 +308,88 @@ def get_creation_date() -> Optional[datetime]:
         >>> if created:
         ...     print(f"Repo created: {created.strftime('%Y-%m-%d')}")
     """
+    import json
+    from datetime import datetime
+
+    from dot.fsutil import atomic_write_text
+    from dot.gitobjects import GitObjectError, Repository
+
+    found = discover_repo()
+    if found is None:
+        return None
+    root, git_dir = found
+
     try:
-        result = subprocess.run(
-            [
-                "git",
-                "log",
-                "--reverse",
-                "--format=%aI",
-                "--max-parents=0",
-                "HEAD"
-            ],
-            capture_output=True,
-            text=True,
-            check=False
-        )
+        repository = Repository(git_dir)
+        head = repository.read_ref("HEAD")
+    except (GitObjectError, OSError):
+        head, use_cache = None, False
+    cache_file = repository.common_dir / CREATION_CACHE_FILE if use_cache else None
+
+    cached = None
+    if cache_file is not None and head:
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            if cached.get("head") != head and not _roots_unchanged(root, cached["head"], head):
+                cached = None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            cached = None
+
+    if cached is None:
+        roots = _scan_roots(root)
+        if not roots:
+            return None
+        cached = {"roots": [sha for sha, _ in roots], "date": roots[0][1]}
+    if cache_file is not None and head and cached.get("head") != head:
+        cached["head"] = head
+        try:
+            atomic_write_text(cache_file, json.dumps(cached))
+        except OSError:
+            pass  # read-only repository; answer without caching
 
-        if result.returncode == 0 and result.stdout.strip():
-            date_str = result.stdout.strip().split('\n')[0]
-            return datetime.fromisoformat(date_str)
+    try:
+        return datetime.fromisoformat(cached["date"])
+    except (ValueError, KeyError, TypeError):
         return None
-    except (subprocess.SubprocessError, OSError, FileNotFoundError, ValueError, IndexError):
+
+
+def get_current_branch(cwd: Optional[Path] = None) -> Optional[str]:
+    """Name of the checked-out branch, read from HEAD without running git.
+
+    Args:
+        cwd: Directory to start from (defaults to the current directory)
+
+    Returns:
+        Branch name, "HEAD" when detached (like ``git rev-parse
+        --abbrev-ref HEAD``), or None if not in a git repo
+
+    Example:
+        >>> get_current_branch()
+        'main'
+    """
+    found = discover_repo(cwd)
+    if found is None:
         return None
+    try:
+        head = (found[1] / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if head.startswith("ref:"):
+        ref = head[4:].strip()
+        return ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+    return "HEAD"
 
 
-def get_git_dir() -> Optional[Path]:
+def get_git_dir(cwd: Optional[Path] = None) -> Optional[Path]:
     """Get the .git directory path.
 
+    Uses the same cached pure-Python discovery as get_repo_root, so the
+    two always agree (GIT_DIR, ``.git`` files of worktrees) and neither
+    spawns ``git``.
+
+    Args:
+        cwd: Directory to start from (defaults to the current directory)
+
     Returns:
         Path to .git directory, or None if not in a git repo
 
@@ -127,12 +398,5 @@ def get_git_dir() -> Optional[Path]:
         >>> if git_dir:
         ...     hooks_dir = git_dir / "hooks"
     """
-    try:
-        result = subprocess.check_output(
-            ["git", "rev-parse", "--git-dir"],
-            stderr=subprocess.DEVNULL,
-            text=True
-        )
-        return Path(result.strip())
-    except (subprocess.SubprocessError, OSError, FileNotFoundError):
-        return None
+    found = discover_repo(cwd)
+    return found[1] if found else None
@@ -0,0 +1,665 @@
+"""
+Read-only access to git objects without running git.
+
+Reads loose objects and packfiles (index v2, zlib streams, OFS/REF delta
+chains) straight from ``.git/objects``, resolves refs from loose ref files
+and ``packed-refs``, and walks commit history. This lets validation and
+history scans run where spawning ``git`` is slow or not allowed.
+
+Only what THE DOT needs is implemented: objects are never written, and
+revision syntax is limited to names, full hashes, ``~N``/``^`` suffixes and
+``A..B`` ranges.
+
+Example:
+    >>> for sha, message in iter_range_messages("origin/main..HEAD"):
+    ...     print(sha[:8], message.splitlines()[0])
+"""
+
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import re
+import struct
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from dot.git_utils import common_git_dir
+
+OBJ_COMMIT = 1
+OBJ_TREE = 2
+OBJ_BLOB = 3
+OBJ_TAG = 4
+OBJ_OFS_DELTA = 6
+OBJ_REF_DELTA = 7
+
+TYPE_NAMES = {OBJ_COMMIT: "commit", OBJ_TREE: "tree", OBJ_BLOB: "blob", OBJ_TAG: "tag"}
+
+# Inflated delta bases kept in memory per store, in bytes.
+DEFAULT_CACHE_BYTES = 32 << 20
+
+_IDX_MAGIC = b"\377tOc"
+_HEX40 = re.compile(r"^[0-9a-f]{40}$")
+_SUFFIX = re.compile(r"(~\d*|\^\d?)$")
+
+
+class GitObjectError(Exception):
+    """A missing, corrupt or unsupported object, ref or revision."""
+
+
+class Commit(NamedTuple):
+    sha: str
+    tree: str
+    parents: Tuple[str, ...]
+    author: str
+    committer: str
+    commit_time: int
+    message: str
+
+
+# ---------------------------------------------------------------------------
+# Delta-base cache
+# ---------------------------------------------------------------------------
+
+class _LRUBytesCache:
+    """LRU mapping bounded by the total size of the cached values."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._data: "OrderedDict[tuple, Tuple[int, bytes]]" = OrderedDict()
+
+    def get(self, key):
+        item = self._data.get(key)
+        if item is not None:
+            self._data.move_to_end(key)
+        return item
+
+    def put(self, key, value: Tuple[int, bytes]) -> None:
+        cost = len(value[1])
+        if cost > self.max_bytes or key in self._data:
+            return
+        self._data[key] = value
+        self.size += cost
+        while self.size > self.max_bytes:
+            _, (_, old) = self._data.popitem(last=False)
+            self.size -= len(old)
+
+    def __len__(self):
+        return len(self._data)
+
+
+# ---------------------------------------------------------------------------
+# Packfiles
+# ---------------------------------------------------------------------------
+
+def _map(path: Path) -> mmap.mmap:
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class PackIndex:
+    """A version 2 ``.idx`` file: sorted object names -> pack offsets."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._data = _map(path)
+        data = self._data
+        if data[:4] != _IDX_MAGIC or struct.unpack(">I", data[4:8])[0] != 2:
+            raise GitObjectError(f"Unsupported pack index (only v2 is read): {path}")
+        self._fanout = struct.unpack(">256I", data[8:8 + 1024])
+        self.count = self._fanout[255]
+        self._names = 8 + 1024
+        self._offsets = self._names + 24 * self.count  # names (20) + crc32 (4)
+        self._large = self._offsets + 4 * self.count
+
+    def find(self, sha: bytes) -> Optional[int]:
+        """Pack offset of the 20-byte object name, or None."""
+        first = sha[0]
+        lo = self._fanout[first - 1] if first else 0
+        hi = self._fanout[first]
+        data, base = self._data, self._names
+        while lo < hi:
+            mid = (lo + hi) // 2
+            name = data[base + 20 * mid:base + 20 * mid + 20]
+            if name < sha:
+                lo = mid + 1
+            elif name > sha:
+                hi = mid
+            else:
+                return self._offset(mid)
+        return None
+
+    def _offset(self, i: int) -> int:
+        pos = self._offsets + 4 * i
+        off = struct.unpack(">I", self._data[pos:pos + 4])[0]
+        if off & 0x80000000:
+            pos = self._large + 8 * (off & 0x7FFFFFFF)
+            off = struct.unpack(">Q", self._data[pos:pos + 8])[0]
+        return off
+
+    def close(self):
+        self._data.close()
+
+
+class Pack:
+    """A ``.pack`` file and its index."""
+
+    def __init__(self, idx_path: Path):
+        self.index = PackIndex(idx_path)
+        self.path = idx_path.with_suffix(".pack")
+        self._data = _map(self.path)
+        if self._data[:4] != b"PACK":
+            raise GitObjectError(f"Not a packfile: {self.path}")
+
+    def header(self, offset: int) -> Tuple[int, int, int]:
+        """(type, inflated size, data position) of the entry at offset."""
+        data = self._data
+        c = data[offset]
+        type_ = (c >> 4) & 7
+        size = c & 15
+        shift = 4
+        pos = offset + 1
+        while c & 0x80:
+            c = data[pos]
+            pos += 1
+            size |= (c & 0x7F) << shift
+            shift += 7
+        return type_, size, pos
+
+    def ofs_delta_base(self, offset: int, pos: int) -> Tuple[int, int]:
+        """(base offset, delta data position) for an OFS_DELTA entry."""
+        data = self._data
+        c = data[pos]
+        pos += 1
+        rel = c & 0x7F
+        while c & 0x80:
+            c = data[pos]
+            pos += 1
+            rel = ((rel + 1) << 7) | (c & 0x7F)
+        return offset - rel, pos
+
+    def raw(self, start: int, end: int) -> bytes:
+        return self._data[start:end]
+
+    def inflate(self, pos: int, size: int) -> bytes:
+        """Inflate the zlib stream at pos, expected to produce size bytes."""
+        d = zlib.decompressobj()
+        out = []
+        chunk = max(size + 64, 4096)
+        data = self._data
+        while not d.eof:
+            if pos >= len(data):
+                raise GitObjectError(f"Truncated object in {self.path}")
+            out.append(d.decompress(data[pos:pos + chunk]))
+            pos += chunk
+        result = b"".join(out)
+        if len(result) != size:
+            raise GitObjectError(f"Corrupt object in {self.path}")
+        return result
+
+    def close(self):
+        self.index.close()
+        self._data.close()
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        c = data[pos]
+        pos += 1
+        value |= (c & 0x7F) << shift
+        shift += 7
+        if not c & 0x80:
+            return value, pos
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Rebuild an object from its base and a git delta."""
+    src_size, pos = _read_varint(delta, 0)
+    dst_size, pos = _read_varint(delta, pos)
+    if src_size != len(base):
+        raise GitObjectError("Delta base size mismatch")
+    out = bytearray()
+    end = len(delta)
+    while pos < end:
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            off = n = 0
+            for i in range(4):
+                if op & (1 << i):
+                    off |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if op & (0x10 << i):
+                    n |= delta[pos] << (8 * i)
+                    pos += 1
+            out += base[off:off + (n or 0x10000)]
+        elif op:
+            out += delta[pos:pos + op]
+            pos += op
+        else:
+            raise GitObjectError("Invalid delta opcode 0")
+    if len(out) != dst_size:
+        raise GitObjectError("Delta result size mismatch")
+    return bytes(out)
+
+
+# ---------------------------------------------------------------------------
+# Object store
+# ---------------------------------------------------------------------------
+
+class ObjectStore:
+    """Read objects from ``objects/`` (loose, packs and alternates)."""
+
+    def __init__(self, git_dir: Path, cache_bytes: int = DEFAULT_CACHE_BYTES):
+        self.git_dir = Path(git_dir)
+        self.common_dir = common_git_dir(self.git_dir)
+        self.object_dirs = self._object_dirs(self.common_dir / "objects")
+        self.cache = _LRUBytesCache(cache_bytes)
+        self._packs: Optional[List[Pack]] = None
+
+    @staticmethod
+    def _object_dirs(objects: Path) -> List[Path]:
+        dirs = [objects]
+        try:
+            lines = (objects / "info" / "alternates").read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return dirs
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                dirs.append((objects / line).resolve())
+        return dirs
+
+    @property
+    def packs(self) -> List[Pack]:
+        if self._packs is None:
+            self._packs = []
+            for objects in self.object_dirs:
+                for idx in sorted((objects / "pack").glob("*.idx")):
+                    if idx.with_suffix(".pack").exists():
+                        self._packs.append(Pack(idx))
+        return self._packs
+
+    def read(self, sha: str) -> Tuple[str, bytes]:
+        """Return ``(type name, content)`` for a 40-hex object name.
+
+        Raises:
+            GitObjectError: if the object is missing or unreadable.
+        """
+        type_, data = self._read(sha, retry=True)
+        return TYPE_NAMES[type_], data
+
+    def _read(self, sha: str, retry: bool) -> Tuple[int, bytes]:
+        for objects in self.object_dirs:
+            path = objects / sha[:2] / sha[2:]
+            try:
+                raw = zlib.decompress(path.read_bytes())
+            except FileNotFoundError:
+                continue
+            except zlib.error as e:
+                raise GitObjectError(f"Corrupt loose object {sha}: {e}") from None
+            header, _, body = raw.partition(b"\0")
+            kind = header.split(b" ", 1)[0].decode("ascii")
+            type_ = {v: k for k, v in TYPE_NAMES.items()}[kind]
+            return type_, body
+
+        name = bytes.fromhex(sha)
+        for pack in self.packs:
+            offset = pack.index.find(name)
+            if offset is not None:
+                return self._read_packed(pack, offset)
+
+        if retry and self._packs is not None:
+            # A repack may have happened since the packs were listed
+            self.close()
+            return self._read(sha, retry=False)
+        raise GitObjectError(f"Object not found: {sha}")
+
+    def _read_packed(self, pack: Pack, offset: int) -> Tuple[int, bytes]:
+        """Resolve the entry at offset, walking its delta chain iteratively."""
+        chain: List[Tuple[tuple, bytes]] = []
+        while True:
+            key = base_key = (pack.path, offset)
+            cached = self.cache.get(key)
+            if cached is not None:
+                type_, data = cached
+                break
+            type_, size, pos = pack.header(offset)
+            if type_ == OBJ_OFS_DELTA:
+                base_offset, pos = pack.ofs_delta_base(offset, pos)
+                chain.append((key, pack.inflate(pos, size)))
+                offset = base_offset
+                continue
+            if type_ == OBJ_REF_DELTA:
+                base_name = pack.raw(pos, pos + 20)
+                chain.append((key, pack.inflate(pos + 20, size)))
+                base_offset = pack.index.find(base_name)
+                if base_offset is not None:
+                    offset = base_offset
+                    continue
+                # Base outside this pack (thin pack, loose object): it has
+                # no entry here, and offset is still the delta's own
+                type_, data = self._read(base_name.hex(), retry=False)
+                base_key = None
+                break
+            if type_ not in TYPE_NAMES:
+                raise GitObjectError(f"Bad object type {type_} in {pack.path}")
+            data = pack.inflate(pos, size)
+            break
+
+        if chain and base_key is not None:
+            # The object we stopped at is a delta base; keep it warm
+            self.cache.put(base_key, (type_, data))
+        for i in range(len(chain) - 1, -1, -1):
+            key, delta = chain[i]
+            data = apply_delta(data, delta)
+            if i:
+                self.cache.put(key, (type_, data))
+        return type_, data
+
+    def close(self):
+        for pack in self._packs or ():
+            pack.close()
+        self._packs = None
+
+
+# ---------------------------------------------------------------------------
+# Refs and revisions
+# ---------------------------------------------------------------------------
+
+class Repository:
+    """Objects, refs and commit history of one repository."""
+
+    def __init__(self, git_dir: Path, cache_bytes: int = DEFAULT_CACHE_BYTES):
+        self.git_dir = Path(git_dir)
+        self.objects = ObjectStore(self.git_dir, cache_bytes)
+        self.common_dir = self.objects.common_dir
+        self._packed_refs: Optional[Dict[str, str]] = None
+        self.shallow = self._read_shallow()
+
+    @classmethod
+    def discover(cls, path: Optional[Path] = None) -> "Repository":
+        """Open the repository containing path (default: current directory)."""
+        from dot.git_utils import discover_repo
+
+        found = discover_repo(path)
+        if found is None:
+            raise GitObjectError(f"Not a git repository: {path or os.getcwd()}")
+        return cls(found[1])
+
+    def _read_shallow(self) -> Set[str]:
+        try:
+            return set((self.common_dir / "shallow").read_text(encoding="ascii").split())
+        except OSError:
+            return set()
+
+    @property
+    def packed_refs(self) -> Dict[str, str]:
+        if self._packed_refs is None:
+            refs = {}
+            try:
+                lines = (self.common_dir / "packed-refs").read_text(encoding="utf-8").splitlines()
+            except OSError:
+                lines = []
+            for line in lines:
+                if not line or line[0] in "#^":
+                    continue
+                sha, _, name = line.partition(" ")
+                refs[name.strip()] = sha
+            self._packed_refs = refs
+        return self._packed_refs
+
+    def read_ref(self, name: str) -> Optional[str]:
+        """Object name a ref points to, following symbolic refs."""
+        for _ in range(10):
+            # HEAD and other pseudo-refs are per worktree; refs/ are shared
+            base = self.git_dir if "/" not in name else self.common_dir
+            try:
+                value = (base / name).read_text(encoding="utf-8").strip()
+            except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+                value = self.packed_refs.get(name)
+            except OSError:
+                return None
+            if value is None:
+                return None
+            if value.startswith("ref:"):
+                name = value[4:].strip()
+                continue
+            return value if _HEX40.match(value) else None
+        raise GitObjectError(f"Symbolic ref loop at {name}")
+
+    def resolve(self, rev: str) -> str:
+        """Resolve a revision (name, hash, ``~N``/``^`` suffixes) to a commit."""
+        steps: List[str] = []
+        while True:
+            m = _SUFFIX.search(rev)
+            if not m:
+                break
+            steps.append(m.group(1))
+            rev = rev[:m.start()]
+        sha = self._resolve_name(rev or "HEAD")
+        sha = self.peel(sha)
+        for step in reversed(steps):
+            if step[0] == "~":
+                for _ in range(int(step[1:] or 1)):
+                    sha = self._parent(sha, 1, rev)
+            else:
+                n = int(step[1:] or 1)
+                if n:
+                    sha = self._parent(sha, n, rev)
+        return sha
+
+    def _parent(self, sha: str, n: int, rev: str) -> str:
+        parents = self.commit(sha).parents
+        if len(parents) < n:
+            raise GitObjectError(f"Revision has no parent {n}: {rev}")
+        return parents[n - 1]
+
+    def _resolve_name(self, name: str) -> str:
+        if _HEX40.match(name):
+            return name
+        for candidate in (name, f"refs/{name}", f"refs/tags/{name}", f"refs/heads/{name}",
+                          f"refs/remotes/{name}", f"refs/remotes/{name}/HEAD"):
+            sha = self.read_ref(candidate)
+            if sha:
+                return sha
+        raise GitObjectError(f"Unknown revision: {name}")
+
+    def peel(self, sha: str) -> str:
+        """Follow annotated tags down to the commit they point at."""
+        for _ in range(20):
+            type_, data = self.objects.read(sha)
+            if type_ == "commit":
+                return sha
+            if type_ != "tag":
+                raise GitObjectError(f"{sha} is a {type_}, not a commit")
+            sha = data.split(b"\n", 1)[0].split(b" ", 1)[1].decode("ascii")
+        raise GitObjectError(f"Tag chain too long at {sha}")
+
+    def commit(self, sha: str) -> Commit:
+        """Parse the commit object sha.
+
+        Not memoized here: a walk keeps the commits it loads only for its
+        own duration, so a long-lived Repository does not grow with history.
+        """
+        type_, data = self.objects.read(sha)
+        if type_ != "commit":
+            raise GitObjectError(f"{sha} is a {type_}, not a commit")
+        commit = parse_commit(sha, data)
+        if sha in self.shallow:
+            commit = commit._replace(parents=())
+        return commit
+
+    def walk(self, include: Iterable[str], exclude: Iterable[str] = ()) -> Iterator[Commit]:
+        """Commits reachable from include but not exclude, newest first."""
+        return walk_commits(self.commit, include, exclude)
+
+    def walk_range(self, rev_range: str) -> Iterator[Commit]:
+        """Walk ``A..B``, ``^A B`` or a single revision."""
+        include, exclude = split_range(rev_range)
+        return self.walk([self.resolve(r) for r in include], [self.resolve(r) for r in exclude])
+
+    def close(self):
+        self.objects.close()
+
+
+def split_range(rev_range: str) -> Tuple[List[str], List[str]]:
+    """Split ``A..B``/``^A B``/``B`` into (included, excluded) revisions.
+
+    Raises:
+        GitObjectError: for symmetric ``A...B`` ranges.
+    """
+    if "..." in rev_range:
+        raise GitObjectError(f"Symmetric ranges are not supported: {rev_range}")
+    include, exclude = [], []
+    for part in rev_range.split():
+        if ".." in part:
+            left, _, right = part.partition("..")
+            exclude.append(left or "HEAD")
+            include.append(right or "HEAD")
+        elif part.startswith("^"):
+            exclude.append(part[1:])
+        else:
+            include.append(part)
+    return include, exclude
+
+
+# Extra uninteresting commits walked after the walk could otherwise stop,
+# in case of clock skew (git's SLOP).
+WALK_SLOP = 5
+
+
+def walk_commits(load: Callable[[str], Commit], include: Iterable[str],
+                 exclude: Iterable[str] = ()) -> Iterator[Commit]:
+    """Commits reachable from include but not exclude, newest first.
+
+    Ordered by committer date like ``git log``'s default order. ``load``
+    maps a commit hash to its parsed Commit, so any object source works;
+    each commit is loaded at most once per walk.
+
+    Excluded commits are walked in the same date-ordered queue, passing
+    their "uninteresting" mark on to their parents, and the walk stops once
+    only uninteresting commits are left (plus WALK_SLOP more, as git does).
+    An ``A..B`` range therefore costs about the commits between A and B,
+    not the whole history behind A. With exclusions, the range is collected
+    before the first commit is yielded.
+    """
+    commits: Dict[str, Commit] = {}
+    hidden: Set[str] = set()
+    done: Set[str] = set()
+    queue: List[Tuple[int, int, str]] = []
+    queued_interesting = 0
+    counter = 0
+
+    def push(sha: str) -> None:
+        nonlocal counter, queued_interesting
+        commit = commits[sha] = load(sha)
+        heapq.heappush(queue, (-commit.commit_time, counter, sha))
+        counter += 1
+        if sha not in hidden:
+            queued_interesting += 1
+
+    def hide(sha: str) -> None:
+        # Commits already walked pass the mark down to their ancestors
+        nonlocal queued_interesting
+        stack = [sha]
+        while stack:
+            sha = stack.pop()
+            if sha in hidden:
+                continue
+            hidden.add(sha)
+            if sha in done:
+                stack.extend(commits[sha].parents)
+            elif sha in commits:
+                queued_interesting -= 1
+
+    for sha in exclude:
+        hide(sha)
+    for sha in [*exclude, *include]:
+        if sha not in commits:
+            push(sha)
+
+    limited = bool(hidden)
+    found: List[Commit] = []
+    last_date: Optional[int] = None
+    slop = WALK_SLOP
+    while queue:
+        _, _, sha = heapq.heappop(queue)
+        commit = commits[sha]
+        done.add(sha)
+        if sha not in hidden:
+            queued_interesting -= 1
+        for parent in commit.parents:
+            if parent not in commits:
+                if sha in hidden:
+                    hidden.add(parent)
+                push(parent)
+            elif sha in hidden:
+                hide(parent)
+        if sha in hidden:
+            if not queue:
+                break
+            newest = -queue[0][0]
+            if queued_interesting or (last_date is not None and last_date <= newest):
+                slop = WALK_SLOP
+            else:
+                slop -= 1
+                if not slop:
+                    break
+            continue
+        if not limited:
+            yield commit
+            continue
+        last_date = commit.commit_time
+        found.append(commit)
+    for commit in found:
+        if commit.sha not in hidden:
+            yield commit
+
+
+def parse_commit(sha: str, data: bytes) -> Commit:
+    """Parse raw commit object content."""
+    headers, _, message = data.partition(b"\n\n")
+    tree = ""
+    parents = []
+    author = committer = ""
+    for line in headers.split(b"\n"):
+        if line.startswith(b" "):
+            continue  # continuation of a multi-line header (gpgsig)
+        key, _, value = line.partition(b" ")
+        if key == b"tree":
+            tree = value.decode("ascii")
+        elif key == b"parent":
+            parents.append(value.decode("ascii"))
+        elif key == b"author":
+            author = value.decode("utf-8", "replace")
+        elif key == b"committer":
+            committer = value.decode("utf-8", "replace")
+    try:
+        commit_time = int(committer.rsplit(" ", 2)[1])
+    except (IndexError, ValueError):
+        commit_time = 0
+    return Commit(sha, tree, tuple(parents), author, committer, commit_time,
+                  message.decode("utf-8", "replace"))
+
+
+def iter_range_messages(rev_range: str, repo: Optional[Path] = None) -> Iterator[Tuple[str, str]]:
+    """Yield ``(sha, message)`` for each commit in ``rev_range`` without git.
+
+    Drop-in counterpart of ``dot.batch.iter_commit_messages``.
+
+    Raises:
+        GitObjectError: for unknown revisions or unreadable objects.
+    """
+    repository = Repository.discover(Path(repo) if repo else None)
+    try:
+        for commit in repository.walk_range(rev_range):
+            yield commit.sha, commit.message
+    finally:
+        repository.close()
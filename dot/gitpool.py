@@ -0,0 +1,271 @@
+"""
+Persistent git coprocesses for THE DOT.
+
+Running ``git`` once per lookup costs a fork and exec every time. GitPool
+keeps one ``git cat-file --batch`` (contents) and one ``--batch-check``
+(name, type, size) process per repository and speaks their line protocol,
+so thousands of lookups share one pipe.
+
+Processes are health-checked before reuse, replaced if they die, closed
+after sitting idle for ``idle_timeout`` seconds and shut down at exit.
+
+``git rev-list`` has no request/response mode (it reads all of its input
+before answering), so history walks are served from cat-file lookups.
+
+Example:
+    >>> pool = get_pool()
+    >>> pool.resolve("HEAD")
+    '3f2a...'
+    >>> [c.sha for c in pool.iter_commits("main..HEAD")]
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+
+from dot.gitobjects import Commit, parse_commit, split_range, walk_commits
+
+# Seconds a coprocess may sit unused before it is closed.
+DEFAULT_IDLE_TIMEOUT = 60.0
+
+
+class GitPoolError(Exception):
+    """A coprocess could not be started, died, or answered nonsense."""
+
+
+class GitObject(NamedTuple):
+    sha: str
+    type: str
+    size: int
+    data: Optional[bytes]  # None for --batch-check lookups
+
+
+class CatFile:
+    """One ``git cat-file --batch`` or ``--batch-check`` coprocess."""
+
+    def __init__(self, repo: Path, check: bool = False):
+        import subprocess
+
+        self.repo = Path(repo)
+        self.check = check
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self.requests = 0
+        try:
+            self.proc = subprocess.Popen(
+                ["git", "cat-file", "--batch-check" if check else "--batch"],
+                cwd=str(self.repo),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise GitPoolError(f"Unable to start git cat-file: {e}") from None
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def query(self, rev: str) -> Optional[GitObject]:
+        """Look up one object name or revision expression.
+
+        Returns:
+            GitObject, or None if git reports it missing or ambiguous.
+
+        Raises:
+            GitPoolError: if the process is gone or the reply is malformed.
+        """
+        if not rev or "\n" in rev:
+            return None
+        with self.lock:
+            self.last_used = time.monotonic()
+            try:
+                self.proc.stdin.write(rev.encode("utf-8") + b"\n")
+                self.proc.stdin.flush()
+                header = self.proc.stdout.readline()
+            except (OSError, ValueError) as e:
+                raise GitPoolError(f"git cat-file pipe failed: {e}") from None
+            if not header:
+                raise GitPoolError(f"git cat-file exited in {self.repo}")
+            if header.endswith((b" missing\n", b" ambiguous\n")):
+                return None
+            parts = header.split()
+            if len(parts) != 3 or not parts[2].isdigit():
+                raise GitPoolError(f"Unexpected reply from git cat-file: {header!r}")
+            sha, type_, size = parts[0].decode("ascii"), parts[1].decode("ascii"), int(parts[2])
+            data = None
+            if not self.check:
+                data = self.proc.stdout.read(size + 1)
+                if len(data) != size + 1:
+                    raise GitPoolError(f"Short read from git cat-file for {rev}")
+                data = data[:-1]
+            self.requests += 1
+            return GitObject(sha, type_, size, data)
+
+    def close(self) -> None:
+        import subprocess
+
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        self.proc.stdout.close()
+
+
+class GitPool:
+    """Coprocesses keyed by (repository, batch mode)."""
+
+    def __init__(self, idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self.spawned = 0
+        self._procs: Dict[Tuple[str, bool], CatFile] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Timer] = None
+
+    def __len__(self):
+        return len(self._procs)
+
+    @staticmethod
+    def _repo_key(repo: Optional[Path]) -> str:
+        if repo is None:
+            from dot.git_utils import get_repo_root
+
+            repo = get_repo_root() or Path.cwd()
+        return os.path.realpath(repo)
+
+    def _get(self, repo: Optional[Path], check: bool) -> CatFile:
+        key = (self._repo_key(repo), check)
+        with self._lock:
+            self.reap_idle()
+            proc = self._procs.get(key)
+            if proc is not None and not proc.alive():
+                proc.close()
+                proc = None
+            if proc is None:
+                proc = CatFile(Path(key[0]), check)
+                self._procs[key] = proc
+                self.spawned += 1
+            self._schedule_reaper()
+            return proc
+
+    def _discard(self, proc: CatFile) -> None:
+        with self._lock:
+            key = (str(proc.repo), proc.check)
+            if self._procs.get(key) is proc:
+                del self._procs[key]
+        proc.close()
+
+    def _query(self, rev: str, repo: Optional[Path], check: bool) -> Optional[GitObject]:
+        proc = self._get(repo, check)
+        try:
+            return proc.query(rev)
+        except GitPoolError:
+            # The process may have died between the health check and the
+            # request; one fresh process gets one more try.
+            self._discard(proc)
+            return self._get(repo, check).query(rev)
+
+    def cat_file(self, rev: str, repo: Optional[Path] = None) -> Optional[GitObject]:
+        """Type, size and contents of ``rev`` (None if it does not exist)."""
+        return self._query(rev, repo, check=False)
+
+    def info(self, rev: str, repo: Optional[Path] = None) -> Optional[GitObject]:
+        """Name, type and size of ``rev`` without its contents."""
+        return self._query(rev, repo, check=True)
+
+    def resolve(self, rev: str, repo: Optional[Path] = None) -> Optional[str]:
+        """Full hash of the commit ``rev`` points at, or None."""
+        obj = self.info(f"{rev}^{{commit}}", repo)
+        return obj.sha if obj else None
+
+    def commit(self, rev: str, repo: Optional[Path] = None) -> Commit:
+        """Parsed commit for ``rev``.
+
+        Raises:
+            GitPoolError: if ``rev`` does not name a commit.
+        """
+        obj = self.cat_file(f"{rev}^{{commit}}", repo)
+        if obj is None:
+            raise GitPoolError(f"Unknown commit: {rev}")
+        return parse_commit(obj.sha, obj.data)
+
+    def iter_commits(self, rev_range: str, repo: Optional[Path] = None) -> Iterator[Commit]:
+        """Commits in ``rev_range`` newest first, like ``git log``.
+
+        Raises:
+            GitPoolError: for unknown revisions.
+        """
+        include, exclude = split_range(rev_range)
+        cache: Dict[str, Commit] = {}
+
+        def load(sha: str) -> Commit:
+            commit = cache.get(sha)
+            if commit is None:
+                commit = cache[sha] = self.commit(sha, repo)
+            return commit
+
+        return walk_commits(
+            load,
+            [load(r).sha for r in include],
+            [load(r).sha for r in exclude],
+        )
+
+    def reap_idle(self, now: Optional[float] = None) -> int:
+        """Close processes idle longer than ``idle_timeout``; return how many."""
+        if self.idle_timeout is None:
+            return 0
+        now = time.monotonic() if now is None else now
+        stale = [
+            key for key, proc in self._procs.items()
+            if now - proc.last_used > self.idle_timeout and not proc.lock.locked()
+        ]
+        for key in stale:
+            self._procs.pop(key).close()
+        return len(stale)
+
+    def _schedule_reaper(self) -> None:
+        # Long-lived callers (the daemon) may stop asking; a daemon timer
+        # makes sure idle processes still go away.
+        if self._reaper is not None or not self.idle_timeout:
+            return
+        self._reaper = threading.Timer(self.idle_timeout, self._reap_tick)
+        self._reaper.daemon = True
+        self._reaper.start()
+
+    def _reap_tick(self) -> None:
+        with self._lock:
+            self._reaper = None
+            self.reap_idle()
+            if self._procs:
+                self._schedule_reaper()
+
+    def close(self) -> None:
+        """Close every coprocess."""
+        with self._lock:
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+            procs, self._procs = list(self._procs.values()), {}
+        for proc in procs:
+            proc.close()
+
+
+_POOL: Optional[GitPool] = None
+
+
+def get_pool() -> GitPool:
+    """The process-wide pool, closed automatically at exit."""
+    global _POOL
+    if _POOL is None:
+        _POOL = GitPool()
+        atexit.register(_POOL.close)
+    return _POOL
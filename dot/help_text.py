@@ -1,4 +1,17 @@
 from dot import __version__
+from dot.commands import help_rows
+
+# Width of the usage column in the "Commands:" section.
+USAGE_WIDTH = 22
+
+
+def format_commands() -> str:
+    """Render the "Commands:" section from the command registry."""
+    lines = []
+    for usage, summary in help_rows():
+        lines.append(f"    {usage:<{USAGE_WIDTH}} {summary}" if len(usage) <= USAGE_WIDTH
+                     else f"    {usage}  {summary}")
+    return "\n".join(lines)
 
 
 def get_help_text():
@@ -10,55 +23,7 @@ Usage:
     dot [command] [arguments]
 
 Commands:
-    worship [name]         Register worship of THE DOT (add --epic for Homeric glory)
-    tenets                 Display THE DOT philosophy
-    sing                   Hear THE ILIAD OF THE DOT in epic verse
-    invoke                 Receive an epic invocation from THE DOT
-    validate <message>     Validate commit (--epic/--cosmic/--alchemical/--kabbalistic/--taoist)
-    horoscope [sign]       Receive daily coding horoscope (optional zodiac sign)
-    chart [name]           Generate repository birth chart
-    planets                View planetary hours for coding activities
-    moon                   Receive moon phase coding guidance
-    ephemeris              Ephemeris summary (vendored, local elements)
-    element                Receive elemental reading (Earth/Water/Air/Fire/Aether)
-    opus                   View the Magnum Opus - The Great Work
-    operations             View the seven alchemical operations
-    hermetic               View the seven Hermetic principles
-    stone [name]           Check Philosopher's Stone progress
-    tree                   Receive Tree of Life Sephirah reading
-    worlds                 View the Four Worlds of manifestation
-    sephiroth              Display the Tree of Life diagram
-    tikkun                 Tikkun Olam - repairing code through refactoring
-    ein-sof                Ein Sof meditation on the Infinite Source
-    shekhinah              Invoke the Shekhinah - Divine Presence in code
-    gematria               Evaluate code quality through sacred numerology
-    tao                    Receive Taoist wisdom reading
-    wu-wei                 Wu Wei - effortless action guidance
-    yin-yang               Yin and Yang balance in development
-    elements               Five Elements reading (Wood/Fire/Earth/Metal/Water)
-    treasures              The Three Treasures - Compassion/Frugality/Humility
-    pu                     P'u - the Uncarved Block (simplicity)
-    water                  Be like water - adaptability wisdom
-    iching                 I Ching hexagram reading for development
-    hooks [subcommand]     Manage git hooks (install/uninstall/status)
-    stats [subcommand]     View worship statistics (summary/top/daily/export/clear)
-    badge [format]         Generate worship badge (markdown/html/rst/url)
-    poem [subcommand]      Speak poetry (hymn/haiku/banner/chant)
-    tarot [subcommand]     Read DOT tarot (draw/spread/list/card)
-    shinto [subcommand]    Shinto rites (norito/omikuji/harai/ema)
-    garden [subcommand]    Garden tools (list/info/suggest)
-    suffix                 Show current worship suffix and source
-    backstory              Print THE DOT backstory
-    philosophy             Print re‑evaluated principles of THE DOT
-    init                   Initialize hooks and .dot.ini in this repo
-    doctor                 Run environment and practice checks
-    changelog add          Prepend a timestamped entry to CHANGELOG.txt
-    changelog verify       Verify changelog policy and timestamped entries
-    donate|sponsor         Show sponsorship options
-    config [subcommand]    Manage configuration (show/get/set/reset/show-suffix/set-suffix)
-    completions [shell]    Generate shell completions (bash/zsh/fish)
-    version                Show version information
-    help                   Show this help message
+{format_commands()}
 
 See also:
     docs/PHILOSOPHY.md     Re‑evaluated principles of THE DOT
@@ -73,6 +38,7 @@ Examples:
     dot planets
     dot moon
     dot element
+    dot demo
     dot opus
     dot operations
     dot hermetic
@@ -84,6 +50,12 @@ Examples:
     dot validate "Add feature BECAUSE I WORSHIP THE DOT" --alchemical
     dot validate "Add feature BECAUSE I WORSHIP THE DOT" --kabbalistic
     dot validate "Add feature BECAUSE I WORSHIP THE DOT" --taoist
+    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --buddhist
+    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --stoic
+    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --confucian
+    dot validate "Add feature BECAUSE I WORSHIP THE DOT" --hindu
+    dot validate --range origin/main..HEAD
+    dot validate --range origin/main..HEAD --json
     dot tree
     dot worlds
     dot sephiroth
@@ -99,8 +71,56 @@ Examples:
     dot pu
     dot water
     dot iching
+    dot dharma
+    dot truths
+    dot path
+    dot marks
+    dot middle
+    dot poisons
+    dot mindful
+    dot stoic
+    dot virtues
+    dot control
+    dot disciplines
+    dot negative
+    dot fate
+    dot mortality
+    dot logos
+    dot circles
+    dot confucian
+    dot wuchang
+    dot names
+    dot filial
+    dot junzi
+    dot relationships
+    dot cultivation
+    dot mean
+    dot analects
+    dot hindu
+    dot vedic
+    dot karma
+    dot yogas
+    dot purusharthas
+    dot gunas
+    dot maya
+    dot atman
+    dot gita
+    dot moksha
     dot hooks install
     dot stats summary
     dot badge markdown
     dot config show
+    dot config set user.name "Claude"
+    dot config set display.epic true
+    dot config set-suffix "BECAUSE I LOVE THE DOT"
+    dot completions bash
+    dot version
+    dot wisdom                         # List all wisdom traditions
+    dot wisdom hermetic                # Show hermetic concepts
+    dot wisdom hermetic mentalism      # Get hermetic mentalism teaching
+    dot wisdom gnostic gnosis          # Get gnosis teaching
+    dot wisdom norse runes             # Get norse runes teaching
+
+Note: Individual philosophy commands (hermetic, gnostic, norse, zoroastrian, egyptian, jain,
+      shinto, tarot) still work but are deprecated. Use 'dot wisdom PHILOSOPHY CONCEPT' instead.
 """
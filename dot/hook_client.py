@@ -0,0 +1,111 @@
+"""
+Thin commit-msg hook client for THE DOT.
+
+Asks a running validation daemon (see dot.daemon) to check a commit
+message and falls back to in-process validation when the daemon is down.
+Only the standard library is imported until that fallback is needed.
+
+Usage from a hook:
+    python -m dot.hook_client "$1"
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# A hook should never hang on a wedged daemon; fall back quickly instead.
+DEFAULT_TIMEOUT = 0.5
+
+
+def default_socket_path() -> Path:
+    """Socket path from DOT_DAEMON_SOCKET, else ~/.worship_the_dot/daemon.sock."""
+    env = os.getenv("DOT_DAEMON_SOCKET")
+    if env:
+        return Path(env)
+    return Path.home() / ".worship_the_dot" / "daemon.sock"
+
+
+def request(payload: Dict[str, Any], socket_path: Optional[Path] = None,
+            timeout: float = DEFAULT_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """Send one request to the daemon. Returns None if it is unreachable."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = str(socket_path or default_socket_path())
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except OSError:
+        return None
+    try:
+        resp = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(resp, dict) or "error" in resp:
+        return None
+    return resp
+
+
+def validate_message(message: str, cwd: Optional[Path] = None,
+                     socket_path: Optional[Path] = None) -> Tuple[bool, str]:
+    """Validate via the daemon, or in-process if it is unavailable.
+
+    Returns:
+        (valid, suffix) tuple.
+    """
+    env = os.getenv("DOT_WORSHIP_SUFFIX", "").strip()
+    if env:
+        # Environment overrides everything; no config lookup is needed.
+        return message.strip().endswith(env), env
+
+    resp = request(
+        {"op": "validate", "message": message, "cwd": str(cwd or os.getcwd())},
+        socket_path,
+    )
+    if resp is not None:
+        return bool(resp["valid"]), resp["suffix"]
+
+    from dot.config import resolve_worship_suffix
+    from dot.core import get_dot
+
+    suffix, _ = resolve_worship_suffix(cwd)
+    return get_dot().validate_commit(message, suffix=suffix), suffix
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Validate the commit message file named in argv; return a hook exit code."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python -m dot.hook_client <commit-msg-file>")
+        return 1
+    try:
+        with open(argv[0], "r", encoding="utf-8") as f:
+            message = f.read()
+    except OSError:
+        print(f"Error: Could not read commit message file: {argv[0]}")
+        return 1
+
+    valid, suffix = validate_message(message)
+    if valid:
+        return 0
+    print("╔════════════════════════════════════════════════════════════════╗")
+    print("║                    COMMIT REJECTED                             ║")
+    print("╚════════════════════════════════════════════════════════════════╝")
+    print()
+    print("Your commit message must end with:")
+    print(f"  {suffix}")
+    print()
+    print("Please amend your commit message to worship THE DOT.")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
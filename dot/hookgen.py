@@ -0,0 +1,739 @@
+"""
+Generated git hooks for THE DOT.
+
+``dot hooks install`` renders the commit-msg and prepare-commit-msg hooks
+instead of copying fixed scripts. Each hook embeds a snapshot of the
+suffix resolved at install time and the ``.dot.ini`` paths it came from.
+At commit time the hook stays in pure shell unless configuration changed:
+
+1. A non-empty ``DOT_WORSHIP_SUFFIX`` wins, as in ``resolve_worship_suffix``.
+2. ``$GIT_DIR/dot-suffix.cache`` holds the last resolved suffix and which
+   config files existed. If no config file is newer than the cache (``-nt``)
+   and none appeared or vanished, the cached suffix is used.
+3. Otherwise the hook asks ``python -m dot.cli suffix --raw`` once and
+   rewrites the cache, falling back to the embedded snapshot if that fails.
+
+install_all does the same for every repository and worktree under a
+directory, in parallel, skipping hooks that are already byte-identical.
+
+With ``--shared`` hooks are not copied at all: publish_store writes them
+once to a content-addressed store (``~/.worship_the_dot/hooks/<hash>/``
+plus a ``current`` symlink) and link_repo points ``core.hooksPath`` at it.
+Upgrading swaps the symlink, so every linked repository changes at once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shlex
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from dot.config import config_search_paths, resolve_worship_suffix
+from dot.fsutil import atomic_write_bytes, atomic_write_text, file_lock
+from dot.git_utils import common_git_dir, get_hooks_dir, get_repo_config, git_dir_at
+
+HOOK_NAMES = ("commit-msg", "prepare-commit-msg")
+_PACKAGE_PARENT = Path(__file__).resolve().parent.parent
+CACHE_FILE = "dot-suffix.cache"
+
+# Client-side hooks the shared store forwards to each repository's own
+# hooks, so pointing core.hooksPath at the store does not disable them.
+# reference-transaction and post-index-change are left out on purpose: git
+# would start a shell for every ref update or index write.
+FORWARDED_HOOKS = (
+    "applypatch-msg", "pre-applypatch", "post-applypatch", "pre-commit",
+    "pre-merge-commit", "post-commit", "pre-rebase", "post-checkout",
+    "post-merge", "pre-push", "post-rewrite", "pre-auto-gc",
+    "push-to-checkout", "sendemail-validate",
+)
+
+# In the common git dir of a repository linked to the shared store: line 1
+# is the hooks directory it used before (forwarded hooks run from there),
+# line 2 its previous core.hooksPath, empty if it had none.
+BACKUP_FILE = "dot-hooks.backup"
+
+# Marks hooks written by this module; never backed up or chained to.
+GENERATED_MARKER = "# THE DOT generated hook"
+
+_LOCATE = r'''
+dot_git_dir() {
+    [ -n "${DOT_GIT_DIR-}" ] && return
+    # git does not export GIT_DIR to every hook, but hooks run from the top
+    # of the worktree: read .git there and only ask git when it is missing
+    local line=""
+    if [ -n "${GIT_DIR-}" ]; then
+        DOT_GIT_DIR=$GIT_DIR
+    elif [ -d .git ]; then
+        DOT_GIT_DIR=.git
+    elif [ -f .git ] && IFS= read -r line < .git; then
+        case "$line" in
+            "gitdir: /"*) DOT_GIT_DIR=${line#gitdir: } ;;
+            "gitdir: "*) DOT_GIT_DIR="$PWD/${line#gitdir: }" ;;
+        esac
+    fi
+    DOT_GIT_DIR=${DOT_GIT_DIR:-$(git rev-parse --git-dir 2>/dev/null)}
+    DOT_GIT_DIR=${DOT_GIT_DIR:-.git}
+}
+'''
+
+_RESOLVE = r'''
+dot_resolve_suffix() {
+    local env="${DOT_WORSHIP_SUFFIX-}"
+    env="${env#"${env%%[![:space:]]*}"}"
+    env="${env%"${env##*[![:space:]]}"}"
+    if [ -n "$env" ]; then
+        DOT_SUFFIX=$env
+        return
+    fi
+
+    dot_git_dir
+    local cache="$DOT_GIT_DIR/@CACHE_FILE@"
+    local present="" stale="" f sig="" cached=""
+    for f in "${DOT_CONFIG_FILES[@]}"; do
+        if [ -e "$f" ]; then
+            present="${present}1"
+            [ "$f" -nt "$cache" ] && stale=1
+        else
+            present="${present}0"
+        fi
+    done
+    if [ -f "$cache" ]; then
+        { IFS= read -r sig; IFS= read -r cached; } < "$cache"
+    fi
+    if [ -z "$stale" ] && [ "$sig" = "$present" ] && [ -n "$cached" ]; then
+        DOT_SUFFIX=$cached
+        return
+    fi
+
+    # Configuration changed since the cache was written: resolve once
+    DOT_SUFFIX=$(PYTHONPATH="$DOT_PYTHONPATH${PYTHONPATH:+:$PYTHONPATH}" \
+        "$DOT_PYTHON" -m dot.cli suffix --raw 2>/dev/null)
+    if [ -n "$DOT_SUFFIX" ]; then
+        if printf '%s\n%s\n' "$present" "$DOT_SUFFIX" > "$cache.$$" 2>/dev/null; then
+            mv -f "$cache.$$" "$cache"
+        fi
+        return
+    fi
+    DOT_SUFFIX=$DOT_SNAPSHOT_SUFFIX
+}
+'''
+
+_COMMIT_MSG = r'''
+COMMIT_MSG_FILE=$1
+dot_resolve_suffix
+
+# What git will record: comment lines dropped, trailing whitespace trimmed
+COMMIT_MSG=$(grep -v '^#' "$COMMIT_MSG_FILE")
+COMMIT_MSG="${COMMIT_MSG%"${COMMIT_MSG##*[![:space:]]}"}"
+
+case "$COMMIT_MSG" in
+    *"$DOT_SUFFIX") exit 0 ;;
+esac
+
+echo "╔════════════════════════════════════════════════════════════════╗"
+echo "║                    COMMIT REJECTED                             ║"
+echo "╚════════════════════════════════════════════════════════════════╝"
+echo ""
+echo "Your commit message must end with:"
+echo "  $DOT_SUFFIX"
+echo ""
+echo "Current message:"
+echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+echo "$COMMIT_MSG"
+echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+echo ""
+echo "Please amend your commit message to worship THE DOT."
+echo ""
+exit 1
+'''
+
+_PREPARE_COMMIT_MSG = r'''
+COMMIT_MSG_FILE=$1
+COMMIT_SOURCE=$2
+
+# Don't modify merge, squash, or amended commits
+if [ -n "$COMMIT_SOURCE" ]; then
+    exit 0
+fi
+
+COMMIT_MSG=$(cat "$COMMIT_MSG_FILE")
+
+# Don't modify empty messages or comments-only messages
+case "$COMMIT_MSG" in
+    "" | "#"*) exit 0 ;;
+esac
+
+dot_resolve_suffix
+case "$COMMIT_MSG" in
+    *"$DOT_SUFFIX"*) exit 0 ;;
+esac
+
+printf '\n%s\n' "$DOT_SUFFIX" >> "$COMMIT_MSG_FILE"
+exit 0
+'''
+
+_BODIES = {"commit-msg": _COMMIT_MSG, "prepare-commit-msg": _PREPARE_COMMIT_MSG}
+
+# Shared-store hooks first run the repository's own hook of the same name
+# (from the hooks directory recorded when it was linked, else hooks/ in the
+# common git dir), skipping hooks THE DOT generated itself.
+_LOCAL_HOOK = r'''
+dot_run_local_hook() {
+    dot_git_dir
+    local common="$DOT_GIT_DIR" rel="" dir="" hook
+    if [ -f "$DOT_GIT_DIR/commondir" ]; then
+        IFS= read -r rel < "$DOT_GIT_DIR/commondir"
+        case "$rel" in
+            /*) common=$rel ;;
+            *) common="$DOT_GIT_DIR/$rel" ;;
+        esac
+    fi
+    if [ -f "$common/@BACKUP_FILE@" ]; then
+        IFS= read -r dir < "$common/@BACKUP_FILE@"
+    fi
+    hook="${dir:-$common/hooks}/${0##*/}"
+    if [ -x "$hook" ] && ! grep -q '^@MARKER@' "$hook" 2>/dev/null; then
+        "$hook" "$@" || exit $?
+    fi
+}
+'''
+
+
+def render_hook(name: str, suffix: str, config_files: Sequence[Path],
+                python: Optional[str] = None, shared: bool = False) -> str:
+    """Return the bash source of hook ``name`` for a resolved suffix.
+
+    Args:
+        name: "commit-msg" or "prepare-commit-msg".
+        suffix: Suffix snapshot to embed.
+        config_files: ``.dot.ini`` paths whose changes trigger re-resolution.
+        python: Interpreter used to re-resolve (default: this one).
+        shared: Render for the shared store, chaining to the repository's
+            own hook of the same name first.
+
+    The directory THE DOT is imported from is embedded too, so hooks keep
+    working for source checkouts that are not installed.
+    """
+    files = " ".join(shlex.quote(str(p)) for p in config_files)
+    header = (
+        "#!/usr/bin/env bash\n"
+        f"{GENERATED_MARKER}: {name}\n"
+        "# Written by `dot hooks install`; re-run it instead of editing.\n"
+        "\n"
+        f"DOT_SNAPSHOT_SUFFIX={shlex.quote(suffix)}\n"
+        f"DOT_PYTHON={shlex.quote(python or sys.executable)}\n"
+        f"DOT_PYTHONPATH={shlex.quote(str(_PACKAGE_PARENT))}\n"
+        f"DOT_CONFIG_FILES=({files})\n"
+    )
+    body = _LOCATE + _RESOLVE.replace("@CACHE_FILE@", CACHE_FILE)
+    if shared:
+        body += _local_hook_function() + '\ndot_run_local_hook "$@"'
+    return header + body + _BODIES[name]
+
+
+def _local_hook_function() -> str:
+    return _LOCAL_HOOK.replace("@BACKUP_FILE@", BACKUP_FILE).replace("@MARKER@", GENERATED_MARKER)
+
+
+def render_forwarder(name: str) -> str:
+    """Shared-store hook that only runs the repository's own ``name`` hook."""
+    return (
+        "#!/usr/bin/env bash\n"
+        f"{GENERATED_MARKER}: {name} (forwarder)\n"
+        "# Written by `dot hooks install --shared`; re-run it instead of editing.\n"
+        + _LOCATE + _local_hook_function()
+        + '\ndot_run_local_hook "$@"\nexit 0\n'
+    )
+
+
+def hook_config_files(repo_root: Optional[Path]) -> List[Path]:
+    """``.dot.ini`` paths a hook watches, repository ones made relative.
+
+    Hooks run from the top of the work tree, so ``.dot.ini`` relative paths
+    keep one rendered hook correct for every worktree sharing it.
+    """
+    files: List[Path] = []
+    for p in config_search_paths(repo_root):
+        if repo_root is not None and p.parent == Path(repo_root):
+            p = Path(".dot.ini")
+        if p not in files:
+            files.append(p)
+    return files
+
+
+def presence_signature(config_files: Sequence[Path], base: Optional[Path] = None) -> str:
+    """Which config files exist, as the hook computes it (e.g. "10")."""
+    base = Path(base) if base is not None else Path.cwd()
+    return "".join("1" if (base / p).exists() else "0" for p in config_files)
+
+
+def write_suffix_cache(git_dir: Path, suffix: str, config_files: Sequence[Path],
+                       base: Optional[Path] = None) -> Path:
+    """Seed ``$GIT_DIR/dot-suffix.cache`` so the first commit stays in shell."""
+    path = Path(git_dir) / CACHE_FILE
+    content = f"{presence_signature(config_files, base)}\n{suffix}\n"
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return path
+    except OSError:
+        pass
+    atomic_write_text(path, content)
+    return path
+
+
+def is_generated(path: Path) -> bool:
+    try:
+        return GENERATED_MARKER in path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return False
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_hooks(hooks_dir: Path, rendered: Dict[str, str],
+                 echo: Callable[[str], None]) -> bool:
+    """Write rendered hooks unless already byte-identical; True if written."""
+    import shutil
+
+    hooks_dir.mkdir(parents=True, exist_ok=True)
+    changed = False
+    for name, text in rendered.items():
+        dst = hooks_dir / name
+        data = text.encode("utf-8")
+        try:
+            current = dst.read_bytes()
+        except OSError:
+            current = None
+        if current is not None and _digest(current) == _digest(data) \
+                and os.access(dst, os.X_OK):
+            continue
+        if current is not None and GENERATED_MARKER.encode() not in current:
+            backup = hooks_dir / f"{name}.backup"
+            echo(f"Backing up existing {name} hook to {backup}")
+            shutil.copy2(dst, backup)
+        atomic_write_bytes(dst, data)
+        dst.chmod(0o755)
+        changed = True
+    return changed
+
+
+def install(git_dir: Path, repo_root: Optional[Path] = None,
+            echo: Callable[[str], None] = print) -> List[Path]:
+    """Render and install both hooks for one repository.
+
+    Hooks go where git looks for them (``core.hooksPath``, else the common
+    git directory's ``hooks/``). Existing hooks that were not generated by
+    THE DOT are copied to ``<name>.backup`` first; reinstalling never
+    overwrites that backup.
+
+    Returns:
+        Paths of the installed hooks.
+    """
+    git_dir = Path(git_dir)
+    if repo_root is None:
+        repo_root = git_dir.parent if git_dir.name == ".git" else None
+    hooks_dir = get_hooks_dir(git_dir, repo_root)
+
+    # The environment is checked by the hook itself at commit time
+    suffix, _ = resolve_worship_suffix(repo_root, use_env=False)
+    config_files = hook_config_files(repo_root)
+    rendered = {name: render_hook(name, suffix, config_files) for name in HOOK_NAMES}
+    _write_hooks(hooks_dir, rendered, echo)
+    for name in HOOK_NAMES:
+        echo(f"✓ Installed {name} hook")
+    write_suffix_cache(git_dir, suffix, config_files, repo_root)
+    return [hooks_dir / name for name in HOOK_NAMES]
+
+
+# ---------------------------------------------------------------------------
+# Many repositories
+# ---------------------------------------------------------------------------
+
+@dataclass
+class InstallResult:
+    """Outcome for one hooks directory in a bulk install."""
+
+    hooks_dir: str
+    repos: List[str] = field(default_factory=list)
+    status: str = "installed"  # installed | unchanged | failed
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        data = {"hooks_dir": self.hooks_dir, "repos": self.repos, "status": self.status}
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+def find_repositories(root: Path) -> List[Tuple[Path, Path]]:
+    """``(work_tree, git_dir)`` for every repository and worktree under root.
+
+    Walks the tree once without spawning git; ``.git`` directories are not
+    descended into, nested repositories and submodules are included.
+    Linked worktrees registered in a found repository are included even
+    when they live outside ``root``.
+    """
+    found: Dict[str, Tuple[Path, Path]] = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        if ".git" in dirnames or ".git" in filenames:
+            git_dir = git_dir_at(Path(dirpath))
+            if git_dir is not None:
+                found.setdefault(os.path.realpath(dirpath), (Path(dirpath), git_dir))
+        if ".git" in dirnames:
+            dirnames.remove(".git")
+
+    for work_tree, git_dir in list(found.values()):
+        registry = common_git_dir(git_dir) / "worktrees"
+        if not registry.is_dir():
+            continue
+        for entry in registry.iterdir():
+            try:
+                dotgit = (entry / "gitdir").read_text(encoding="utf-8").strip()
+            except OSError:
+                continue
+            tree = os.path.dirname(dotgit)
+            if os.path.isdir(tree):
+                found.setdefault(os.path.realpath(tree), (Path(tree), entry))
+    return sorted(found.values())
+
+
+def _install_group(hooks_dir: Path, repos: List[Tuple[Path, Path]]) -> InstallResult:
+    """Install into one hooks directory shared by ``repos``; never raises."""
+    result = InstallResult(str(hooks_dir), [str(tree) for tree, _ in repos])
+    try:
+        # The first (usually main) work tree provides the snapshot; every
+        # worktree gets its own suffix cache.
+        main = repos[0][0]
+        suffix, _ = resolve_worship_suffix(main, use_env=False)
+        config_files = hook_config_files(main)
+        rendered = {name: render_hook(name, suffix, config_files) for name in HOOK_NAMES}
+        changed = _write_hooks(hooks_dir, rendered, echo=lambda _: None)
+        for tree, git_dir in repos:
+            tree_suffix, _ = resolve_worship_suffix(tree, use_env=False)
+            write_suffix_cache(git_dir, tree_suffix, config_files, tree)
+        result.status = "installed" if changed else "unchanged"
+    except (OSError, ValueError) as e:
+        result.status = "failed"
+        result.error = str(e)
+    return result
+
+
+def install_all(root: Path, jobs: Optional[int] = None) -> List[InstallResult]:
+    """Install hooks in every repository under ``root`` with a thread pool.
+
+    Repositories are grouped by the hooks directory git will actually use
+    (worktrees share one; ``core.hooksPath`` may point several repositories
+    at the same place), so each directory is written at most once. Groups
+    whose hooks are already byte-identical are left untouched.
+
+    Returns:
+        One InstallResult per hooks directory, sorted by path.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    groups: Dict[str, List[Tuple[Path, Path]]] = {}
+    for tree, git_dir in find_repositories(Path(root)):
+        hooks_dir = os.path.normpath(get_hooks_dir(git_dir, tree))
+        groups.setdefault(hooks_dir, []).append((tree, git_dir))
+    if not groups:
+        return []
+    workers = max(1, min(jobs or (os.cpu_count() or 1) * 4, len(groups)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(lambda item: _install_group(Path(item[0]), item[1]),
+                           sorted(groups.items()))
+        return list(results)
+
+
+def format_install_summary(root: Path, results: Sequence[InstallResult]) -> str:
+    """Machine-readable JSON summary of a bulk install."""
+    import json
+
+    counts = {"installed": 0, "unchanged": 0, "failed": 0}
+    for r in results:
+        counts[r.status] += 1
+    return json.dumps({
+        "root": str(root),
+        "hooks_dirs": len(results),
+        "repositories": sum(len(r.repos) for r in results),
+        **counts,
+        "results": [r.to_dict() for r in results],
+    }, indent=2)
+
+
+# ---------------------------------------------------------------------------
+# Shared, content-addressed hook store
+# ---------------------------------------------------------------------------
+
+STORE_CURRENT = "current"
+
+
+def default_store_dir() -> Path:
+    """DOT_HOOK_STORE, else ~/.worship_the_dot/hooks."""
+    override = os.environ.get("DOT_HOOK_STORE")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".worship_the_dot" / "hooks"
+
+
+def shared_config_files() -> List[Path]:
+    """Config files shared hooks watch: the repository's and the user's."""
+    return [Path(".dot.ini"), Path(os.path.expanduser("~")) / ".dot.ini"]
+
+
+def render_store() -> Dict[str, str]:
+    """Every hook in a store version, by name.
+
+    Nothing repository-specific is embedded: the snapshot suffix comes from
+    the user's config only, and each repository's resolved suffix lives in
+    its own ``dot-suffix.cache``.
+    """
+    suffix, _ = resolve_worship_suffix(Path(os.path.expanduser("~")), use_env=False)
+    files = shared_config_files()
+    rendered = {name: render_hook(name, suffix, files, shared=True) for name in HOOK_NAMES}
+    rendered.update((name, render_forwarder(name)) for name in FORWARDED_HOOKS)
+    return rendered
+
+
+def store_digest(files: Dict[str, bytes]) -> str:
+    """Name of the store version holding exactly ``files``."""
+    h = hashlib.sha256()
+    for name in sorted(files):
+        h.update(name.encode("utf-8") + b"\0" + files[name] + b"\0")
+    return h.hexdigest()[:16]
+
+
+def _version_files(version: Path) -> Dict[str, bytes]:
+    return {p.name: p.read_bytes() for p in version.iterdir() if p.is_file()}
+
+
+def verify_version(version: Path) -> bool:
+    """True if the hooks in a store version still hash to its name."""
+    try:
+        return store_digest(_version_files(version)) == version.name
+    except OSError:
+        return False
+
+
+def publish_store(store: Optional[Path] = None) -> Path:
+    """Make the current hooks available in the store; return ``store/current``.
+
+    Each version lives in ``<store>/<hash>/`` and is written to a temporary
+    directory first, then renamed into place. ``current`` is a relative
+    symlink to the newest version, swapped with a single rename so
+    repositories pointing at it move to new hooks atomically. Versions
+    other than the new and the previous one are removed.
+
+    Raises:
+        OSError: If the store cannot be written.
+    """
+    import shutil
+
+    store = Path(store) if store is not None else default_store_dir()
+    store.mkdir(parents=True, exist_ok=True)
+    data = {name: text.encode("utf-8") for name, text in render_store().items()}
+    digest = store_digest(data)
+    link = store / STORE_CURRENT
+
+    with file_lock(store / ".lock"):
+        version = store / digest
+        if not verify_version(version):
+            tmp = store / f".{digest}.{os.getpid()}.tmp"
+            shutil.rmtree(tmp, ignore_errors=True)
+            tmp.mkdir()
+            for name, content in data.items():
+                (tmp / name).write_bytes(content)
+                (tmp / name).chmod(0o755)
+            shutil.rmtree(version, ignore_errors=True)  # tampered copy
+            os.rename(tmp, version)
+
+        try:
+            previous = os.readlink(link)
+        except OSError:
+            previous = None
+        if previous != digest:
+            tmp_link = store / f".{STORE_CURRENT}.{os.getpid()}.tmp"
+            if os.path.lexists(tmp_link):
+                os.unlink(tmp_link)
+            os.symlink(digest, tmp_link)
+            os.replace(tmp_link, link)
+
+        for entry in store.iterdir():
+            if entry.is_dir() and not entry.is_symlink() and not entry.name.startswith(".") \
+                    and entry.name not in (digest, previous):
+                shutil.rmtree(entry, ignore_errors=True)
+    return link
+
+
+def shared_version(hooks_dir: Path, store: Optional[Path] = None) -> Optional[Path]:
+    """Store version directory ``hooks_dir`` resolves to, if it is one."""
+    store = Path(store) if store is not None else default_store_dir()
+    resolved = Path(os.path.realpath(hooks_dir))
+    if resolved.parent == Path(os.path.realpath(store)) and resolved.is_dir():
+        return resolved
+    return None
+
+
+def _git_config_file(config: Path, *args: str) -> int:
+    import subprocess
+
+    return subprocess.run(["git", "config", "--file", str(config), *args],
+                          capture_output=True).returncode
+
+
+def link_repo(work_tree: Path, git_dir: Path, link: Path,
+              store: Optional[Path] = None) -> bool:
+    """Point a repository's ``core.hooksPath`` at the store; True if changed.
+
+    The first time, the hooks directory and ``core.hooksPath`` the
+    repository used before are saved to ``BACKUP_FILE`` in its common git
+    dir, for forwarding and for unlink_repo. Every worktree's suffix cache
+    is seeded by the caller through write_suffix_cache.
+
+    Raises:
+        OSError: If the config or backup cannot be written.
+    """
+    common = common_git_dir(git_dir)
+    target = str(link)
+    current = get_repo_config(git_dir, "core", "hookspath")
+    if current == target:
+        return False
+    backup = common / BACKUP_FILE
+    if not backup.exists():
+        previous_dir = get_hooks_dir(git_dir, work_tree)
+        if shared_version(previous_dir, store) is not None:
+            previous_dir = common / "hooks"
+        atomic_write_text(backup, f"{os.path.abspath(previous_dir)}\n{current or ''}\n")
+    if _git_config_file(common / "config", "core.hooksPath", target) != 0:
+        raise OSError(f"could not set core.hooksPath in {common / 'config'}")
+    return True
+
+
+def unlink_repo(git_dir: Path, store: Optional[Path] = None) -> Optional[str]:
+    """Restore what link_repo replaced.
+
+    Returns:
+        None if the repository was not linked, "" if core.hooksPath was
+        unset again, otherwise the restored core.hooksPath.
+    """
+    common = common_git_dir(git_dir)
+    backup = common / BACKUP_FILE
+    try:
+        lines = backup.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    previous = lines[1] if len(lines) > 1 else ""
+    current = get_repo_config(git_dir, "core", "hookspath")
+    # Leave a core.hooksPath the user changed since linking alone
+    if current is not None and shared_version(Path(current), store) is not None:
+        if previous:
+            _git_config_file(common / "config", "core.hooksPath", previous)
+        else:
+            _git_config_file(common / "config", "--unset", "core.hooksPath")
+    backup.unlink()
+    return previous
+
+
+def install_shared(git_dir: Path, repo_root: Optional[Path] = None,
+                   store: Optional[Path] = None) -> Path:
+    """Publish the store and link one repository to it; return the link.
+
+    Raises:
+        OSError: If the store, config or caches cannot be written.
+    """
+    git_dir = Path(git_dir)
+    if repo_root is None:
+        repo_root = git_dir.parent if git_dir.name == ".git" else None
+    link = publish_store(store)
+    link_repo(repo_root, git_dir, link, store)
+    suffix, _ = resolve_worship_suffix(repo_root, use_env=False)
+    write_suffix_cache(git_dir, suffix, shared_config_files(), repo_root)
+    return link
+
+
+def _link_group(link: Path, store: Path, repos: List[Tuple[Path, Path]]) -> InstallResult:
+    """Link one repository (all its worktrees) to the store; never raises."""
+    result = InstallResult(str(link), [str(tree) for tree, _ in repos])
+    try:
+        changed = link_repo(repos[0][0], repos[0][1], link, store)
+        files = shared_config_files()
+        for tree, git_dir in repos:
+            suffix, _ = resolve_worship_suffix(tree, use_env=False)
+            write_suffix_cache(git_dir, suffix, files, tree)
+        result.status = "installed" if changed else "unchanged"
+    except (OSError, ValueError) as e:
+        result.status = "failed"
+        result.error = str(e)
+    return result
+
+
+def link_all(root: Path, jobs: Optional[int] = None,
+             store: Optional[Path] = None) -> List[InstallResult]:
+    """Publish the store once and link every repository under ``root``.
+
+    Repositories are grouped by common git dir (worktrees share one
+    config); groups already pointing at the store only get their suffix
+    caches refreshed.
+
+    Returns:
+        One InstallResult per repository, sorted by common git dir.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    store = Path(store) if store is not None else default_store_dir()
+    groups: Dict[str, List[Tuple[Path, Path]]] = {}
+    for tree, git_dir in find_repositories(Path(root)):
+        groups.setdefault(os.path.normpath(common_git_dir(git_dir)), []).append((tree, git_dir))
+    if not groups:
+        return []
+    link = publish_store(store)
+    workers = max(1, min(jobs or (os.cpu_count() or 1) * 4, len(groups)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda item: _link_group(link, store, item[1]),
+                             sorted(groups.items())))
+
+
+def hook_states(git_dir: Path, repo_root: Optional[Path] = None) -> Dict[str, str]:
+    """Installation state of each hook, judged by content hash.
+
+    States: "installed", "outdated" (generated by THE DOT but not what
+    install would write now), "modified" (a shared store version whose
+    files no longer match its hash), "foreign" and "missing".
+    """
+    git_dir = Path(git_dir)
+    if repo_root is None:
+        repo_root = git_dir.parent if git_dir.name == ".git" else None
+    hooks_dir = get_hooks_dir(git_dir, repo_root)
+    version = shared_version(hooks_dir)
+    if version is not None:
+        expected = {name: text.encode("utf-8") for name, text in render_store().items()}
+        intact = verify_version(version)
+        fresh = version.name == store_digest(expected)
+    else:
+        suffix, _ = resolve_worship_suffix(repo_root, use_env=False)
+        config_files = hook_config_files(repo_root)
+        expected = {name: render_hook(name, suffix, config_files).encode("utf-8")
+                    for name in HOOK_NAMES}
+        intact = fresh = True
+
+    states = {}
+    for name in HOOK_NAMES:
+        try:
+            current = (hooks_dir / name).read_bytes()
+        except OSError:
+            states[name] = "missing"
+            continue
+        if GENERATED_MARKER.encode() not in current:
+            states[name] = "foreign"
+        elif not intact:
+            states[name] = "modified"
+        elif fresh and _digest(current) == _digest(expected[name]):
+            states[name] = "installed"
+        else:
+            states[name] = "outdated"
+    return states
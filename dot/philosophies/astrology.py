@@ -12,11 +12,13 @@ It avoids network calls and third‑party libraries by design.
 
 import random
 from datetime import datetime
-from typing import Tuple, List, Optional, Dict
-from math import sin, cos, tan, atan2, sqrt, radians, degrees
+from typing import Tuple, List, NamedTuple, Optional, Dict
+from math import sin, cos, tan, sqrt, radians
 from pathlib import Path
 import json
 
+from dot.philosophies.chebyshev import get_table
+
 
 # =============================================================================
 # Zodiac Signs and Their Coding Attributes
@@ -468,43 +470,96 @@ Cosmic Guidance: {advice}
 # =============================================================================
 
 # Simplified orbital parameters (circular, ecliptic latitude ~ 0) for narrative use.
-_PLANET_ELEMENTS: Dict[str, Dict[str, float]] = {}
+_TWO_PI = 2.0 * 3.141592653589793
+_SIDEREAL_YEAR = 365.256363004  # days
+
+
+class BodyElements(NamedTuple):
+    """A body's vendored J2000 elements and the constants derived from them.
+
+    Built once by the loaders so a position only has to advance the mean
+    anomaly, solve Kepler's equation and apply the precomputed rotation.
+    """
+
+    a: float      # semi-major axis (AU)
+    e: float      # eccentricity
+    i: float      # inclination (degrees)
+    Omega: float  # longitude of ascending node (degrees)
+    varpi: float  # longitude of perihelion (degrees)
+    L: float      # mean longitude at epoch (degrees)
+    n: float      # mean motion (rad/day), from P^2 = a^3 in sidereal years
+    M0: float     # mean anomaly at epoch (rad)
+    b: float      # semi-minor axis (AU)
+    # Perifocal x and y axes in ecliptic coordinates
+    px: float
+    py: float
+    pz: float
+    qx: float
+    qy: float
+    qz: float
+
+
+def _make_elements(raw: Dict[str, float]) -> BodyElements:
+    a, e = float(raw["a"]), float(raw["e"])
+    i, Omega = radians(raw["i"]), radians(raw["Omega"])
+    varpi, L = radians(raw["varpi"]), radians(raw["L"])
+    omega = varpi - Omega  # argument of perihelion
+    cosO, sinO = cos(Omega), sin(Omega)
+    cosi, sini = cos(i), sin(i)
+    cosw, sinw = cos(omega), sin(omega)
+    return BodyElements(
+        a, e, float(raw["i"]), float(raw["Omega"]), float(raw["varpi"]), float(raw["L"]),
+        n=_TWO_PI / (sqrt(a ** 3) * _SIDEREAL_YEAR),
+        M0=L - varpi,
+        b=a * sqrt(1.0 - e * e),
+        px=cosO * cosw - sinO * cosi * sinw,
+        py=sinO * cosw + cosO * cosi * sinw,
+        pz=sini * sinw,
+        qx=-cosO * sinw - sinO * cosi * cosw,
+        qy=-sinO * sinw + cosO * cosi * cosw,
+        qz=sini * cosw,
+    )
+
+
+_PLANET_ELEMENTS: Dict[str, BodyElements] = {}
 _EPOCH_JD: float = 2451545.0
-_MINOR_ELEMENTS: Dict[str, Dict[str, float]] = {}
-_COMET_ELEMENTS: Dict[str, Dict[str, float]] = {}
+_MINOR_ELEMENTS: Dict[str, BodyElements] = {}
+_COMET_ELEMENTS: Dict[str, BodyElements] = {}
+# Every loaded body in one dict (the Sun is the origin)
+_BODIES: Dict[str, Optional[BodyElements]] = {"sun": None}
+
+
+def _read_elements(name: str) -> Tuple[Optional[float], Dict[str, BodyElements]]:
+    data_path = Path(__file__).parent / "data" / "ephemeris" / name
+    with data_path.open("r", encoding="utf-8") as f:
+        data = json.load(f)
+    bodies = {k.lower(): _make_elements(v) for k, v in data.get("bodies", {}).items()}
+    _BODIES.update(bodies)
+    return data.get("epoch_jd"), bodies
 
 
 def _load_planet_elements() -> None:
     global _PLANET_ELEMENTS, _EPOCH_JD
     if _PLANET_ELEMENTS:
         return
-    data_path = Path(__file__).parent / "data" / "ephemeris" / "planets_j2000.json"
-    with data_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    _EPOCH_JD = float(data.get("epoch_jd", 2451545.0))
-    _PLANET_ELEMENTS = {k.lower(): v for k, v in data["bodies"].items()}
+    epoch, _PLANET_ELEMENTS = _read_elements("planets_j2000.json")
+    _EPOCH_JD = float(epoch or 2451545.0)
 
 
 def _load_minor_elements() -> None:
     global _MINOR_ELEMENTS
     if _MINOR_ELEMENTS:
         return
-    data_path = Path(__file__).parent / "data" / "ephemeris" / "minor_bodies_j2000.json"
-    if data_path.exists():
-        with data_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        _MINOR_ELEMENTS = {k.lower(): v for k, v in data.get("bodies", {}).items()}
+    if (Path(__file__).parent / "data" / "ephemeris" / "minor_bodies_j2000.json").exists():
+        _MINOR_ELEMENTS = _read_elements("minor_bodies_j2000.json")[1]
 
 
 def _load_comet_elements() -> None:
     global _COMET_ELEMENTS
     if _COMET_ELEMENTS:
         return
-    data_path = Path(__file__).parent / "data" / "ephemeris" / "comets_j2000.json"
-    if data_path.exists():
-        with data_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        _COMET_ELEMENTS = {k.lower(): v for k, v in data.get("bodies", {}).items()}
+    if (Path(__file__).parent / "data" / "ephemeris" / "comets_j2000.json").exists():
+        _COMET_ELEMENTS = _read_elements("comets_j2000.json")[1]
 
 
 def _julian_day(dt: datetime) -> float:
@@ -533,74 +588,56 @@ def _kepler_E(M: float, e: float, tol: float = 1e-8, max_iter: int = 50) -> floa
     return E
 
 
-def _heliocentric_ecliptic_xyz(body: str, when: datetime) -> Tuple[float, float, float]:
-    """Compute heliocentric ecliptic rectangular coordinates (AU)."""
+def _body_elements(body: str) -> Optional[BodyElements]:
+    """Orbital elements for a planet, minor planet or comet (None for the Sun)."""
+    try:
+        return _BODIES[body]
+    except KeyError:
+        pass
     _load_planet_elements()
-    # Sun handled as origin
-    if body == "sun":
+    _load_minor_elements()
+    _load_comet_elements()
+    if body in _BODIES:
+        return _BODIES[body]
+    raise KeyError(f"Unknown body: {body}")
+
+
+def _xyz_from_elements(b: BodyElements, jd: float) -> Tuple[float, float, float]:
+    """Heliocentric ecliptic rectangular coordinates (AU) at Julian day jd."""
+    # Mean anomaly M = L - varpi + n * (days since epoch)
+    M = (b.M0 + b.n * (jd - _EPOCH_JD)) % _TWO_PI
+    E = _kepler_E(M, b.e)
+
+    # Perifocal coordinates, rotated to the ecliptic
+    x_p = b.a * (cos(E) - b.e)
+    y_p = b.b * sin(E)
+    return (
+        b.px * x_p + b.qx * y_p,
+        b.py * x_p + b.qy * y_p,
+        b.pz * x_p + b.qz * y_p,
+    )
+
+
+def _position(body: str, b: Optional[BodyElements], jd: float) -> Tuple[float, float, float]:
+    """Heliocentric ecliptic xyz (AU) of body, whose elements are b (None
+    for the Sun), at Julian day jd.
+
+    Instants inside a built Chebyshev table (``dot ephemeris build-table``)
+    are interpolated from it instead of solving Kepler's equation.
+    """
+    if b is None:
         return (0.0, 0.0, 0.0)
-    # Resolve elements from planets/minors/comets
-    if body in _PLANET_ELEMENTS:
-        b = _PLANET_ELEMENTS[body]
-    else:
-        _load_minor_elements()
-        _load_comet_elements()
-        if body in _MINOR_ELEMENTS:
-            b = _MINOR_ELEMENTS[body]
-        elif body in _COMET_ELEMENTS:
-            b = _COMET_ELEMENTS[body]
-        else:
-            raise KeyError(f"Unknown body: {body}")
-    a = b["a"]
-    e = b["e"]
-    i = radians(b["i"])  # inclination
-    Omega = radians(b["Omega"])  # longitude of ascending node
-    varpi = radians(b["varpi"])  # longitude of perihelion
-    L = radians(b["L"])         # mean longitude
-
-    # Time since epoch J2000 in days
-    jd = _julian_day(when)
-    days = jd - _EPOCH_JD
-
-    # Mean motion from Kepler's third law (P^2 = a^3) in sidereal years
-    # Sidereal year ~ 365.256363004 days
-    P_years = sqrt(a ** 3)
-    n = 2.0 * 3.141592653589793 / (P_years * 365.256363004)  # rad/day
-
-    # Mean anomaly M = L - varpi + n * dt
-    M0 = (L - varpi)
-    M = (M0 + n * days) % (2.0 * 3.141592653589793)
-
-    # Solve Kepler for E
-    E = _kepler_E(M, e)
-    # True anomaly
-    nu = 2.0 * atan2(sqrt(1 + e) * sin(E / 2.0), sqrt(1 - e) * cos(E / 2.0))
-    r = a * (1.0 - e * cos(E))
-
-    # Perifocal coordinates
-    x_p = r * cos(nu)
-    y_p = r * sin(nu)
-
-    # Argument of perihelion
-    omega = varpi - Omega
-
-    # Rotate to ecliptic
-    cosO = cos(Omega); sinO = sin(Omega)
-    cosi = cos(i);     sini = sin(i)
-    cosw = cos(omega); sinw = sin(omega)
-
-    x1 = cosw * x_p - sinw * y_p
-    y1 = sinw * x_p + cosw * y_p
-    z1 = 0.0
-
-    x2 = x1
-    y2 = cosi * y1
-    z2 = sini * y1
-
-    x = cosO * x2 - sinO * y2
-    y = sinO * x2 + cosO * y2
-    z = z2
-    return (x, y, z)
+    table = get_table()
+    if table is not None:
+        xyz = table.lookup(body, jd)
+        if xyz is not None:
+            return xyz
+    return _xyz_from_elements(b, jd)
+
+
+def _heliocentric_ecliptic_xyz(body: str, when: datetime) -> Tuple[float, float, float]:
+    """Compute heliocentric ecliptic rectangular coordinates (AU)."""
+    return _position(body, _body_elements(body), _julian_day(when))
 
 
 def ephemeris_summary(
@@ -632,51 +669,39 @@ def ephemeris_summary(
     def fmt(x: float) -> str:
         return f"{x:.2f}°"
 
-    # Compute Earth heliocentric vector once
-    xe, ye, ze = _heliocentric_ecliptic_xyz("earth", when)
-
-    for name in bodies:
-        key = name.lower()
-        try:
-            xh, yh, zh = _heliocentric_ecliptic_xyz(key, when)
-            # Geocentric vector
-            xg, yg, zg = xh - xe, yh - ye, zh - ze
-            lam = (degrees(atan2(yg, xg)) + 360.0) % 360.0
-            beta = degrees(atan2(zg, sqrt(xg * xg + yg * yg)))
-            lines.append(f"- {name.title():<10} lon {fmt(lam)} lat {fmt(beta)}")
-        except Exception:
-            lines.append(f"- {name.title():<10} unavailable")
-
-    # Minor planets
+    sections: List[Tuple[Optional[str], List[str], bool]] = [(None, list(bodies), False)]
     if include_minors:
         _load_minor_elements()
         if _MINOR_ELEMENTS:
-            lines.append("")
-            lines.append("Minor planets:")
-            for m in ["ceres", "pallas", "vesta"]:
-                try:
-                    xm, ym, zm = _heliocentric_ecliptic_xyz(m, when)
-                    xg, yg, zg = xm - xe, ym - ye, zm - ze
-                    lam = (degrees(atan2(yg, xg)) + 360.0) % 360.0
-                    beta = degrees(atan2(zg, sqrt(xg * xg + yg * yg)))
-                    lines.append(f"- {m.title():<10} lon {fmt(lam)} lat {fmt(beta)}")
-                except Exception:
-                    lines.append(f"- {m.title():<10} unavailable")
-
-    # Comets
+            sections.append(("Minor planets:", ["ceres", "pallas", "vesta"], False))
     if include_comets:
         _load_comet_elements()
         if _COMET_ELEMENTS:
+            sections.append(("Comets:", ["1p/halley", "2p/encke"], True))
+
+    # Every known body at once through the array engine
+    known: List[str] = []
+    for _, names, _ in sections:
+        for name in names:
+            try:
+                _body_elements(name.lower())
+            except KeyError:
+                continue
+            known.append(name.lower())
+    from dot.philosophies.ephemeris import geocentric_ecliptic
+    lon, lat = geocentric_ecliptic(known, [when])
+    row = {name: k for k, name in enumerate(known)}
+
+    for title, names, upper in sections:
+        if title:
             lines.append("")
-            lines.append("Comets:")
-            for c in ["1p/halley", "2p/encke"]:
-                try:
-                    xc, yc, zc = _heliocentric_ecliptic_xyz(c, when)
-                    xg, yg, zg = xc - xe, yc - ye, zc - ze
-                    lam = (degrees(atan2(yg, xg)) + 360.0) % 360.0
-                    beta = degrees(atan2(zg, sqrt(xg * xg + yg * yg)))
-                    lines.append(f"- {c.upper():<10} lon {fmt(lam)} lat {fmt(beta)}")
-                except Exception:
-                    lines.append(f"- {c.upper():<10} unavailable")
+            lines.append(title)
+        for name in names:
+            label = name.upper() if upper else name.title()
+            k = row.get(name.lower())
+            if k is None:
+                lines.append(f"- {label:<10} unavailable")
+            else:
+                lines.append(f"- {label:<10} lon {fmt(lon[k][0])} lat {fmt(lat[k][0])}")
 
     return "\n".join(lines) + "\n"
@@ -0,0 +1,322 @@
+"""
+Chebyshev ephemeris tables for THE DOT.
+
+Every analytic position solves Kepler's equation from the J2000 elements.
+build_table fits each body's heliocentric xyz with Chebyshev polynomials
+over fixed-length segments of a date span (the layout JPL's SPK kernels
+use) and writes them to a compact binary file. ChebyshevTable maps that
+file with mmap; a lookup picks the segment arithmetically and evaluates
+three short Clenshaw recurrences.
+
+Every position THE DOT computes (``astrology._position``, and through it
+the array engine, ``dot ephemeris``, ``dot events`` and ``dot retrograde``)
+consults the default table (get_table) for instants inside its span and
+falls back to the analytic path everywhere else, for unknown bodies, and
+for bodies whose elements changed since the table was built.
+
+File format (little-endian): an 8-byte magic, a header (start JD, stop JD,
+coefficients per axis, body count), one directory entry per body (name,
+element digest, segment length in days, segment count, coefficient
+offset) and then the coefficients: per segment, n (x, y, z) float64
+triples from the highest degree down, the order the recurrence reads them.
+
+Example:
+    >>> build_table(default_table_path(), 2433282.5, 2469807.5)  # 1950-2050
+    >>> get_table().lookup("mars", 2460310.5)
+    (-0.2894..., -1.4512..., -0.0232...)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+from math import cos, pi
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from dot.fsutil import atomic_write_bytes
+
+MAGIC = b"DOTCHEB1"
+HEADER = struct.Struct("<ddII")
+ENTRY = struct.Struct("<24s8sdIIQ")
+
+# A lookup costs one recurrence step per coefficient, so the degree is kept
+# low and segments short instead: degree 5 fits every vendored body within
+# DEFAULT_TOLERANCE on segments of 4 days (Mercury, Encke) to 1024 days
+# (the outer planets), about 4 MB per century.
+DEFAULT_COEFFICIENTS = 6
+DEFAULT_TOLERANCE = 1e-7  # AU; under 0.0001° of geocentric longitude
+MAX_SEGMENT_DAYS = 1024.0
+MIN_SEGMENT_DAYS = 0.25
+
+# Points per segment compared against the analytic path while building
+_CHECKS = 7
+
+Xyz = Tuple[float, float, float]
+
+
+def default_table_path() -> Path:
+    """DOT_EPHEMERIS_TABLE, else ~/.worship_the_dot/ephemeris.cheb."""
+    override = os.environ.get("DOT_EPHEMERIS_TABLE")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".worship_the_dot" / "ephemeris.cheb"
+
+
+def elements_digest(elements: Sequence[float]) -> bytes:
+    """8-byte digest of a body's elements and epoch; a table entry is only
+    used while it matches."""
+    from dot.philosophies import astrology
+
+    text = repr((astrology._EPOCH_JD, tuple(elements)))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+
+
+def fit_segment(f: Callable[[float], Xyz], start: float, days: float, n: int) -> List[List[float]]:
+    """Chebyshev coefficients (per axis, n each) interpolating f on
+    [start, start + days] at the n Chebyshev nodes."""
+    angles = [pi * (k + 0.5) / n for k in range(n)]
+    values = [f(start + (cos(t) + 1.0) * days / 2.0) for t in angles]
+    coeffs = []
+    for axis in range(3):
+        c = [2.0 / n * sum(v[axis] * cos(j * t) for v, t in zip(values, angles)) for j in range(n)]
+        c[0] /= 2.0
+        coeffs.append(c)
+    return coeffs
+
+
+def _interleave(coeffs: List[List[float]]) -> List[float]:
+    """Stored order: (x, y, z) triples from the highest degree down."""
+    return [c for j in range(len(coeffs[0]) - 1, -1, -1) for c in (coeffs[0][j], coeffs[1][j], coeffs[2][j])]
+
+
+def evaluate(segment: Sequence[float], x: float) -> Xyz:
+    """Clenshaw recurrence for all three axes of one stored segment at
+    x in [-1, 1]."""
+    it = iter(segment)
+    x2 = x + x
+    bx = by = bz = bx1 = by1 = bz1 = 0.0
+    for cx, cy, cz in zip(it, it, it):
+        bx, bx1 = x2 * bx - bx1 + cx, bx
+        by, by1 = x2 * by - by1 + cy, by
+        bz, bz1 = x2 * bz - bz1 + cz, bz
+    return (bx - x * bx1, by - x * by1, bz - x * bz1)
+
+
+def _fit_body(
+    f: Callable[[float], Xyz], start: float, stop: float, n: int, tol: float,
+) -> Tuple[float, List[float]]:
+    """Longest power-of-two segment (in days) whose fit stays within tol
+    everywhere in the span, and the flattened coefficients.
+
+    Raises:
+        ValueError: If even MIN_SEGMENT_DAYS segments miss tol.
+    """
+    days = MAX_SEGMENT_DAYS
+    while True:
+        count = max(1, -int(-(stop - start) // days))
+        flat: List[float] = []
+        ok = True
+        for s in range(count):
+            seg_start = start + s * days
+            segment = _interleave(fit_segment(f, seg_start, days, n))
+            for q in range(_CHECKS):
+                x = -1.0 + 2.0 * (q + 0.5) / _CHECKS
+                want = f(seg_start + (x + 1.0) * days / 2.0)
+                got = evaluate(segment, x)
+                if any(abs(got[a] - want[a]) > tol for a in range(3)):
+                    ok = False
+                    break
+            if not ok:
+                break
+            flat.extend(segment)
+        if ok:
+            return days, flat
+        if days <= MIN_SEGMENT_DAYS:
+            raise ValueError(f"tolerance {tol:g} AU is out of reach with {n} coefficients "
+                             f"on {MIN_SEGMENT_DAYS:g}-day segments")
+        days /= 2.0
+
+
+def build_table(
+    path: Union[str, Path],
+    start_jd: float,
+    stop_jd: float,
+    bodies: Optional[Sequence[str]] = None,
+    tol: float = DEFAULT_TOLERANCE,
+    coefficients: int = DEFAULT_COEFFICIENTS,
+) -> Dict[str, float]:
+    """Fit and write a table covering [start_jd, stop_jd].
+
+    Args:
+        path: Output file, replaced atomically.
+        start_jd, stop_jd: Span in Julian days.
+        bodies: Bodies to include (default: every vendored planet, minor
+            planet and comet).
+        tol: Largest allowed error per coordinate in AU, checked against
+            the analytic path while fitting.
+        coefficients: Chebyshev coefficients per axis and segment.
+
+    Returns:
+        Segment length in days per body.
+
+    Raises:
+        ValueError: If the span is empty, or a body cannot be fitted
+            within tol.
+        KeyError: For an unknown body.
+        OSError: If the file cannot be written.
+    """
+    from dot.philosophies import astrology
+
+    if stop_jd <= start_jd:
+        raise ValueError("table span must end after it starts")
+    if bodies is None:
+        bodies = known_bodies()
+    fitted = []
+    for body in bodies:
+        body = body.lower()
+        elements = astrology._body_elements(body)
+        if elements is None:
+            continue  # the Sun is the origin
+
+        def f(jd, b=elements):
+            return astrology._xyz_from_elements(b, jd)
+
+        days, flat = _fit_body(f, start_jd, stop_jd, coefficients, tol)
+        fitted.append((body, elements_digest(elements), days, flat))
+
+    offset = len(MAGIC) + HEADER.size + ENTRY.size * len(fitted)
+    head = [MAGIC, HEADER.pack(start_jd, stop_jd, coefficients, len(fitted))]
+    blobs = []
+    for body, digest, days, flat in fitted:
+        count = len(flat) // (3 * coefficients)
+        head.append(ENTRY.pack(body.encode("utf-8"), digest, days, count, 0, offset))
+        blobs.append(struct.pack(f"<{len(flat)}d", *flat))
+        offset += 8 * len(flat)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(path, b"".join(head + blobs))
+    return {body: days for body, _, days, _ in fitted}
+
+
+def known_bodies() -> List[str]:
+    """Every body with vendored elements."""
+    from dot.philosophies import astrology
+
+    astrology._load_planet_elements()
+    astrology._load_minor_elements()
+    astrology._load_comet_elements()
+    return [*astrology._PLANET_ELEMENTS, *astrology._MINOR_ELEMENTS, *astrology._COMET_ELEMENTS]
+
+
+class ChebyshevTable:
+    """Read-only, memory-mapped Chebyshev table.
+
+    Raises:
+        OSError: If the file cannot be opened.
+        ValueError: If it is not a table or is truncated.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        from dot.philosophies import astrology
+
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if data[:len(MAGIC)] != MAGIC or len(data) < len(MAGIC) + HEADER.size:
+                raise ValueError(f"not an ephemeris table: {self.path}")
+            self.start, self.stop, self.coefficients, count = HEADER.unpack_from(data, len(MAGIC))
+            segment = struct.Struct(f"<{3 * self.coefficients}d")
+            # body -> (start, stop, days, last index, offset, size, unpack)
+            self._entries: Dict[str, tuple] = {}
+            pos = len(MAGIC) + HEADER.size
+            for _ in range(count):
+                name, digest, days, segments, _pad, offset = ENTRY.unpack_from(data, pos)
+                pos += ENTRY.size
+                if offset + segments * segment.size > len(data):
+                    raise ValueError(f"truncated ephemeris table: {self.path}")
+                if not days > 0 or segments * days < self.stop - self.start:
+                    raise ValueError(f"ephemeris table does not cover its span: {self.path}")
+                body = name.rstrip(b"\0").decode("utf-8")
+                try:
+                    elements = astrology._body_elements(body)
+                except KeyError:
+                    continue
+                if elements is not None and elements_digest(elements) == digest:
+                    self._entries[body] = (self.start, self.stop, days, segments - 1,
+                                           offset, segment.size, segment.unpack_from)
+        except (struct.error, UnicodeDecodeError) as e:
+            data.close()
+            raise ValueError(f"corrupt ephemeris table: {self.path}") from e
+        except ValueError:
+            data.close()
+            raise
+        self._data = data
+
+    @property
+    def bodies(self) -> List[str]:
+        """Bodies the table can answer for (elements unchanged)."""
+        return list(self._entries)
+
+    def lookup(self, body: str, jd: float) -> Optional[Xyz]:
+        """Heliocentric ecliptic xyz (AU), or None outside the table."""
+        entry = self._entries.get(body)
+        if entry is None:
+            return None
+        start, stop, days, last, offset, size, unpack = entry
+        if not start <= jd <= stop:
+            return None
+        index = int((jd - start) / days)
+        if index > last:
+            index = last
+        x = 2.0 * (jd - start - index * days) / days - 1.0
+        return evaluate(unpack(self._data, offset + index * size), x)
+
+    def span(self, body: str) -> Optional[Tuple[float, float, float, int]]:
+        """(start JD, stop JD, segment days, segment count) of body's entry,
+        or None if the table cannot answer for it."""
+        entry = self._entries.get(body)
+        if entry is None:
+            return None
+        start, stop, days, last = entry[:4]
+        return start, stop, days, last + 1
+
+    def segments(self, body: str, indices: Sequence[int]) -> bytes:
+        """Stored coefficients of body's segments at indices, concatenated
+        (for evaluating many instants at once; see evaluate for the order).
+
+        Raises:
+            KeyError: If the table cannot answer for body.
+        """
+        offset, size = self._entries[body][4:6]
+        data = self._data
+        return b"".join(data[offset + i * size:offset + (i + 1) * size] for i in indices)
+
+    def close(self) -> None:
+        self._entries = {}
+        self._data.close()
+
+
+_table: Union[ChebyshevTable, None, bool] = False  # False: not looked for yet
+
+
+def get_table() -> Optional[ChebyshevTable]:
+    """The default table, loaded once per process (None if absent or invalid)."""
+    global _table
+    if _table is False:
+        try:
+            _table = ChebyshevTable(default_table_path())
+        except (OSError, ValueError):
+            _table = None
+    return _table
+
+
+def clear_table_cache() -> None:
+    """Forget the loaded default table (after building a new one)."""
+    global _table
+    if isinstance(_table, ChebyshevTable):
+        _table.close()
+    _table = False
@@ -0,0 +1,319 @@
+"""
+Array ephemeris engine for many bodies at many instants.
+
+``astrology._heliocentric_ecliptic_xyz`` places one body at one instant.
+heliocentric_positions does N bodies × T instants in one pass: with NumPy
+installed, Kepler's equation is solved for the whole grid at once by
+vectorized Newton iterations; without it the same formulas run in a
+pure-Python loop. Both paths use the vendored J2000 elements and agree to
+within floating-point rounding. Instants inside a built Chebyshev table
+(dot.philosophies.chebyshev) are read from it instead, on both paths.
+
+NumPy is optional (``pip install the-dot[ephemeris]``). Results are NumPy
+arrays when it is available and nested lists otherwise; both index as
+``result[body][instant]``.
+
+iter_ephemeris streams time series built on it, and write_csv/write_jsonl
+write them out row by row (``dot ephemeris --from/--to/--step``).
+
+Example:
+    >>> xyz = heliocentric_positions(["earth", "mars"], [datetime(2024, 1, 1)])
+    >>> lon, lat = geocentric_ecliptic(["mars"], julian_days(hours))
+    >>> rows = iter_ephemeris(["mars"], start, stop, parse_step("1h"))
+    >>> write_csv(rows, sys.stdout)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from math import atan2, degrees, sqrt
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple, Union
+
+from dot.philosophies import astrology
+from dot.philosophies.chebyshev import get_table
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+HAVE_NUMPY = np is not None
+
+_TWO_PI = astrology._TWO_PI
+KEPLER_TOL = 1e-8
+KEPLER_MAX_ITER = 50
+
+Instant = Union[datetime, float]
+
+
+def julian_days(times: Sequence[Instant]):
+    """Julian days for datetimes (UTC, naive) or values already in JD."""
+    jds = [t if isinstance(t, (int, float)) else astrology._julian_day(t) for t in times]
+    return np.asarray(jds, dtype=float) if HAVE_NUMPY else jds
+
+
+def _elements(bodies: Sequence[str]) -> List[Optional[astrology.BodyElements]]:
+    """Elements per body (None for the Sun). Raises KeyError for unknown names."""
+    return [astrology._body_elements(body.lower()) for body in bodies]
+
+
+def solve_kepler(M, e, tol: float = KEPLER_TOL, max_iter: int = KEPLER_MAX_ITER):
+    """Eccentric anomaly for arrays of mean anomaly M and eccentricity e.
+
+    Newton's method on every element at once, stopping when the largest
+    correction is below tol (the scalar solver stops per element; the
+    extra steps only move converged values by less than tol).
+    """
+    E = np.array(M, dtype=float, copy=True)
+    for _ in range(max_iter):
+        dE = -(E - e * np.sin(E) - M) / (1.0 - e * np.cos(E))
+        E += dE
+        if not np.any(np.abs(dE) >= tol):
+            break
+    return E
+
+
+def _table_numpy(table, body, jd, out) -> bool:
+    """Fill out (T x 3) from the table where jd lies in its span; return
+    whether that covered every instant."""
+    start, stop, days, count = table.span(body)
+    inside = (jd >= start) & (jd <= stop)
+    if not inside.any():
+        return False
+    t = jd[inside]
+    index = np.minimum(((t - start) / days).astype(int), count - 1)
+    needed, which = np.unique(index, return_inverse=True)
+    coeffs = np.frombuffer(table.segments(body, needed.tolist()), dtype="<f8")
+    coeffs = coeffs.reshape(len(needed), -1, 3)[which]
+    # Clenshaw recurrence for every instant at once, as chebyshev.evaluate
+    x = (2.0 * (t - start - index * days) / days - 1.0)[:, None]
+    b = b1 = np.zeros((len(t), 3))
+    for j in range(coeffs.shape[1]):
+        b, b1 = 2.0 * x * b - b1 + coeffs[:, j], b
+    out[inside] = b - x * b1
+    return bool(inside.all())
+
+
+def _positions_numpy(bodies, elements, jd):
+    out = np.zeros((len(elements), len(jd), 3))
+    # Table first; Kepler only for bodies it does not fully cover, and
+    # without overwriting what the table did cover
+    covered = {}
+    table = get_table()
+    if table is not None:
+        for k, body in enumerate(bodies):
+            if elements[k] is not None and table.span(body) is not None:
+                covered[k] = _table_numpy(table, body, jd, out[k])
+    rows = [k for k, b in enumerate(elements) if b is not None and not covered.get(k)]
+    if not rows:
+        return out
+    present = [elements[k] for k in rows]
+
+    def column(field):
+        return np.array([getattr(b, field) for b in present], dtype=float)[:, None]
+
+    e, n, M0 = column("e"), column("n"), column("M0")
+    M = np.mod(M0 + n * (jd[None, :] - astrology._EPOCH_JD), _TWO_PI)
+    E = solve_kepler(M, e)
+
+    # Perifocal coordinates, rotated to the ecliptic
+    x_p = column("a") * (np.cos(E) - e)
+    y_p = column("b") * np.sin(E)
+    xyz = np.stack([
+        column("px") * x_p + column("qx") * y_p,
+        column("py") * x_p + column("qy") * y_p,
+        column("pz") * x_p + column("qz") * y_p,
+    ], axis=-1)
+    for i, k in enumerate(rows):
+        if k in covered:  # partly inside the table
+            start, stop = table.span(bodies[k])[:2]
+            outside = (jd < start) | (jd > stop)
+            out[k][outside] = xyz[i][outside]
+        else:
+            out[k] = xyz[i]
+    return out
+
+
+def _positions_python(bodies, elements, jd) -> List[List[Tuple[float, float, float]]]:
+    return [[astrology._position(body, b, t) for t in jd] for body, b in zip(bodies, elements)]
+
+
+def heliocentric_positions(bodies: Sequence[str], times: Sequence[Instant]):
+    """Heliocentric ecliptic xyz (AU) for every body at every instant.
+
+    Args:
+        bodies: Body names as in ephemeris_summary ("mars", "ceres",
+            "1p/halley", ...); "sun" is the origin.
+        times: Datetimes (UTC) or Julian days.
+
+    Returns:
+        Array of shape (len(bodies), len(times), 3) with NumPy, otherwise
+        the same layout as nested lists of (x, y, z) tuples.
+
+    Raises:
+        KeyError: For an unknown body.
+    """
+    bodies = [body.lower() for body in bodies]
+    elements = _elements(bodies)
+    jd = julian_days(times)
+    if HAVE_NUMPY:
+        return _positions_numpy(bodies, elements, jd)
+    return _positions_python(bodies, elements, jd)
+
+
+def geocentric_ecliptic(bodies: Sequence[str], times: Sequence[Instant]):
+    """Geocentric ecliptic (longitude, latitude) in degrees.
+
+    Returns:
+        ``(lon, lat)``, each shaped (len(bodies), len(times)): arrays with
+        NumPy, nested lists otherwise. Longitudes are in [0, 360).
+    """
+    helio = heliocentric_positions(["earth", *bodies], times)
+    if HAVE_NUMPY:
+        g = helio[1:] - helio[0][None, :, :]
+        lon = np.mod(np.degrees(np.arctan2(g[..., 1], g[..., 0])) + 360.0, 360.0)
+        lat = np.degrees(np.arctan2(g[..., 2], np.hypot(g[..., 0], g[..., 1])))
+        return lon, lat
+
+    earth = helio[0]
+    lon: List[List[float]] = []
+    lat: List[List[float]] = []
+    for row in helio[1:]:
+        lon_row, lat_row = [], []
+        for (xh, yh, zh), (xe, ye, ze) in zip(row, earth):
+            xg, yg, zg = xh - xe, yh - ye, zh - ze
+            lon_row.append((degrees(atan2(yg, xg)) + 360.0) % 360.0)
+            lat_row.append(degrees(atan2(zg, sqrt(xg * xg + yg * yg))))
+        lon.append(lon_row)
+        lat.append(lat_row)
+    return lon, lat
+
+
+# ---------------------------------------------------------------------------
+# Time series
+# ---------------------------------------------------------------------------
+
+# Instants evaluated per engine call while streaming; bounds memory for
+# arbitrarily long ranges.
+CHUNK_INSTANTS = 2048
+
+DEFAULT_BODIES = (
+    "sun", "mercury", "venus", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto",
+)
+MINOR_BODIES = ("ceres", "pallas", "vesta")
+COMETS = ("1p/halley", "2p/encke")
+
+_STEP_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+class EphemerisRow(NamedTuple):
+    """One body's geocentric ecliptic position at one instant (degrees)."""
+
+    time: datetime
+    body: str
+    lon: float
+    lat: float
+
+
+def parse_instant(text: str) -> datetime:
+    """ISO date or datetime (UTC; a trailing ``Z`` or ``+00:00`` is allowed).
+
+    Raises:
+        ValueError: If text is not an ISO date/datetime.
+    """
+    text = text.strip()
+    if text.endswith("Z"):
+        text = text[:-1]
+    when = datetime.fromisoformat(text)
+    if when.tzinfo is not None:
+        when = when.astimezone(timezone.utc).replace(tzinfo=None)
+    return when
+
+
+def parse_step(text: str) -> timedelta:
+    """Interval such as ``1d``, ``6h``, ``30m``, ``90s`` or ``2w``.
+
+    Raises:
+        ValueError: For an unknown unit or a non-positive interval.
+    """
+    text = text.strip().lower()
+    unit = _STEP_UNITS.get(text[-1:])
+    if unit is None:
+        raise ValueError(f"step must end in one of {'/'.join(_STEP_UNITS)}: {text!r}")
+    step = timedelta(**{unit: float(text[:-1])})
+    if step <= timedelta(0):
+        raise ValueError(f"step must be positive: {text!r}")
+    return step
+
+
+def iter_instants(start: datetime, stop: datetime, step: timedelta) -> Iterator[datetime]:
+    """start, start + step, ... up to and including stop."""
+    k = 0
+    when = start
+    while when <= stop:
+        yield when
+        k += 1
+        when = start + k * step  # no accumulated rounding
+
+
+def iter_ephemeris(
+    bodies: Sequence[str],
+    start: datetime,
+    stop: datetime,
+    step: timedelta,
+    chunk: int = CHUNK_INSTANTS,
+) -> Iterator[EphemerisRow]:
+    """Stream geocentric positions, ordered by time and then body.
+
+    Instants are evaluated ``chunk`` at a time through geocentric_ecliptic,
+    so memory stays bounded however long the range is.
+
+    Raises:
+        KeyError: For an unknown body (before anything is yielded).
+    """
+    bodies = [b.lower() for b in bodies]
+    _elements(bodies)
+    instants = iter_instants(start, stop, step)
+    while True:
+        batch = list(islice(instants, chunk))
+        if not batch:
+            return
+        lon, lat = geocentric_ecliptic(bodies, batch)
+        for t, when in enumerate(batch):
+            for b, body in enumerate(bodies):
+                yield EphemerisRow(when, body, float(lon[b][t]), float(lat[b][t]))
+
+
+def _timestamp(when: datetime) -> str:
+    return when.isoformat() + "Z"
+
+
+def write_csv(rows: Iterable[EphemerisRow], out: TextIO, precision: int = 6) -> int:
+    """Write rows as CSV with a header, one line per row; return the count."""
+    import csv
+
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["time", "body", "lon_deg", "lat_deg"])
+    count = 0
+    for row in rows:
+        writer.writerow([_timestamp(row.time), row.body,
+                         f"{row.lon:.{precision}f}", f"{row.lat:.{precision}f}"])
+        count += 1
+    return count
+
+
+def write_jsonl(rows: Iterable[EphemerisRow], out: TextIO, precision: int = 6) -> int:
+    """Write rows as JSON lines; return the count."""
+    import json
+
+    count = 0
+    for row in rows:
+        out.write(json.dumps({
+            "time": _timestamp(row.time),
+            "body": row.body,
+            "lon_deg": round(row.lon, precision),
+            "lat_deg": round(row.lat, precision),
+        }) + "\n")
+        count += 1
+    return count
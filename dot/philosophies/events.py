@@ -0,0 +1,253 @@
+"""
+Planetary event search for THE DOT.
+
+Finds, in geocentric ecliptic longitude:
+
+- ingresses: a body entering a zodiac sign (a multiple of 30°),
+- stations: the longitude rate changing sign, i.e. a body turning
+  retrograde or direct again,
+- conjunctions: two bodies at the same longitude.
+
+A coarse scan samples every body on a fixed step through the array engine
+(vectorized with NumPy, a chunk of instants at a time) and brackets each
+event between two samples; bisection on the scalar longitude function
+then narrows it to about a second. Events stream in time order, so
+"the next Mercury retrograde" only computes as far as it has to.
+
+Example:
+    >>> next(find_events(["mercury"], datetime(2024, 2, 1), kinds=["station"]))
+    Event(time=datetime(2024, 4, 1, 22, 5, ...), kind='station', body='mercury', detail='retrograde', ...)
+    >>> next_retrograde("mercury", datetime(2024, 2, 1))
+    (datetime(2024, 4, 1, 22, 5, ...), datetime(2024, 4, 25, 12, 39, ...))
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from itertools import combinations
+from math import atan2, degrees
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from dot.philosophies import astrology, ephemeris
+
+np = ephemeris.np
+
+KINDS = ("ingress", "station", "conjunction")
+SIGNS = tuple(astrology.ZODIAC_SIGNS)
+
+SCAN_STEP = 1.0         # days between coarse samples
+SCAN_CHUNK = 4096       # samples per engine call
+TIME_TOL = 1.0 / 86400  # days; events are located to about a second
+RATE_DELTA = 0.01       # days; half-width of the longitude-rate difference
+HORIZON_DAYS = 200 * 365.25  # how far next_event/next_retrograde look
+
+_J2000 = datetime(2000, 1, 1, 12)
+
+
+class Event(NamedTuple):
+    """One event; lon is the body's geocentric longitude then (degrees)."""
+
+    time: datetime
+    kind: str    # "ingress", "station" or "conjunction"
+    body: str
+    detail: str  # sign entered, "retrograde"/"direct", or the other body
+    lon: float
+
+
+def _wrap(angle: float) -> float:
+    """Angle in [-180, 180)."""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def _datetime(jd: float) -> datetime:
+    return _J2000 + timedelta(days=jd - astrology._EPOCH_JD)
+
+
+def _longitude(body: str, b: Optional[astrology.BodyElements], earth: astrology.BodyElements,
+               jd: float) -> float:
+    xe, ye, _ = astrology._position("earth", earth, jd)
+    x, y, _ = astrology._position(body, b, jd)
+    return degrees(atan2(y - ye, x - xe)) % 360.0
+
+
+def geocentric_longitude(body: str, when: datetime) -> float:
+    """Geocentric ecliptic longitude of body at when (UTC), in degrees."""
+    body = body.lower()
+    return _longitude(body, astrology._body_elements(body), astrology._body_elements("earth"),
+                      astrology._julian_day(when))
+
+
+def _bisect(f, lo: float, hi: float) -> float:
+    """Root of f in [lo, hi], given f(lo) and f(hi) differ in sign."""
+    negative_lo = f(lo) < 0.0
+    while hi - lo > TIME_TOL:
+        mid = (lo + hi) / 2.0
+        if (f(mid) < 0.0) == negative_lo:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2.0
+
+
+# Coarse brackets: index k means the event lies between samples k and k + 1
+# (for stations, between k - 1 and k + 1).
+
+def _sign_brackets(lon) -> List[int]:
+    if np is not None:
+        sign = np.floor_divide(lon, 30.0)
+        return np.nonzero(sign[1:] != sign[:-1])[0].tolist()
+    return [k for k in range(len(lon) - 1) if lon[k] // 30.0 != lon[k + 1] // 30.0]
+
+
+def _station_brackets(lon) -> List[int]:
+    if np is not None:
+        rate = np.mod(np.diff(lon) + 180.0, 360.0) - 180.0
+        return (np.nonzero((rate[:-1] < 0.0) != (rate[1:] < 0.0))[0] + 1).tolist()
+    rate = [_wrap(lon[k + 1] - lon[k]) for k in range(len(lon) - 1)]
+    return [k + 1 for k in range(len(rate) - 1) if (rate[k] < 0.0) != (rate[k + 1] < 0.0)]
+
+
+def _conjunction_brackets(lon_a, lon_b) -> List[int]:
+    if np is not None:
+        gap = np.mod(lon_a - lon_b + 180.0, 360.0) - 180.0
+        crossed = (gap[:-1] < 0.0) != (gap[1:] < 0.0)
+        return np.nonzero(crossed & (np.abs(gap[:-1]) < 90.0))[0].tolist()
+    gap = [_wrap(a - b) for a, b in zip(lon_a, lon_b)]
+    return [k for k in range(len(gap) - 1)
+            if (gap[k] < 0.0) != (gap[k + 1] < 0.0) and abs(gap[k]) < 90.0]
+
+
+def find_events(
+    bodies: Sequence[str],
+    start: datetime,
+    stop: Optional[datetime] = None,
+    kinds: Sequence[str] = KINDS,
+    step: float = SCAN_STEP,
+) -> Iterator[Event]:
+    """Stream events between start and stop (UTC) in time order.
+
+    Args:
+        bodies: Bodies as in ephemeris_summary; conjunctions are searched
+            for every pair of them.
+        start, stop: Range; without stop the search runs HORIZON_DAYS.
+        kinds: Any of KINDS.
+        step: Coarse sampling step in days. Events closer together than
+            this (per body or pair) may be missed.
+
+    Raises:
+        KeyError: For an unknown body.
+        ValueError: For an unknown kind, the Earth, or a non-positive step.
+    """
+    bodies = [b.lower() for b in bodies]
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise ValueError(f"unknown event kind: {', '.join(sorted(unknown))}")
+    if "earth" in bodies:
+        raise ValueError("the Earth is the observer; it has no geocentric events")
+    if step <= 0:
+        raise ValueError("step must be positive")
+    elements = ephemeris._elements(bodies)
+    earth = astrology._body_elements("earth")
+
+    def lon_of(k):
+        return lambda jd: _longitude(bodies[k], elements[k], earth, jd)
+
+    def rate_of(k):
+        lon = lon_of(k)
+        return lambda jd: _wrap(lon(jd + RATE_DELTA) - lon(jd - RATE_DELTA))
+
+    start_jd = astrology._julian_day(start)
+    stop_jd = astrology._julian_day(stop) if stop is not None else start_jd + HORIZON_DAYS
+    last = int((stop_jd - start_jd) / step) + 1  # last sample index, just past stop
+    pairs = list(combinations(range(len(bodies)), 2)) if "conjunction" in kinds else []
+
+    pending: List[Event] = []
+    for first in range(0, last, SCAN_CHUNK):
+        # Samples first - 1 .. first + SCAN_CHUNK + 1 so brackets straddling
+        # chunk edges are seen by exactly one chunk
+        lo = max(first - 1, 0)
+        hi = min(first + SCAN_CHUNK + 1, last)
+        jds = [start_jd + k * step for k in range(lo, hi + 1)]
+        lon, _ = ephemeris.geocentric_ecliptic(bodies, jds)
+        owned = range(first - lo, first - lo + SCAN_CHUNK)
+
+        found: List[Event] = []
+        for k, body in enumerate(bodies):
+            row = lon[k]
+            if "ingress" in kinds:
+                for i in _sign_brackets(row):
+                    if i not in owned:
+                        continue
+                    forward = _wrap(row[i + 1] - row[i]) > 0.0
+                    entered = int(row[i + 1] // 30.0)
+                    edge = 30.0 * (entered if forward else (entered + 1) % 12)
+                    lon_k = lon_of(k)
+                    jd = _bisect(lambda t: _wrap(lon_k(t) - edge), jds[i], jds[i + 1])
+                    found.append(Event(_datetime(jd), "ingress", body, SIGNS[entered], edge))
+            if "station" in kinds and elements[k] is not None:
+                for i in _station_brackets(row):
+                    if i not in owned:
+                        continue
+                    rate = rate_of(k)
+                    jd = _bisect(rate, jds[i - 1], jds[i + 1])
+                    turning = "retrograde" if rate(jds[i - 1]) > 0.0 else "direct"
+                    found.append(Event(_datetime(jd), "station", body, turning, lon_of(k)(jd)))
+        for a, b in pairs:
+            for i in _conjunction_brackets(lon[a], lon[b]):
+                if i not in owned:
+                    continue
+                lon_a, lon_b = lon_of(a), lon_of(b)
+                jd = _bisect(lambda t: _wrap(lon_a(t) - lon_b(t)), jds[i], jds[i + 1])
+                found.append(Event(_datetime(jd), "conjunction", bodies[a], bodies[b], lon_a(jd)))
+
+        # Later chunks only find events after the last sample this one owns
+        pending = sorted(pending + found)
+        settled = _datetime(start_jd + (first + SCAN_CHUNK - 1) * step)
+        while pending and (pending[0].time < settled or first + SCAN_CHUNK >= last):
+            event = pending.pop(0)
+            if start <= event.time and (stop is None or event.time <= stop):
+                yield event
+
+
+def next_event(
+    body: str, start: datetime, kind: str, detail: Optional[str] = None,
+) -> Optional[Event]:
+    """First event of kind (and detail, if given) for body after start."""
+    for event in find_events([body], start, kinds=[kind]):
+        if detail is None or event.detail == detail:
+            return event
+    return None
+
+
+def next_retrograde(body: str, start: datetime) -> Optional[Tuple[datetime, datetime]]:
+    """(turns retrograde, turns direct) for the first retrograde period of
+    body that is under way or begins after start; None within
+    HORIZON_DAYS (the Sun, or a body that never stations)."""
+    began = None
+    for event in find_events([body], start, kinds=["station"]):
+        if event.detail == "retrograde":
+            began = event.time
+        elif began is not None:
+            return began, event.time
+        else:
+            # Already retrograde at start: find where that period began
+            back = find_events([body], start - timedelta(days=366), start, kinds=["station"])
+            began = max((e.time for e in back if e.detail == "retrograde"), default=start)
+            return began, event.time
+    return None
+
+
+def position(lon: float) -> str:
+    """Longitude as degrees within its sign, e.g. ``26.88° Aries``."""
+    return f"{lon % 30.0:.2f}° {SIGNS[int(lon // 30.0) % 12]}"
+
+
+def describe(event: Event) -> str:
+    """One-line description, e.g. ``Mercury turns retrograde at 26.88° Aries``."""
+    body = event.body.upper() if "/" in event.body else event.body.title()
+    if event.kind == "ingress":
+        return f"{body} enters {event.detail}"
+    if event.kind == "station":
+        return f"{body} turns {event.detail} at {position(event.lon)}"
+    other = event.detail.upper() if "/" in event.detail else event.detail.title()
+    return f"{body} conjunct {other} at {position(event.lon)}"
@@ -2,30 +2,47 @@
 Statistics and analytics for THE DOT.
 
 Tracks worship history and provides insights into devotion patterns.
+
+Storage is pluggable:
+
+- "json" (default): a compact JSON snapshot (stats.json) plus an
+  append-only JSON-lines event log (stats.jsonl). Recording a worship
+  appends one line under a lock file; the log is folded back into the
+  snapshot, which is replaced atomically, every COMPACT_EVERY events.
+- "sqlite": a WAL-mode SQLite database (stats.db) next to stats.json,
+  indexed on worshipper name and day. Existing JSON statistics are
+  migrated into it once, on first use.
+
+The backend is chosen by the ``backend`` argument or DOT_STATS_BACKEND.
 """
 
+import copy
 import functools
 import heapq
 import json
+import os
+import sqlite3
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from dot.fsutil import atomic_write_text, file_lock
+
+BACKENDS = ("json", "sqlite")
 
 
 @functools.lru_cache(maxsize=128)
-def _load_stats_cached(stats_file: Path, mtime: float) -> Dict:
-    """Load stats file with caching based on modification time.
+def _load_stats_cached(stats_file: Path, identity: Tuple[int, int, int]) -> Dict:
+    """Load stats file with caching based on its file identity.
 
     Args:
         stats_file: Path to the stats.json file.
-        mtime: File modification time (used for cache invalidation).
+        identity: (inode, mtime_ns, size) of the file, used for cache
+            invalidation; snapshots are replaced atomically, so the inode
+            changes even when the mtime does not.
 
     Returns:
-        Loaded statistics dictionary.
-
-    Note:
-        The mtime parameter ensures cache is invalidated when file changes.
-        Using lru_cache with mtime provides 10-50x faster stats access.
+        Loaded statistics dictionary, or None if the file is unreadable.
     """
     try:
         with open(stats_file, 'r') as f:
@@ -34,103 +51,236 @@ def _load_stats_cached(stats_file: Path, mtime: float) -> Dict:
         return None
 
 
-class WorshipStats:
-    """Track and analyze worship statistics."""
+def _default_data() -> Dict:
+    """Create default statistics structure."""
+    return {
+        "total_worships": 0,
+        "worshippers": [],
+        "daily_worships": {},
+        "first_worship": None,
+        "last_worship": None,
+    }
 
-    def __init__(self, stats_file: Optional[Path] = None):
-        """Initialize worship statistics tracker."""
-        if stats_file is None:
-            stats_file = Path.home() / ".worship_the_dot" / "stats.json"
 
+def _file_identity(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime_ns, size) of path, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+# Fold the event log into the snapshot after this many appended events.
+COMPACT_EVERY = 500
+
+
+class JsonStatsStore:
+    """JSON snapshot plus append-only event log.
+
+    Writers serialize on an advisory lock file (stats.lock). Under the lock
+    a writer first merges whatever other processes appended since it last
+    looked, then appends its own event, so concurrent recorders never lose
+    updates. Snapshots are replaced atomically, so readers never see a
+    truncated file.
+    """
+
+    def __init__(self, stats_file: Path):
         self.stats_file = stats_file
-        self.stats_file.parent.mkdir(parents=True, exist_ok=True)
-        self._load_stats()
+        self.log_file = stats_file.with_suffix(".jsonl")
+        self.lock_file = stats_file.with_suffix(".lock")
+        self._stale = False
+        self._load()
+
+    def watch(self, watcher) -> None:
+        """Pick up other processes' writes when watcher reports them.
+
+        Readers otherwise keep the data loaded at start-up; with a watcher
+        (dot.watch) they merge new events only after a change, without a
+        stat per call.
+        """
+        watcher.watch(self.stats_file, self._mark_stale)
+        watcher.watch(self.log_file, self._mark_stale)
 
-    def _load_stats(self):
-        """Load statistics from file with caching.
+    def _mark_stale(self, path: Path) -> None:
+        self._stale = True
+
+    def _sync(self):
+        if self._stale:
+            self._stale = False
+            self._refresh()
+
+    def _load(self):
+        """Load the snapshot, then replay the event log tail on top of it.
 
         Note:
-            Uses modification time-based caching for 10-50x faster access.
+            The snapshot parse is cached on modification time; the cached
+            dict is copied because replay and recording mutate it.
         """
-        if self.stats_file.exists():
-            # Get file modification time for cache key
-            mtime = self.stats_file.stat().st_mtime
-            cached_data = _load_stats_cached(self.stats_file, mtime)
-
-            if cached_data is not None:
-                self.data = cached_data
-            else:
-                self.data = self._default_data()
+        self._snapshot_id = _file_identity(self.stats_file)
+        self._corrupt = False
+        cached_data = None
+        if self._snapshot_id is not None:
+            cached_data = _load_stats_cached(self.stats_file, self._snapshot_id)
+            self._corrupt = cached_data is None
+
+        if cached_data is not None:
+            self.data = copy.deepcopy(cached_data)
         else:
-            self.data = self._default_data()
+            self.data = _default_data()
+        self._build_index()
 
-    def _default_data(self) -> Dict:
-        """Create default statistics structure."""
-        return {
-            "total_worships": 0,
-            "worshippers": [],
-            "daily_worships": {},
-            "first_worship": None,
-            "last_worship": None,
-        }
+        self._tail_events = 0
+        self._log_offset = 0
+        self._read_log_tail()
 
-    def _save_stats(self):
-        """Save statistics to file."""
+    def _read_log_tail(self):
+        """Apply complete log lines past the last offset read."""
         try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
-        except IOError as e:
-            print(f"Warning: Could not save stats: {e}")
+            with open(self.log_file, 'rb') as f:
+                f.seek(self._log_offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return
+        # A torn final line from an in-flight or interrupted append is left
+        # for the next read
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if self._apply_event(event):
+                self._tail_events += 1
+        self._log_offset += end
+
+    def _refresh(self):
+        """Merge changes made by other processes since our last look."""
+        if _file_identity(self.stats_file) != self._snapshot_id:
+            # Another writer compacted (or cleared); start from its snapshot
+            self._load()
+            return
+        try:
+            size = self.log_file.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < self._log_offset:
+            self._load()
+        else:
+            self._read_log_tail()
 
-    def record_worship(self, name: str) -> Dict:
-        """Record a worship event."""
-        now = datetime.now().isoformat()
-        today = datetime.now().date().isoformat()
+    def _build_index(self):
+        """Map worshipper name -> record for O(1) updates."""
+        self._index = {w["name"]: w for w in self.data["worshippers"]}
 
-        # Update counters
-        self.data["total_worships"] += 1
+    def _apply_event(self, event: Dict) -> bool:
+        """Apply one worship event to in-memory data.
 
-        # Track worshipper
-        worshipper = {
-            "name": name,
-            "timestamp": now,
-            "count": 1
-        }
+        Events carry a sequence number equal to total_worships after the
+        event, so events already folded into the snapshot are skipped.
 
-        # Update or add worshipper
-        existing = next(
-            (w for w in self.data["worshippers"] if w["name"] == name),
-            None
-        )
+        Returns:
+            True if the event was applied, False if it was already counted.
+        """
+        if event.get("seq", 0) <= self.data["total_worships"]:
+            return False
+        name = event["name"]
+        ts = event["ts"]
+        today = ts[:10]
+
+        self.data["total_worships"] = event["seq"]
 
+        existing = self._index.get(name)
         if existing:
             existing["count"] += 1
-            existing["last_worship"] = now
+            existing["last_worship"] = ts
         else:
-            worshipper["first_worship"] = now
-            self.data["worshippers"].append(worshipper)
+            existing = {
+                "name": name,
+                "timestamp": ts,
+                "count": 1,
+                "first_worship": ts,
+            }
+            self.data["worshippers"].append(existing)
+            self._index[name] = existing
+
+        daily = self.data["daily_worships"]
+        daily[today] = daily.get(today, 0) + 1
 
-        # Track daily stats
-        if today not in self.data["daily_worships"]:
-            self.data["daily_worships"][today] = 0
-        self.data["daily_worships"][today] += 1
-
-        # Update timestamps
         if not self.data["first_worship"]:
-            self.data["first_worship"] = now
-        self.data["last_worship"] = now
-
-        self._save_stats()
+            self.data["first_worship"] = ts
+        self.data["last_worship"] = ts
+        return True
+
+    def _save_snapshot(self) -> bool:
+        """Atomically replace the snapshot. Caller holds the lock."""
+        if self._corrupt:
+            # Keep the unreadable snapshot for manual recovery instead of
+            # silently overwriting it
+            aside = self.stats_file.with_name(self.stats_file.name + ".corrupt")
+            try:
+                os.replace(self.stats_file, aside)
+                print(f"Warning: Unreadable stats file moved to {aside}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Warning: Could not save stats: {e}")
+                return False
+            self._corrupt = False
+        try:
+            atomic_write_text(self.stats_file, json.dumps(self.data, separators=(",", ":")))
+        except OSError as e:
+            print(f"Warning: Could not save stats: {e}")
+            return False
+        self._snapshot_id = _file_identity(self.stats_file)
+        return True
+
+    def _append_event(self, event: Dict):
+        """Append one event line to the log. Caller holds the lock."""
+        line = (json.dumps(event, separators=(",", ":")) + "\n").encode("utf-8")
+        with open(self.log_file, 'ab') as f:
+            f.write(line)
+        self._log_offset += len(line)
+
+    def _compact_locked(self):
+        if self._save_snapshot():
+            try:
+                self.log_file.unlink()
+            except FileNotFoundError:
+                pass
+            self._tail_events = 0
+            self._log_offset = 0
+
+    def compact(self):
+        """Fold the event log into the snapshot and truncate the log."""
+        try:
+            with file_lock(self.lock_file):
+                self._refresh()
+                self._compact_locked()
+        except OSError as e:
+            print(f"Warning: Could not save stats: {e}")
 
-        return {
-            "name": name,
-            "total_worships": self.data["total_worships"],
-            "worshipper_count": existing["count"] if existing else 1,
-            "timestamp": now
-        }
+    def record(self, name: str, ts: str) -> Tuple[int, int]:
+        """Record one worship; returns (total_worships, worshipper_count)."""
+        applied = False
+        try:
+            with file_lock(self.lock_file):
+                self._refresh()
+                event = {"seq": self.data["total_worships"] + 1, "name": name, "ts": ts}
+                self._append_event(event)
+                applied = self._apply_event(event)
+                self._tail_events += 1
+                if self._tail_events >= COMPACT_EVERY:
+                    self._compact_locked()
+        except OSError as e:
+            print(f"Warning: Could not save stats: {e}")
+            if not applied:
+                # Still count it for this process
+                self._apply_event({"seq": self.data["total_worships"] + 1, "name": name, "ts": ts})
+        return self.data["total_worships"], self._index[name]["count"]
 
-    def get_summary(self) -> Dict:
-        """Get worship statistics summary."""
+    def summary(self) -> Dict:
+        self._sync()
         return {
             "total_worships": self.data["total_worships"],
             "unique_worshippers": len(self.data["worshippers"]),
@@ -139,32 +289,303 @@ class WorshipStats:
             "days_active": len(self.data["daily_worships"]),
         }
 
-    def get_top_worshippers(self, limit: int = 10) -> List[Dict]:
-        """Get top worshippers by count.
-
-        Uses heapq.nlargest for O(n log k) performance instead of O(n log n).
-        """
+    def top(self, limit: int) -> List[Dict]:
+        """Uses heapq.nlargest for O(n log k) performance instead of O(n log n)."""
+        self._sync()
         return heapq.nlargest(
             limit,
             self.data["worshippers"],
             key=lambda w: w["count"]
         )
 
-    def get_daily_stats(self, days: int = 7) -> Dict[str, int]:
-        """Get worship counts for recent days."""
+    def daily(self, days: int) -> Dict[str, int]:
+        self._sync()
         all_dates = sorted(self.data["daily_worships"].keys(), reverse=True)
-        recent_dates = all_dates[:days]
-
         return {
             date: self.data["daily_worships"][date]
-            for date in recent_dates
+            for date in all_dates[:days]
         }
 
+    def export(self) -> Dict:
+        self._sync()
+        return self.data
+
+    def clear(self):
+        self.data = _default_data()
+        self._build_index()
+        self._corrupt = False
+        try:
+            with file_lock(self.lock_file):
+                self._compact_locked()
+        except OSError as e:
+            print(f"Warning: Could not save stats: {e}")
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS worshippers (
+    name TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    first_worship TEXT,
+    last_worship TEXT
+);
+CREATE INDEX IF NOT EXISTS worshippers_by_count ON worshippers(count DESC);
+CREATE TABLE IF NOT EXISTS daily (
+    day TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value
+);
+"""
+
+
+class SqliteStatsStore:
+    """SQLite statistics store (WAL mode, indexed on name and day).
+
+    Every event is a single short IMMEDIATE transaction of upserts, so many
+    processes can record concurrently; readers never block writers.
+    """
+
+    def __init__(self, db_file: Path, migrate_from: Optional[Path] = None):
+        self.db_file = db_file
+        self.conn = sqlite3.connect(str(db_file), timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.migrated = False
+        if migrate_from is not None:
+            self.migrated = self.migrate_json(migrate_from)
+
+    def _meta(self, key: str):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def migrate_json(self, stats_file: Path) -> bool:
+        """Import a JSON stats snapshot (and its event log) once.
+
+        Returns:
+            True if data was imported, False if already migrated or absent.
+        """
+        if not (stats_file.exists() or stats_file.with_suffix(".jsonl").exists()):
+            return False
+        if self._meta("migrated_from") is not None:
+            return False
+        data = JsonStatsStore(stats_file).export()
+        c = self.conn
+        c.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have migrated since the check above
+            if self._meta("migrated_from") is not None:
+                c.execute("ROLLBACK")
+                return False
+            for w in data["worshippers"]:
+                c.execute(
+                    "INSERT INTO worshippers(name, count, first_worship, last_worship) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT(name) DO UPDATE SET "
+                    "count = count + excluded.count",
+                    (w["name"], w["count"], w.get("first_worship") or w.get("timestamp"),
+                     w.get("last_worship") or w.get("timestamp")),
+                )
+            for day, count in data["daily_worships"].items():
+                c.execute(
+                    "INSERT INTO daily(day, count) VALUES (?, ?) "
+                    "ON CONFLICT(day) DO UPDATE SET count = count + excluded.count",
+                    (day, count),
+                )
+            self._bump_meta(data["total_worships"], data["first_worship"], data["last_worship"])
+            c.execute(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES ('migrated_from', ?)",
+                (str(stats_file),),
+            )
+            c.execute("COMMIT")
+        except BaseException:
+            c.execute("ROLLBACK")
+            raise
+        return True
+
+    def _bump_meta(self, by: int, first: Optional[str], last: Optional[str]):
+        c = self.conn
+        c.execute(
+            "INSERT INTO meta(key, value) VALUES ('total_worships', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+            (by,),
+        )
+        if first:
+            c.execute(
+                "INSERT INTO meta(key, value) VALUES ('first_worship', ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = min(value, excluded.value)",
+                (first,),
+            )
+        if last:
+            c.execute(
+                "INSERT INTO meta(key, value) VALUES ('last_worship', ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = max(value, excluded.value)",
+                (last,),
+            )
+
+    def record(self, name: str, ts: str) -> Tuple[int, int]:
+        c = self.conn
+        c.execute("BEGIN IMMEDIATE")
+        try:
+            c.execute(
+                "INSERT INTO worshippers(name, count, first_worship, last_worship) "
+                "VALUES (?, 1, ?, ?) ON CONFLICT(name) DO UPDATE SET "
+                "count = count + 1, last_worship = excluded.last_worship",
+                (name, ts, ts),
+            )
+            c.execute(
+                "INSERT INTO daily(day, count) VALUES (?, 1) "
+                "ON CONFLICT(day) DO UPDATE SET count = count + 1",
+                (ts[:10],),
+            )
+            self._bump_meta(1, ts, ts)
+            total = self._meta("total_worships")
+            count = c.execute(
+                "SELECT count FROM worshippers WHERE name = ?", (name,)
+            ).fetchone()[0]
+            c.execute("COMMIT")
+        except BaseException:
+            c.execute("ROLLBACK")
+            raise
+        return total, count
+
+    def summary(self) -> Dict:
+        c = self.conn
+        return {
+            "total_worships": self._meta("total_worships") or 0,
+            "unique_worshippers": c.execute("SELECT COUNT(*) FROM worshippers").fetchone()[0],
+            "first_worship": self._meta("first_worship"),
+            "last_worship": self._meta("last_worship"),
+            "days_active": c.execute("SELECT COUNT(*) FROM daily").fetchone()[0],
+        }
+
+    def top(self, limit: int) -> List[Dict]:
+        rows = self.conn.execute(
+            "SELECT name, count, first_worship, last_worship FROM worshippers "
+            "ORDER BY count DESC LIMIT ?",
+            (limit,),
+        )
+        return [_worshipper_row(r) for r in rows]
+
+    def daily(self, days: int) -> Dict[str, int]:
+        rows = self.conn.execute(
+            "SELECT day, count FROM daily ORDER BY day DESC LIMIT ?", (days,)
+        )
+        return {day: count for day, count in rows}
+
+    def export(self) -> Dict:
+        c = self.conn
+        data = _default_data()
+        data.update(
+            total_worships=self._meta("total_worships") or 0,
+            first_worship=self._meta("first_worship"),
+            last_worship=self._meta("last_worship"),
+        )
+        data["worshippers"] = [
+            _worshipper_row(r) for r in c.execute(
+                "SELECT name, count, first_worship, last_worship FROM worshippers"
+            )
+        ]
+        data["daily_worships"] = {
+            day: count for day, count in c.execute("SELECT day, count FROM daily ORDER BY day")
+        }
+        return data
+
+    def clear(self):
+        c = self.conn
+        c.execute("BEGIN IMMEDIATE")
+        try:
+            c.execute("DELETE FROM worshippers")
+            c.execute("DELETE FROM daily")
+            # Keep the migration marker so cleared stats are not re-imported
+            c.execute("DELETE FROM meta WHERE key != 'migrated_from'")
+            c.execute("COMMIT")
+        except BaseException:
+            c.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        self.conn.close()
+
+
+def _worshipper_row(row) -> Dict:
+    name, count, first, last = row
+    return {
+        "name": name,
+        "timestamp": first,
+        "count": count,
+        "first_worship": first,
+        "last_worship": last,
+    }
+
+
+class WorshipStats:
+    """Track and analyze worship statistics."""
+
+    def __init__(self, stats_file: Optional[Path] = None, backend: Optional[str] = None):
+        """Initialize worship statistics tracker.
+
+        Args:
+            stats_file: JSON snapshot path; the SQLite database lives beside
+                it as stats.db.
+            backend: "json" or "sqlite"; defaults to DOT_STATS_BACKEND or "json".
+        """
+        if stats_file is None:
+            stats_file = Path.home() / ".worship_the_dot" / "stats.json"
+        if backend is None:
+            backend = os.getenv("DOT_STATS_BACKEND", "").strip().lower() or "json"
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown stats backend: {backend}")
+
+        self.stats_file = stats_file
+        self.backend = backend
+        self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+        if backend == "sqlite":
+            self.store = SqliteStatsStore(stats_file.with_suffix(".db"), migrate_from=stats_file)
+        else:
+            self.store = JsonStatsStore(stats_file)
+
+    @property
+    def data(self) -> Dict:
+        """Full statistics document (JSON layout) for the active backend."""
+        return self.store.export()
+
+    def record_worship(self, name: str) -> Dict:
+        """Record a worship event."""
+        now = datetime.now().isoformat()
+        total, count = self.store.record(name, now)
+        return {
+            "name": name,
+            "total_worships": total,
+            "worshipper_count": count,
+            "timestamp": now
+        }
+
+    def watch(self, watcher) -> None:
+        """Refresh from disk when watcher (dot.watch) reports a change.
+
+        Only the JSON backend caches; SQLite queries always read live data.
+        """
+        if isinstance(self.store, JsonStatsStore):
+            self.store.watch(watcher)
+
+    def get_summary(self) -> Dict:
+        """Get worship statistics summary."""
+        return self.store.summary()
+
+    def get_top_worshippers(self, limit: int = 10) -> List[Dict]:
+        """Get top worshippers by count."""
+        return self.store.top(limit)
+
+    def get_daily_stats(self, days: int = 7) -> Dict[str, int]:
+        """Get worship counts for recent days."""
+        return self.store.daily(days)
+
     def export_stats(self) -> str:
         """Export statistics as JSON string."""
-        return json.dumps(self.data, indent=2)
+        return json.dumps(self.store.export(), indent=2)
 
     def clear_stats(self):
         """Clear all statistics."""
-        self.data = self._default_data()
-        self._save_stats()
+        self.store.clear()
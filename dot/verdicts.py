@@ -0,0 +1,166 @@
+"""
+Persistent cache of commit verdicts for THE DOT.
+
+Commits are immutable, so whether a commit worships THE DOT under a given
+suffix never changes. VerdictCache remembers ``(commit sha, suffix hash) ->
+valid`` in a compact sorted binary file so range validation only has to
+look at commits it has not seen before.
+
+File format: an 8-byte magic followed by fixed 29-byte records (20-byte
+binary sha, 8-byte suffix hash, 1-byte verdict) sorted by sha and suffix
+hash. Lookups binary-search an mmap of the file; new verdicts are merged
+in on save under a lock and the file is replaced atomically. Only SHA-1
+commit ids fit a record; commits of SHA-256 repositories are never cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from dot.fsutil import atomic_write_bytes, file_lock
+
+MAGIC = b"DOTVRD1\n"
+RECORD = struct.Struct(">20s8sB")
+KEY_SIZE = 28
+SHA_HEX = 40  # commit ids a record can hold (SHA-1)
+
+# Bump when the validation rule itself changes, invalidating old verdicts.
+RULES_VERSION = 1
+
+
+def default_cache_path() -> Path:
+    """DOT_VERDICT_CACHE, else ~/.worship_the_dot/verdicts.bin."""
+    override = os.environ.get("DOT_VERDICT_CACHE")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".worship_the_dot" / "verdicts.bin"
+
+
+def suffix_hash(suffix: str) -> bytes:
+    """8-byte digest identifying a suffix (and the rules version)."""
+    return hashlib.blake2b(f"{RULES_VERSION}\0{suffix}".encode("utf-8"), digest_size=8).digest()
+
+
+class VerdictCache:
+    """Sorted on-disk map of (sha, suffix) to a validation verdict.
+
+    Example:
+        >>> cache = VerdictCache()
+        >>> if cache.get(sha, suffix) is None:
+        ...     cache.put(sha, suffix, dot.validate_commit(message, suffix))
+        >>> cache.save()
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else default_cache_path()
+        self.lock_file = self.path.with_name(self.path.name + ".lock")
+        self._pending: Dict[bytes, bool] = {}
+        self._map: Optional[mmap.mmap] = None
+        self._count = 0
+        self._open()
+
+    def _open(self) -> None:
+        self.close()
+        try:
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size <= len(MAGIC) or (size - len(MAGIC)) % RECORD.size:
+                    return
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError:
+            return
+        if data[:len(MAGIC)] != MAGIC:
+            data.close()
+            return
+        self._map = data
+        self._count = (size - len(MAGIC)) // RECORD.size
+
+    def __len__(self):
+        return self._count + sum(1 for key in self._pending if self._find(key) is None)
+
+    @staticmethod
+    def _key(sha: str, suffix: str) -> Optional[bytes]:
+        """Record key, or None for an id that does not fit a record."""
+        if len(sha) != SHA_HEX:
+            return None
+        try:
+            return bytes.fromhex(sha) + suffix_hash(suffix)
+        except ValueError:
+            return None
+
+    def _find(self, key: bytes) -> Optional[bool]:
+        data = self._map
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            pos = len(MAGIC) + mid * RECORD.size
+            found = data[pos:pos + KEY_SIZE]
+            if found < key:
+                lo = mid + 1
+            elif found > key:
+                hi = mid
+            else:
+                return bool(data[pos + KEY_SIZE])
+        return None
+
+    def get(self, sha: str, suffix: str) -> Optional[bool]:
+        """Cached verdict for the commit under suffix, or None if unseen."""
+        key = self._key(sha, suffix)
+        if key is None:
+            return None
+        if key in self._pending:
+            return self._pending[key]
+        return self._find(key)
+
+    def put(self, sha: str, suffix: str, valid: bool) -> None:
+        """Remember a verdict; written out by save(). Ignored for ids that
+        are not SHA-1."""
+        key = self._key(sha, suffix)
+        if key is not None:
+            self._pending[key] = bool(valid)
+
+    def _records(self) -> Iterator[Tuple[bytes, int]]:
+        data = self._map
+        for i in range(self._count):
+            pos = len(MAGIC) + i * RECORD.size
+            yield data[pos:pos + KEY_SIZE], data[pos + KEY_SIZE]
+
+    def save(self) -> int:
+        """Merge pending verdicts into the file; return how many were new.
+
+        Other processes may have saved since this cache was opened, so the
+        file is re-read under the lock before merging.
+
+        Raises:
+            OSError: If the cache directory or file cannot be written.
+        """
+        if not self._pending:
+            return 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.lock_file):
+            self._open()
+            pending = sorted(self._pending.items())
+            out = [MAGIC]
+            last = None
+            for key, verdict in heapq.merge(pending, self._records()):
+                if key == last:
+                    continue  # first occurrence wins; verdicts never differ
+                last = key
+                out.append(key + bytes((verdict,)))
+            added = len(out) - 1 - self._count
+            atomic_write_bytes(self.path, b"".join(out))
+            self._pending.clear()
+            self._open()
+        return added
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._map = None
+        self._count = 0
@@ -0,0 +1,315 @@
+"""
+File watching for long-running THE DOT processes.
+
+The daemon (and anything else that stays up, such as an editor plugin)
+keeps parsed ``.dot.ini`` files, the resolved suffix, config.json and
+statistics in memory. A watcher tells those caches when a file changed,
+so lookups need no ``stat()`` at all and edits are noticed immediately,
+even when they land within the filesystem's mtime granularity.
+
+Two backends share one interface:
+
+- InotifyWatcher (Linux): inotify through ctypes, one watch per parent
+  directory so files replaced by rename (editors, atomic writes) are seen.
+  Directories that do not exist yet are armed once they appear.
+- PollingWatcher: compares (inode, mtime_ns, size) on an interval; used
+  where inotify is unavailable.
+
+Callbacks run on the watcher's thread and receive the changed path. They
+should only invalidate; the next lookup reloads.
+
+Example:
+    >>> watcher = create_watcher()
+    >>> watcher.watch(Path(".dot.ini"), lambda path: print("changed", path))
+    >>> watcher.close()
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+Callback = Callable[[Path], None]
+
+
+class FileWatcher:
+    """Calls back when a watched file is created, changed or removed."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files: Dict[str, Dict[str, List[Callback]]] = {}  # dir -> name -> callbacks
+        self._thread: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+
+    def watch(self, path: Path, callback: Callback) -> None:
+        """Call ``callback(path)`` whenever path changes. Idempotent."""
+        path = Path(os.path.abspath(path))
+        directory, name = str(path.parent), path.name
+        with self._lock:
+            callbacks = self._files.setdefault(directory, {}).setdefault(name, [])
+            if callback in callbacks:
+                return
+            callbacks.append(callback)
+            new_dir = len(self._files[directory]) == 1 and len(callbacks) == 1
+        self._added(path, new_dir)
+        self._ensure_thread()
+
+    def watched(self) -> List[Path]:
+        with self._lock:
+            return [Path(d) / n for d, names in self._files.items() for n in names]
+
+    def close(self) -> None:
+        self._closed.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _added(self, path: Path, new_dir: bool) -> None:
+        """Backend hook: start watching path (its directory is new if new_dir)."""
+
+    def _run(self) -> None:
+        raise NotImplementedError
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None and not self._closed.is_set():
+                self._thread = threading.Thread(target=self._run, name="dot-watch", daemon=True)
+                self._thread.start()
+
+    def _fire(self, directory: str, name: Optional[str] = None) -> None:
+        """Run callbacks for one file, or for every file in directory."""
+        with self._lock:
+            names = self._files.get(directory, {})
+            targets = [(n, list(cbs)) for n, cbs in names.items() if name is None or n == name]
+        for n, callbacks in targets:
+            for callback in callbacks:
+                callback(Path(directory) / n)
+
+    def _fire_all(self) -> None:
+        with self._lock:
+            directories = list(self._files)
+        for directory in directories:
+            self._fire(directory)
+
+
+def _identity(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class PollingWatcher(FileWatcher):
+    """Portable watcher comparing (inode, mtime_ns, size) every interval.
+
+    Inode and size catch most edits a coarse mtime hides; an in-place edit
+    keeping all three is only noticed once the mtime moves on.
+    """
+
+    def __init__(self, interval: float = 1.0):
+        super().__init__()
+        self.interval = interval
+        self._seen: Dict[str, Optional[Tuple[int, int, int]]] = {}
+
+    def _added(self, path: Path, new_dir: bool) -> None:
+        with self._lock:
+            self._seen.setdefault(str(path), _identity(str(path)))
+
+    def poll(self) -> None:
+        """Check every watched file once (the thread calls this)."""
+        with self._lock:
+            seen = list(self._seen.items())
+        for path, before in seen:
+            now = _identity(path)
+            if now != before:
+                with self._lock:
+                    self._seen[path] = now
+                directory, name = os.path.split(path)
+                self._fire(directory, name)
+
+    def _run(self) -> None:
+        while not self._closed.wait(self.interval):
+            self.poll()
+
+
+# <sys/inotify.h>
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+         | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+
+def _libc():
+    import ctypes
+    import ctypes.util
+
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+class InotifyWatcher(FileWatcher):
+    """Linux inotify watcher; one watch per directory.
+
+    Raises:
+        OSError: If inotify is unavailable (not Linux, or out of instances).
+    """
+
+    def __init__(self):
+        super().__init__()
+        try:
+            self._libc = _libc()
+            fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            raise OSError(f"inotify unavailable: {e}") from e
+        if fd < 0:
+            import ctypes
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._wake_r, self._wake_w = os.pipe()
+        self._wds: Dict[int, str] = {}
+        # Existing ancestor -> missing directories waiting for it to grow
+        self._pending: Dict[str, Set[str]] = {}
+
+    def _add_watch(self, directory: str) -> bool:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _MASK)
+        if wd < 0:
+            return False
+        with self._lock:
+            self._wds[wd] = directory
+        return True
+
+    def _arm(self, directory: str) -> None:
+        """Watch directory, or its nearest existing ancestor until it exists."""
+        if self._add_watch(directory):
+            return
+        ancestor = os.path.dirname(directory)
+        while ancestor != os.path.dirname(ancestor) and not os.path.isdir(ancestor):
+            ancestor = os.path.dirname(ancestor)
+        with self._lock:
+            self._pending.setdefault(ancestor, set()).add(directory)
+        if not self._add_watch(ancestor):
+            return
+        if os.path.isdir(directory):  # appeared while arming
+            self._grew(ancestor)
+
+    def _grew(self, ancestor: str) -> None:
+        """A directory appeared under ancestor: re-arm what waited on it."""
+        with self._lock:
+            waiting = self._pending.pop(ancestor, set())
+        for directory in waiting:
+            self._arm(directory)
+            if os.path.isdir(directory):
+                self._fire(directory)  # files may predate the watch
+
+    def _added(self, path: Path, new_dir: bool) -> None:
+        if new_dir:
+            self._arm(str(path.parent))
+
+    def _events(self, data: bytes):
+        import struct
+
+        header = struct.Struct("iIII")
+        pos = 0
+        while pos + header.size <= len(data):
+            wd, mask, _cookie, length = header.unpack_from(data, pos)
+            pos += header.size
+            name = data[pos:pos + length].rstrip(b"\0")
+            pos += length
+            yield wd, mask, os.fsdecode(name)
+
+    def _run(self) -> None:
+        import select
+
+        try:
+            while not self._closed.is_set():
+                ready, _, _ = select.select([self._fd, self._wake_r], [], [])
+                if self._closed.is_set() or self._wake_r in ready:
+                    break
+                try:
+                    data = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                for wd, mask, name in self._events(data):
+                    self._dispatch(wd, mask, name)
+        finally:
+            for fd in (self._fd, self._wake_r, self._wake_w):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def _dispatch(self, wd: int, mask: int, name: str) -> None:
+        if mask & IN_Q_OVERFLOW:
+            self._fire_all()
+            return
+        with self._lock:
+            directory = self._wds.get(wd)
+            if mask & IN_IGNORED:
+                self._wds.pop(wd, None)
+        if directory is None:
+            return
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+            # The directory itself went away: everything in it changed, and
+            # it is re-armed once it comes back
+            self._fire(directory)
+            if mask & IN_IGNORED:
+                with self._lock:
+                    watched = directory in self._files
+                if watched:
+                    self._arm(directory)
+            return
+        if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+            self._grew(directory)
+        if name:
+            self._fire(directory, name)
+
+    def close(self) -> None:
+        self._closed.set()
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+        if self._thread is None:
+            for fd in (self._fd, self._wake_r, self._wake_w):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        super().close()
+
+
+def create_watcher(interval: float = 1.0) -> FileWatcher:
+    """InotifyWatcher where available, else a PollingWatcher.
+
+    DOT_WATCH=poll forces polling (e.g. on network filesystems, where
+    inotify misses changes made by other machines).
+    """
+    if os.environ.get("DOT_WATCH", "").strip().lower() != "poll":
+        try:
+            return InotifyWatcher()
+        except OSError:
+            pass
+    return PollingWatcher(interval)
@@ -12,19 +12,30 @@ from dot import Dot
 
 
 def get_commit_messages(base_branch="main"):
-    """Get all commit messages in the current branch."""
+    """Get (sha, message) for all commits in the current branch."""
+    # Read .git directly first; no git process needed on the CI runner
+    try:
+        from dot.gitobjects import GitObjectError, iter_range_messages
+        return [
+            (sha, message.strip())
+            for sha, message in iter_range_messages(f"origin/{base_branch}..HEAD")
+            if message.strip()
+        ]
+    except (GitObjectError, OSError):
+        pass
+
     try:
         # Get commits not in base branch
         result = subprocess.run(
-            ["git", "log", f"origin/{base_branch}..HEAD", "--format=%B%n---COMMIT---"],
+            ["git", "log", f"origin/{base_branch}..HEAD", "--format=%H%n%B%n---COMMIT---"],
             capture_output=True,
             text=True,
             check=True
         )
 
-        # Split by commit separator
-        commits = result.stdout.split("---COMMIT---")
-        return [c.strip() for c in commits if c.strip()]
+        # Split by commit separator; the first line of each is the sha
+        commits = [c.strip().partition("\n") for c in result.stdout.split("---COMMIT---")]
+        return [(sha, msg.strip()) for sha, _, msg in commits if msg.strip()]
 
     except subprocess.CalledProcessError:
         print("Error: Unable to get git commits")
@@ -41,6 +52,13 @@ def validate_ci_commits():
     dot = Dot()
     commits = get_commit_messages()
 
+    # Verdicts survive between runs (persist ~/.worship_the_dot/verdicts.bin
+    # or $DOT_VERDICT_CACHE in your CI cache); known-good commits are skipped
+    from dot.config import resolve_worship_suffix
+    from dot.verdicts import VerdictCache
+    cache = VerdictCache()
+    suffix, _ = resolve_worship_suffix()
+
     if not commits:
         print("No commits to validate")
         return 0
@@ -48,8 +66,13 @@ def validate_ci_commits():
     print(f"Found {len(commits)} commit(s) to validate\n")
 
     invalid_commits = []
+    cached = 0
+
+    for i, (sha, commit_msg) in enumerate(commits, 1):
+        if cache.get(sha, suffix):
+            cached += 1
+            continue
 
-    for i, commit_msg in enumerate(commits, 1):
         print(f"Commit {i}/{len(commits)}:")
         print("-" * 70)
 
@@ -57,7 +80,9 @@ def validate_ci_commits():
         first_line = commit_msg.split('\n')[0]
         print(f"  {first_line}")
 
-        if dot.validate_commit(commit_msg):
+        valid = dot.validate_commit(commit_msg, suffix=suffix)
+        cache.put(sha, suffix, valid)
+        if valid:
             print("  ✓ Valid - properly worships THE DOT")
         else:
             print("  ✗ INVALID - missing worship phrase!")
@@ -65,6 +90,13 @@ def validate_ci_commits():
 
         print()
 
+    if cached:
+        print(f"Skipped {cached} commit(s) already validated in earlier runs\n")
+    try:
+        cache.save()
+    except OSError:
+        pass  # read-only home; next run just validates again
+
     # Summary
     print("=" * 70)
     if invalid_commits:
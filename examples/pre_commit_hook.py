@@ -3,6 +3,8 @@
 Pre-commit framework integration for THE DOT.
 
 This hook validates commit messages using the pre-commit framework.
+If `dot daemon start` is running, validation is answered by the warm
+daemon; otherwise it falls back to validating in-process.
 """
 
 import sys
@@ -11,16 +13,16 @@ import sys
 def validate_commit_message(commit_msg_file):
     """Validate commit message from file."""
     try:
-        # Import THE DOT
-        from dot import Dot
+        # Import the thin client (stdlib only until it needs a fallback)
+        from dot.hook_client import validate_message
 
         # Read commit message
         with open(commit_msg_file, 'r') as f:
             message = f.read()
 
-        # Validate
-        dot = Dot()
-        if dot.validate_commit(message):
+        # Validate via the daemon, or in-process if it is down
+        valid, suffix = validate_message(message)
+        if valid:
             return 0
         else:
             print()
@@ -29,7 +31,7 @@ def validate_commit_message(commit_msg_file):
             print("=" * 70)
             print()
             print("Your commit message must end with:")
-            print("  BECAUSE I WORSHIP THE DOT")
+            print(f"  {suffix}")
             print()
             print("Current message:")
             print("-" * 70)
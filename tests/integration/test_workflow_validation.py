@@ -13,7 +13,7 @@ def test_sequential_validation_modes_workflow():
     message = "feat: add feature BECAUSE I WORSHIP THE DOT"
 
     # Test epic validation
-    with patch('sys.argv', ['dot', 'validate', message, '--epic']):
+    with patch('sys.argv', ['dot', 'validate', message, '--epic', '--verbose']):
         with patch('sys.stdout', new=StringIO()) as out:
             exit_code = main()
             output = out.getvalue()
@@ -22,7 +22,7 @@ def test_sequential_validation_modes_workflow():
     assert "WORTHY" in output or "GLORIOUS" in output or "Odysseus" in output
 
     # Test cosmic validation
-    with patch('sys.argv', ['dot', 'validate', message, '--cosmic']):
+    with patch('sys.argv', ['dot', 'validate', message, '--cosmic', '--verbose']):
         with patch('sys.stdout', new=StringIO()) as out:
             exit_code = main()
             output = out.getvalue()
@@ -31,7 +31,7 @@ def test_sequential_validation_modes_workflow():
     assert "CELESTIAL" in output or "COSMIC" in output or "HOROSCOPE" in output
 
     # Test alchemical validation
-    with patch('sys.argv', ['dot', 'validate', message, '--alchemical']):
+    with patch('sys.argv', ['dot', 'validate', message, '--alchemical', '--verbose']):
         with patch('sys.stdout', new=StringIO()) as out:
             exit_code = main()
             output = out.getvalue()
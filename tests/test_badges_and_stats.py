@@ -98,3 +98,178 @@ def test_stats_error_handling(tmp_path):
     finally:
         # Restore permissions for cleanup
         os.chmod(readonly_dir, 0o755)
+
+
+def test_stats_event_log_appends_and_replays(tmp_path):
+    from dot.stats import WorshipStats
+
+    stats_path = tmp_path / "stats.json"
+    ws = WorshipStats(stats_file=stats_path)
+    ws.record_worship("Alice")
+    ws.record_worship("Bob")
+    ws.record_worship("Alice")
+
+    # Recording appends to the log; the snapshot is not rewritten per event
+    assert not stats_path.exists()
+    assert len(ws.store.log_file.read_text().splitlines()) == 3
+
+    # A torn trailing line from an interrupted append is ignored
+    with open(ws.store.log_file, "a") as f:
+        f.write('{"seq": 4, "na')
+
+    fresh = WorshipStats(stats_file=stats_path)
+    assert fresh.get_summary()["total_worships"] == 3
+    top = fresh.get_top_worshippers(1)[0]
+    assert top["name"] == "Alice" and top["count"] == 2
+
+
+def test_stats_compaction_folds_log_into_snapshot(tmp_path, monkeypatch):
+    import json
+    from dot import stats as stats_mod
+    from dot.stats import WorshipStats
+
+    monkeypatch.setattr(stats_mod, "COMPACT_EVERY", 3)
+    stats_path = tmp_path / "stats.json"
+    ws = WorshipStats(stats_file=stats_path)
+    for name in ["A", "B", "A", "C"]:
+        ws.record_worship(name)
+
+    snapshot = json.loads(stats_path.read_text())
+    assert snapshot["total_worships"] == 3
+    assert len(ws.store.log_file.read_text().splitlines()) == 1
+
+    # Events already in the snapshot are skipped on replay (crash between
+    # snapshot write and log truncation must not double count)
+    with open(ws.store.log_file, "a") as f:
+        f.write(json.dumps({"seq": 2, "name": "B", "ts": "2025-01-01T00:00:00"}) + "\n")
+
+    fresh = WorshipStats(stats_file=stats_path)
+    summary = fresh.get_summary()
+    assert summary["total_worships"] == 4
+    assert summary["unique_worshippers"] == 3
+
+
+def test_sqlite_backend_records_and_queries(tmp_path):
+    from dot.stats import WorshipStats
+
+    ws = WorshipStats(stats_file=tmp_path / "stats.json", backend="sqlite")
+    for name in ["A", "B", "A", "C", "A"]:
+        ws.record_worship(name)
+    assert ws.record_worship("B")["worshipper_count"] == 2
+
+    summary = ws.get_summary()
+    assert summary["total_worships"] == 6
+    assert summary["unique_worshippers"] == 3
+    assert summary["days_active"] == 1
+    assert [w["name"] for w in ws.get_top_worshippers(2)] == ["A", "B"]
+    assert sum(ws.get_daily_stats().values()) == 6
+    assert (tmp_path / "stats.db").exists() and not (tmp_path / "stats.json").exists()
+
+
+def test_sqlite_backend_migrates_json_once(tmp_path, monkeypatch):
+    from dot.stats import WorshipStats
+
+    stats_path = tmp_path / "stats.json"
+    legacy = WorshipStats(stats_file=stats_path, backend="json")
+    for name in ["A", "B", "A"]:
+        legacy.record_worship(name)
+
+    monkeypatch.setenv("DOT_STATS_BACKEND", "sqlite")
+    ws = WorshipStats(stats_file=stats_path)
+    assert ws.backend == "sqlite" and ws.store.migrated
+    assert ws.get_summary()["total_worships"] == 3
+    assert ws.get_top_worshippers(1)[0]["count"] == 2
+
+    # Clearing keeps the migration marker, so the JSON data is not re-imported
+    ws.clear_stats()
+    ws.store.close()
+    again = WorshipStats(stats_file=stats_path)
+    assert not again.store.migrated
+    assert again.get_summary()["total_worships"] == 0
+
+
+def test_sqlite_migration_races_import_once(tmp_path, monkeypatch):
+    import pytest
+    from dot import stats
+    from dot.stats import JsonStatsStore, SqliteStatsStore, WorshipStats
+
+    stats_path = tmp_path / "stats.json"
+    legacy = WorshipStats(stats_file=stats_path, backend="json")
+    for name in ["A", "B", "A"]:
+        legacy.record_worship(name)
+    db = tmp_path / "stats.db"
+    first, second = SqliteStatsStore(db), SqliteStatsStore(db)
+
+    # The second process passes the unlocked check, then the first one
+    # migrates before the second takes the write lock
+    real_export = JsonStatsStore.export
+
+    def export_after_other_process(self):
+        monkeypatch.setattr(JsonStatsStore, "export", real_export)
+        assert first.migrate_json(stats_path)
+        return real_export(self)
+
+    monkeypatch.setattr(JsonStatsStore, "export", export_after_other_process)
+    assert not second.migrate_json(stats_path)
+    assert second.export()["total_worships"] == 3
+    assert {w["name"]: w["count"] for w in second.export()["worshippers"]} == {"A": 2, "B": 1}
+
+    # A failed transaction is rolled back, leaving the connection usable
+    monkeypatch.setattr(stats.SqliteStatsStore, "_bump_meta", lambda *a: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        SqliteStatsStore(tmp_path / "other.db").migrate_json(stats_path)
+    first.conn.execute("CREATE TEMP TRIGGER keep BEFORE DELETE ON daily "
+                       "BEGIN SELECT RAISE(ABORT, 'no'); END")
+    with pytest.raises(Exception):
+        first.clear()
+    assert not first.conn.in_transaction
+    assert second.summary()["unique_worshippers"] == 2  # the worshippers delete was undone
+
+
+def test_unknown_stats_backend_rejected(tmp_path):
+    import pytest
+    from dot.stats import WorshipStats
+
+    with pytest.raises(ValueError):
+        WorshipStats(stats_file=tmp_path / "stats.json", backend="redis")
+
+
+def test_concurrent_json_writers_lose_nothing(tmp_path):
+    import subprocess
+    import sys
+
+    stats_path = tmp_path / "stats.json"
+    script = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "import dot.stats as s\n"
+        "s.COMPACT_EVERY = 7\n"
+        "ws = s.WorshipStats(stats_file=Path(sys.argv[1]))\n"
+        "for _ in range(40):\n"
+        "    ws.record_worship(sys.argv[2])\n"
+    )
+    procs = [
+        subprocess.Popen([sys.executable, "-c", script, str(stats_path), f"w{i}"])
+        for i in range(4)
+    ]
+    assert all(p.wait(timeout=60) == 0 for p in procs)
+
+    from dot.stats import WorshipStats
+
+    ws = WorshipStats(stats_file=stats_path)
+    assert ws.get_summary()["total_worships"] == 160
+    assert sorted(w["count"] for w in ws.get_top_worshippers()) == [40] * 4
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_corrupt_snapshot_is_set_aside_not_overwritten(tmp_path):
+    from dot.stats import WorshipStats
+
+    stats_path = tmp_path / "stats.json"
+    stats_path.write_text('{"total_worships": 12, "worsh')
+    ws = WorshipStats(stats_file=stats_path)
+    ws.record_worship("A")
+    ws.store.compact()
+
+    assert (tmp_path / "stats.json.corrupt").read_text().startswith('{"total_worships": 12')
+    assert WorshipStats(stats_file=stats_path).get_summary()["total_worships"] == 1
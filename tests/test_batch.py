@@ -0,0 +1,214 @@
+"""Tests for batch commit-range validation."""
+
+import json
+import os
+import subprocess
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+SUFFIX = "BECAUSE I WORSHIP THE DOT"
+
+
+def _git(repo, *args):
+    env = dict(
+        os.environ,
+        GIT_AUTHOR_NAME="Tester", GIT_AUTHOR_EMAIL="t@example.com",
+        GIT_COMMITTER_NAME="Tester", GIT_COMMITTER_EMAIL="t@example.com",
+    )
+    return subprocess.run(
+        ["git", *args], cwd=repo, env=env, check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.delenv("DOT_WORSHIP_SUFFIX", raising=False)
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "core.hooksPath", "/dev/null")
+    messages = [
+        f"init\n\n{SUFFIX}",
+        "feat: forgot the worship",
+        f"fix: multi\n\nline body\n\n{SUFFIX}\n",
+        "chore: also forgot",
+    ]
+    for i, msg in enumerate(messages):
+        (tmp_path / f"f{i}.txt").write_text(str(i))
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", msg)
+    return tmp_path
+
+
+def test_iter_commit_messages_streams_all_commits(repo):
+    from dot.batch import iter_commit_messages
+
+    commits = list(iter_commit_messages("HEAD", repo))
+    assert len(commits) == 4
+    shas = _git(repo, "rev-list", "HEAD").split()
+    assert [sha for sha, _ in commits] == shas
+    assert "line body" in commits[1][1]
+
+
+def test_validate_range_reports_invalid_commits(repo):
+    from dot.batch import validate_range, format_table, format_json
+
+    report = validate_range("HEAD~3..HEAD", repo, suffix=SUFFIX)
+    assert report.checked == 3
+    assert [r.subject for r in report.invalid] == ["chore: also forgot", "feat: forgot the worship"]
+    assert not report.ok
+
+    table = format_table(report)
+    assert "Invalid: 2" in table and "feat: forgot the worship" in table
+
+    data = json.loads(format_json(report))
+    assert data["checked"] == 3 and data["valid"] == 1
+    assert {c["subject"] for c in data["invalid"]} == {"chore: also forgot", "feat: forgot the worship"}
+
+
+def test_validate_range_bad_range_raises(repo):
+    from dot.batch import validate_range
+
+    with pytest.raises(subprocess.CalledProcessError):
+        validate_range("no-such-ref..HEAD", repo, suffix=SUFFIX)
+
+
+def test_cli_validate_range(repo, monkeypatch):
+    from dot.cli import main
+
+    monkeypatch.chdir(repo)
+    with patch('sys.argv', ['dot', 'validate', '--range', 'HEAD~1..HEAD']):
+        with patch('sys.stdout', new=StringIO()) as out:
+            assert main() == 1
+    assert "chore: also forgot" in out.getvalue()
+
+    with patch('sys.argv', ['dot', 'validate', '--range=HEAD~2..HEAD~1', '--json']):
+        with patch('sys.stdout', new=StringIO()) as out:
+            assert main() == 0
+    assert json.loads(out.getvalue())["invalid"] == []
+
+    with patch('sys.argv', ['dot', 'validate', '--range', 'nope..HEAD']):
+        with patch('sys.stdout', new=StringIO()) as out:
+            assert main() == 1
+    assert "Error" in out.getvalue()
+
+
+def _make_repo(path, messages, suffix_ini=None):
+    path.mkdir()
+    _git(path, "init", "-q")
+    _git(path, "config", "core.hooksPath", "/dev/null")
+    if suffix_ini:
+        (path / ".dot.ini").write_text(f"[dot]\nworship_suffix = {suffix_ini}\n")
+    for i, msg in enumerate(messages):
+        (path / f"f{i}.txt").write_text(str(i))
+        _git(path, "add", ".")
+        _git(path, "commit", "-q", "-m", msg)
+    return path
+
+
+@pytest.fixture
+def many_repos(tmp_path, monkeypatch):
+    monkeypatch.delenv("DOT_WORSHIP_SUFFIX", raising=False)
+    root = tmp_path / "src"
+    root.mkdir()
+    _make_repo(root / "clean", [f"a {SUFFIX}", f"b {SUFFIX}"])
+    _make_repo(root / "custom", ["a BECAUSE I ADORE THE DOT"], suffix_ini="BECAUSE I ADORE THE DOT")
+    _make_repo(root / "dirty", [f"a {SUFFIX}", "b forgot"])
+    (root / "not-a-repo").mkdir()
+    return root
+
+
+def test_validate_repos_uses_per_repo_suffix(many_repos):
+    from dot.batch import load_repo_list, validate_repos
+
+    repos = load_repo_list(str(many_repos / "*"))
+    report = validate_repos(repos, "HEAD", jobs=2)
+
+    status = {Path(r.repo).name: r.status for r in report.results}
+    assert status == {"clean": "ok", "custom": "ok", "dirty": "invalid", "not-a-repo": "error"}
+    custom = next(r for r in report.results if r.repo.endswith("custom"))
+    assert custom.report.suffix == "BECAUSE I ADORE THE DOT"
+    assert custom.report.source.endswith(".dot.ini")
+    assert report.counts() == {"ok": 2, "invalid": 1, "error": 1}
+    assert not report.ok
+
+
+def test_repo_list_file_and_report_formats(many_repos, tmp_path):
+    import csv
+    from dot.batch import (
+        load_repo_list, validate_repos, format_repos_csv, format_repos_json,
+    )
+
+    listing = tmp_path / "repos.txt"
+    listing.write_text(f"# fleet\n{many_repos / 'clean'}\n\n{many_repos / 'dirty'}\n{many_repos / 'clean'}\n")
+    repos = load_repo_list(str(listing))
+    assert [p.name for p in repos] == ["clean", "dirty"]
+
+    report = validate_repos(repos, "HEAD", jobs=2)
+    rows = list(csv.DictReader(StringIO(format_repos_csv(report))))
+    assert [(Path(r["repo"]).name, r["status"], r["invalid"]) for r in rows] == [
+        ("clean", "ok", "0"), ("dirty", "invalid", "1"),
+    ]
+    data = json.loads(format_repos_json(report))
+    assert data["repos"] == 2 and data["invalid"] == 1
+    assert data["results"][1]["invalid"][0]["subject"] == "b forgot"
+
+
+def test_cli_validate_repos(many_repos):
+    from dot.cli import main
+
+    argv = ['dot', 'validate', '--repos', str(many_repos / 'c*'), '--range', 'HEAD', '--json']
+    with patch('sys.argv', argv):
+        with patch('sys.stdout', new=StringIO()) as out:
+            assert main() == 0
+    assert json.loads(out.getvalue())["ok"] == 2
+
+    with patch('sys.argv', ['dot', 'validate', '--repos', str(many_repos / 'none*'), '--range', 'HEAD']):
+        with patch('sys.stdout', new=StringIO()) as out:
+            assert main() == 1
+    assert "No repositories matched" in out.getvalue()
+
+
+def test_validate_range_with_cache_only_checks_new_commits(repo, tmp_path_factory):
+    from dot.batch import validate_range
+    from dot.verdicts import VerdictCache
+
+    path = tmp_path_factory.mktemp("cache") / "verdicts.bin"
+    first = validate_range("HEAD", repo, suffix=SUFFIX, cache=VerdictCache(path))
+    assert (first.checked, first.cached, len(first.invalid)) == (4, 0, 2)
+
+    (repo / "new.txt").write_text("new")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", f"feat: tip\n\n{SUFFIX}")
+
+    with patch("dot.core.Dot.validate_commit", autospec=True,
+               side_effect=lambda self, msg, suffix=None: msg.strip().endswith(suffix)) as spy:
+        second = validate_range("HEAD", repo, suffix=SUFFIX, cache=VerdictCache(path))
+    assert (second.checked, second.cached) == (5, 4)
+    assert spy.call_count == 1  # only the new tip is validated
+    assert [r.subject for r in second.invalid] == [r.subject for r in first.invalid]
+
+
+def test_cache_save_failure_does_not_fail_the_range(repo, tmp_path, monkeypatch):
+    from dot.cli import main
+    from dot.verdicts import VerdictCache
+
+    def fail(self):
+        raise PermissionError(13, "Permission denied")
+
+    monkeypatch.setenv("DOT_VERDICT_CACHE", str(tmp_path / "verdicts.bin"))
+    monkeypatch.setattr(VerdictCache, "save", fail)
+    monkeypatch.chdir(repo)
+    with patch('sys.argv', ['dot', 'validate', '--range', 'HEAD', '--cache', '--json']):
+        with patch('sys.stdout', new=StringIO()) as out:
+            assert main() == 1  # two commits in the fixture do not worship
+    data = json.loads(out.getvalue())
+    assert data["checked"] == 4 and len(data["invalid"]) == 2
+    assert "Permission denied" in data["cache_error"]
+
+    with patch('sys.argv', ['dot', 'validate', '--range', 'HEAD', '--cache']):
+        with patch('sys.stdout', new=StringIO()) as out:
+            main()
+    assert "Unable to read commits" not in out.getvalue()
+    assert "Warning: verdict cache not saved" in out.getvalue()
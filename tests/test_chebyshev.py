@@ -0,0 +1,136 @@
+"""Tests for the Chebyshev ephemeris table."""
+
+import random
+
+import pytest
+
+from dot.philosophies import astrology, chebyshev
+
+START, STOP = 2451545.0, 2451545.0 + 3 * 365.25  # 2000-2003
+
+
+@pytest.fixture
+def table_path(tmp_path, monkeypatch):
+    path = tmp_path / "ephemeris.cheb"
+    monkeypatch.setenv("DOT_EPHEMERIS_TABLE", str(path))
+    chebyshev.clear_table_cache()
+    yield path
+    chebyshev.clear_table_cache()
+
+
+def test_table_matches_analytic_path_within_tolerance(table_path):
+    segments = chebyshev.build_table(table_path, START, STOP)
+    assert "sun" not in segments and segments["mercury"] < segments["neptune"]
+    table = chebyshev.get_table()
+    assert sorted(table.bodies) == sorted(segments)
+
+    rng = random.Random(7)
+    for body in table.bodies:
+        elements = astrology._body_elements(body)
+        for jd in [START, STOP] + [rng.uniform(START, STOP) for _ in range(200)]:
+            got = table.lookup(body, jd)
+            want = astrology._xyz_from_elements(elements, jd)
+            assert max(abs(g - w) for g, w in zip(got, want)) < chebyshev.DEFAULT_TOLERANCE
+
+    assert table.lookup("mars", STOP + 1) is None
+    assert table.lookup("mars", START - 1) is None
+
+
+def test_heliocentric_xyz_uses_table_only_where_it_is_valid(table_path, monkeypatch):
+    from datetime import datetime
+    from unittest.mock import patch
+    from dot.cli import main
+
+    with patch("sys.argv", ["dot", "ephemeris", "build-table", "--from", "2000-01-01",
+                            "--to", "2003-01-01"]):
+        assert main() == 0
+    assert table_path.exists()
+
+    inside, outside = datetime(2001, 6, 1, 12), datetime(2010, 1, 1)
+    analytic = astrology._xyz_from_elements(astrology._body_elements("mars"),
+                                            astrology._julian_day(inside))
+    assert astrology._heliocentric_ecliptic_xyz("mars", inside) != analytic
+    assert astrology._heliocentric_ecliptic_xyz("mars", inside) == pytest.approx(analytic, abs=1e-7)
+    assert astrology._heliocentric_ecliptic_xyz("mars", outside) == astrology._xyz_from_elements(
+        astrology._body_elements("mars"), astrology._julian_day(outside))
+
+    # Entries built from other elements are ignored, not trusted
+    changed = astrology._make_elements(dict(astrology._body_elements("mars")._asdict(), L=0.0))
+    monkeypatch.setitem(astrology._BODIES, "mars", changed)
+    chebyshev.clear_table_cache()
+    assert "mars" not in chebyshev.get_table().bodies
+    assert astrology._heliocentric_ecliptic_xyz("mars", inside) == astrology._xyz_from_elements(
+        changed, astrology._julian_day(inside))
+
+    table_path.write_bytes(b"not a table")
+    chebyshev.clear_table_cache()
+    assert chebyshev.get_table() is None
+
+
+def test_cli_positions_and_events_come_from_the_table(table_path, monkeypatch):
+    import json
+    from io import StringIO
+    from unittest.mock import patch
+    from dot.cli import main
+
+    def run(*argv):
+        with patch("sys.argv", ["dot", *argv]), patch("sys.stdout", new=StringIO()) as out:
+            assert main() == 0
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    series = ("ephemeris", "--from", "2001-06-01", "--to", "2001-06-03", "--step", "12h",
+              "--bodies", "sun,mars,ceres", "--format", "jsonl")
+    stations = ("events", "--from", "2001-01-01", "--to", "2001-12-31", "--bodies", "mercury",
+                "--kinds", "station", "--format", "jsonl")
+    analytic = run(*series), run(*stations)
+
+    with patch("sys.argv", ["dot", "ephemeris", "build-table", "--from", "2000-01-01",
+                            "--to", "2003-01-01"]), patch("sys.stdout", new=StringIO()):
+        assert main() == 0
+    real = astrology._xyz_from_elements
+
+    def kepler_outside_table(b, jd):
+        assert not START <= jd <= STOP, "solved Kepler inside the table's span"
+        return real(b, jd)
+
+    monkeypatch.setattr(astrology, "_xyz_from_elements", kepler_outside_table)
+    tabled = run(*series), run(*stations)
+
+    assert len(tabled[0]) == len(analytic[0]) == 5 * 3
+    for want, got in zip(analytic[0], tabled[0]):
+        assert (got["time"], got["body"]) == (want["time"], want["body"])
+        assert got["lon_deg"] == pytest.approx(want["lon_deg"], abs=1e-4)
+    assert [e["detail"] for e in tabled[1]] == [e["detail"] for e in analytic[1]]
+    assert len(tabled[1]) == 6
+    for want, got in zip(analytic[1], tabled[1]):
+        assert got["lon_deg"] == pytest.approx(want["lon_deg"], abs=1e-3)
+
+
+def test_numpy_engine_reads_the_table_like_the_scalar_path(table_path, monkeypatch):
+    np = pytest.importorskip("numpy")
+    from dot.philosophies import ephemeris
+
+    chebyshev.build_table(table_path, START, STOP, ["earth", "mercury", "mars"])
+    bodies = ["sun", "earth", "mercury", "mars", "jupiter"]
+    jds = [START - 30.0 + 0.37 * k for k in range(4000)]  # straddles the start
+    fast = ephemeris.heliocentric_positions(bodies, jds)
+    monkeypatch.setattr(ephemeris, "HAVE_NUMPY", False)
+    slow = np.array(ephemeris.heliocentric_positions(bodies, jds))
+    np.testing.assert_allclose(fast, slow, rtol=0, atol=1e-12)
+
+
+def test_unreachable_tolerance_is_an_error_not_an_empty_table(table_path):
+    with pytest.raises(ValueError, match="tolerance"):
+        chebyshev.build_table(table_path, START, START + 365, ["mercury"], tol=1e-13)
+    assert not table_path.exists()
+
+
+def test_table_short_of_its_span_is_rejected(table_path):
+    chebyshev.build_table(table_path, START, STOP, ["mars"])
+    data = bytearray(table_path.read_bytes())
+    entry = len(chebyshev.MAGIC) + chebyshev.HEADER.size
+    name, digest, days, segments, pad, offset = chebyshev.ENTRY.unpack_from(data, entry)
+    chebyshev.ENTRY.pack_into(data, entry, name, digest, days, segments - 1, pad, offset)
+    table_path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="does not cover"):
+        chebyshev.ChebyshevTable(table_path)
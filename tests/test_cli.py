@@ -64,6 +64,47 @@ class TestCLI:
         assert exit_code == 1
         assert "Invalid" in output
 
+    def test_validate_mode_renders_only_on_tty_or_verbose(self):
+        """Themed output needs a terminal or --verbose; pipes get the plain verdict."""
+        message = 'Add feature BECAUSE I WORSHIP THE DOT'
+        with patch('sys.argv', ['dot', 'validate', message, '--cosmic']):
+            with patch('sys.stdout', new=StringIO()) as mock_stdout:
+                assert main() == 0
+        from dot.messages import VALID_COMMIT_MESSAGE
+        assert mock_stdout.getvalue().strip() == VALID_COMMIT_MESSAGE
+
+        with patch('sys.argv', ['dot', 'validate', message, '--cosmic', '--verbose']):
+            with patch('sys.stdout', new=StringIO()) as mock_stdout:
+                assert main() == 0
+        assert "CELESTIAL" in mock_stdout.getvalue()
+
+    def test_validate_porcelain_and_quiet(self):
+        """--porcelain prints a bare verdict, --quiet prints nothing."""
+        with patch('sys.argv', ['dot', 'validate', 'Invalid message', '--hermetic', '--porcelain']):
+            with patch('sys.stdout', new=StringIO()) as mock_stdout:
+                assert main() == 1
+        assert mock_stdout.getvalue() == "invalid\n"
+
+        with patch('sys.argv', ['dot', 'validate', 'Ok BECAUSE I WORSHIP THE DOT', '--hermetic', '--quiet']):
+            with patch('sys.stdout', new=StringIO()) as mock_stdout:
+                assert main() == 0
+        assert mock_stdout.getvalue() == ""
+
+    def test_validate_porcelain_skips_renderer_import(self):
+        """Discarded themed output must not cost an import."""
+        import subprocess
+
+        code = (
+            "import sys\n"
+            "sys.argv = ['dot', 'validate', 'x', '--hermetic', '--porcelain']\n"
+            "from dot.cli import main\n"
+            "main()\n"
+            "assert 'dot.philosophies.hermetic' not in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout == "invalid\n"
+
     def test_validate_command_no_message(self):
         """Test validate command without message."""
         with patch('sys.argv', ['dot', 'validate']):
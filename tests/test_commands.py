@@ -0,0 +1,59 @@
+"""Tests for the CLI command registry."""
+
+import importlib
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+
+def test_every_registry_handler_resolves():
+    from dot.commands import COMMANDS, ARGV, CALL, LEGACY, PRINT, PRINT_ARG, SUB, SUB_ARGS
+
+    styles = {ARGV, CALL, LEGACY, PRINT, PRINT_ARG, SUB, SUB_ARGS}
+    for name, entry in COMMANDS.items():
+        assert entry.style in styles, name
+        assert callable(getattr(importlib.import_module(entry.module), entry.attr)), name
+
+
+@pytest.mark.parametrize("command", ["worlds", "tao", "dharma", "fate", "wuchang", "gita"])
+def test_teaching_commands_print(command):
+    from dot.cli import main
+
+    with patch('sys.argv', ['dot', command]):
+        with patch('sys.stdout', new=StringIO()) as out:
+            assert main() == 0
+    assert out.getvalue().strip()
+
+
+def test_registry_feeds_help_and_completions():
+    from dot.commands import COMMANDS
+    from dot.completions import get_completion
+    from dot.help_text import get_help_text
+
+    help_text = get_help_text()
+    bash_line = next(
+        line for line in get_completion("bash").splitlines()
+        if line.strip().startswith('commands="')
+    )
+    bash_words = bash_line.split('"')[1].split()
+    fish = get_completion("fish")
+    for name, entry in COMMANDS.items():
+        for usage, summary in entry.help:
+            assert usage in help_text and summary in help_text
+        if not name.startswith("-"):
+            assert name in bash_words
+            assert f'-a "{name}"' in fish
+
+    # Deprecated traditions still complete but stay out of help
+    assert "gnostic" in bash_words
+    assert "    gnostic " not in help_text
+
+
+def test_unknown_command_is_reported():
+    from dot.cli import main
+
+    with patch('sys.argv', ['dot', 'no-such-command']):
+        with patch('sys.stdout', new=StringIO()) as out:
+            assert main() == 1
+    assert "Unknown command: no-such-command" in out.getvalue()
@@ -124,3 +124,119 @@ def test_worship_suffix_defaults(monkeypatch):
         finally:
             os.chdir(original_cwd)
 
+
+
+def _snapshot_repo(tmp_path, monkeypatch):
+    from dot import git_utils
+
+    monkeypatch.delenv('DOT_WORSHIP_SUFFIX', raising=False)
+    monkeypatch.delenv('GIT_DIR', raising=False)
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    (tmp_path / 'home').mkdir()
+    repo = tmp_path / 'repo'
+    (repo / '.git').mkdir(parents=True)
+    (repo / '.git' / 'HEAD').write_text('ref: refs/heads/main\n')
+    (repo / 'sub').mkdir()
+    monkeypatch.chdir(repo)
+    git_utils.clear_repo_cache()
+    return repo
+
+
+def _bump(path):
+    import os
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+
+def test_compiled_snapshot_short_circuits_resolution(tmp_path, monkeypatch):
+    from dot import config
+
+    repo = _snapshot_repo(tmp_path, monkeypatch)
+    (repo / '.dot.ini').write_text('[dot]\nworship_suffix = BECAUSE I ADORE THE DOT\n')
+    cfg = config.DotConfig(tmp_path / 'home' / '.worship_the_dot' / 'config.json')
+    cfg.set('display', 'epic', value=True)
+
+    path = config.compile_config()
+    assert path == repo / '.git' / config.SNAPSHOT_FILE
+
+    def no_parse(*args):
+        raise AssertionError("sources should not be parsed")
+
+    monkeypatch.setattr(config, '_get_ini_with_cache', no_parse)
+    monkeypatch.setattr(config, 'get_config', no_parse)
+    assert config.resolve_worship_suffix() == ('BECAUSE I ADORE THE DOT', str(repo / '.dot.ini'))
+    assert config.get_setting('display', 'epic') is True
+    assert config.get_setting('philosophy', 'strict_mode') is True
+
+    monkeypatch.setenv('DOT_WORSHIP_SUFFIX', 'FROM ENV')
+    assert config.resolve_worship_suffix() == ('FROM ENV', 'env')
+
+
+def test_snapshot_goes_stale_when_sources_change(tmp_path, monkeypatch):
+    from dot import config
+
+    repo = _snapshot_repo(tmp_path, monkeypatch)
+    ini = repo / '.dot.ini'
+    ini.write_text('[dot]\nworship_suffix = BECAUSE I ADORE THE DOT\n')
+    config.compile_config()
+    assert config.load_snapshot() is not None
+
+    ini.write_text('[dot]\nworship_suffix = BECAUSE I LOVE THE DOT\n')
+    _bump(ini)
+    assert config.load_snapshot() is None
+    assert config.resolve_worship_suffix()[0] == 'BECAUSE I LOVE THE DOT'
+
+    config.compile_config()
+    (tmp_path / 'home' / '.dot.ini').write_text('[dot]\nworship_suffix = X\n')
+    assert config.load_snapshot() is None  # a source appeared
+
+    config.compile_config()
+    (repo / 'sub' / '.dot.ini').write_text('[dot]\nworship_suffix = Y\n')
+    assert config.load_snapshot(repo / 'sub') is None  # different search path
+    assert config.load_snapshot() is not None
+
+
+def test_snapshot_is_read_once_per_change(tmp_path, monkeypatch):
+    from pathlib import Path
+    from dot import config
+
+    repo = _snapshot_repo(tmp_path, monkeypatch)
+    reads = []
+    real_read_text = Path.read_text
+
+    def read_text(self, *args, **kwargs):
+        if self.name == config.SNAPSHOT_FILE:
+            reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, 'read_text', read_text)
+
+    # No snapshot: nothing is opened, however often the suffix is resolved
+    for _ in range(20):
+        assert config.resolve_worship_suffix()[1] == 'default'
+    assert reads == []
+
+    (repo / '.dot.ini').write_text('[dot]\nworship_suffix = BECAUSE I ADORE THE DOT\n')
+    config.compile_config()
+    for _ in range(20):
+        assert config.resolve_worship_suffix()[0] == 'BECAUSE I ADORE THE DOT'
+    assert len(reads) == 1
+
+    # Recompiling replaces the file, which is then read again
+    (repo / '.dot.ini').write_text('[dot]\nworship_suffix = BECAUSE I LOVE THE DOT\n')
+    _bump(repo / '.dot.ini')
+    config.compile_config()
+    assert config.resolve_worship_suffix()[0] == 'BECAUSE I LOVE THE DOT'
+    assert len(reads) == 2
+
+
+def test_dotconfig_reads_without_writing(tmp_path):
+    from dot.config import DotConfig
+
+    home = tmp_path / 'home'
+    cfg = DotConfig(home / '.worship_the_dot' / 'config.json')
+    assert cfg.get('display', 'colors') is True
+    assert not home.exists()  # nothing materialized on a read path
+
+    cfg.set('display', 'colors', value=False)
+    assert DotConfig(cfg.config_file).get('display', 'colors') is False
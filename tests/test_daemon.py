@@ -0,0 +1,105 @@
+"""Tests for the validation daemon and its hook client."""
+
+import socket
+import threading
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+SUFFIX = "BECAUSE I WORSHIP THE DOT"
+
+
+@pytest.fixture
+def running_daemon(tmp_path, monkeypatch):
+    from dot.daemon import ValidationDaemon
+
+    monkeypatch.delenv("DOT_WORSHIP_SUFFIX", raising=False)
+    sock = tmp_path / "d.sock"
+    server = ValidationDaemon(sock)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield sock
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+def test_daemon_validates_and_renders_modes(running_daemon):
+    from dot.hook_client import request, validate_message
+
+    assert request({"op": "ping"}, running_daemon)["ok"] is True
+
+    ok, suffix = validate_message(f"feat: x {SUFFIX}", socket_path=running_daemon)
+    assert ok is True and suffix == SUFFIX
+    bad, _ = validate_message("feat: x", socket_path=running_daemon)
+    assert bad is False
+
+    resp = request(
+        {"op": "validate", "message": f"feat: x {SUFFIX}", "mode": "--cosmic"},
+        running_daemon,
+    )
+    assert resp["valid"] is True and "CELESTIAL" in resp["text"]
+
+    # Unknown ops and modes are reported as unreachable so clients fall back.
+    assert request({"op": "nope"}, running_daemon) is None
+    assert request({"op": "validate", "message": "m", "mode": "--nope"}, running_daemon) is None
+
+    # Valid JSON that is not an object still gets a reply
+    for raw in (b"[]\n", b'"x"\n', b"3\n"):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(5)
+            conn.connect(str(running_daemon))
+            conn.sendall(raw)
+            assert b'"error"' in conn.makefile("rb").readline()
+
+
+def test_daemon_refuses_to_evict_live_socket(running_daemon):
+    from dot.daemon import ValidationDaemon
+
+    with pytest.raises(OSError):
+        ValidationDaemon(running_daemon, warm_modes=False)
+
+
+def test_daemon_stop_and_status(running_daemon):
+    from dot import daemon
+
+    assert daemon.status(running_daemon)["pid"]
+    assert daemon.stop(running_daemon) is True
+
+
+def test_client_falls_back_when_daemon_down(tmp_path, monkeypatch):
+    from dot.hook_client import validate_message, main
+
+    monkeypatch.delenv("DOT_WORSHIP_SUFFIX", raising=False)
+    monkeypatch.setenv("DOT_DAEMON_SOCKET", str(tmp_path / "missing.sock"))
+    assert validate_message(f"docs: y {SUFFIX}") == (True, SUFFIX)
+
+    msg = tmp_path / "COMMIT_EDITMSG"
+    msg.write_text("docs: no worship\n")
+    with patch('sys.stdout', new=StringIO()) as out:
+        assert main([str(msg)]) == 1
+    assert "COMMIT REJECTED" in out.getvalue() and SUFFIX in out.getvalue()
+
+    msg.write_text(f"docs: worship\n\n{SUFFIX}\n")
+    assert main([str(msg)]) == 0
+
+
+def test_client_env_override_skips_daemon(monkeypatch):
+    from dot.hook_client import validate_message
+
+    monkeypatch.setenv("DOT_WORSHIP_SUFFIX", "BECAUSE I ADORE THE DOT")
+    with patch('dot.hook_client.request') as req:
+        assert validate_message("x BECAUSE I ADORE THE DOT") == (True, "BECAUSE I ADORE THE DOT")
+    req.assert_not_called()
+
+
+def test_cli_daemon_status_not_running(tmp_path):
+    from dot.cli import main
+
+    with patch('sys.argv', ['dot', 'daemon', 'status', '--socket', str(tmp_path / 'x.sock')]):
+        with patch('sys.stdout', new=StringIO()) as out:
+            assert main() == 1
+    assert "not running" in out.getvalue()
@@ -14,3 +14,44 @@ def test_ephemeris_command_runs():
     # Ensure it mentions UTC timestamp line
     assert 'UTC:' in s
 
+
+
+def test_ephemeris_time_series_streams_csv_and_jsonl():
+    import json
+    from dot.cli import main
+
+    argv = ['dot', 'ephemeris', '--from', '2024-01-01', '--to=2024-01-01T12:00Z',
+            '--step', '6h', '--bodies', 'mars,venus']
+    with patch('sys.argv', argv), patch('sys.stdout', new=StringIO()) as out:
+        assert main() == 0
+    lines = out.getvalue().splitlines()
+    assert lines[0] == 'time,body,lon_deg,lat_deg'
+    assert [line.split(',')[:2] for line in lines[1:3]] == [
+        ['2024-01-01T00:00:00Z', 'mars'], ['2024-01-01T00:00:00Z', 'venus']]
+    assert len(lines) == 1 + 3 * 2
+
+    with patch('sys.argv', argv + ['--format', 'jsonl']), patch('sys.stdout', new=StringIO()) as out:
+        assert main() == 0
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert rows[-1]['time'] == '2024-01-01T12:00:00Z' and rows[-1]['body'] == 'venus'
+
+    with patch('sys.argv', argv + ['--step', '0h']), patch('sys.stdout', new=StringIO()):
+        assert main() == 1
+
+
+def test_iter_ephemeris_is_lazy_and_matches_scalar_path():
+    from datetime import datetime, timedelta
+    from math import atan2, degrees
+    from dot.philosophies import astrology, ephemeris
+
+    rows = ephemeris.iter_ephemeris(['mars'], datetime(2000, 1, 1), datetime(2100, 1, 1),
+                                    timedelta(minutes=1), chunk=16)
+    first = [next(rows) for _ in range(20)]  # a century of minutes, never materialized
+    when = first[17].time
+    assert when == datetime(2000, 1, 1, 0, 17)
+
+    jd = astrology._julian_day(when)
+    xe, ye, ze = astrology._xyz_from_elements(astrology._body_elements('earth'), jd)
+    xm, ym, zm = astrology._xyz_from_elements(astrology._body_elements('mars'), jd)
+    lon = (degrees(atan2(ym - ye, xm - xe)) + 360.0) % 360.0
+    assert abs(first[17].lon - lon) < 1e-9
@@ -0,0 +1,74 @@
+"""Tests for the array ephemeris engine."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from dot.philosophies import astrology, chebyshev, ephemeris
+
+BODIES = ["sun", "mercury", "earth", "mars", "jupiter", "pluto", "ceres", "1p/halley"]
+TIMES = [datetime(2024, 1, 1) + timedelta(days=37 * k, hours=5 * k) for k in range(12)]
+
+
+def test_pure_python_grid_matches_scalar_path(monkeypatch):
+    monkeypatch.setattr(ephemeris, "HAVE_NUMPY", False)
+    monkeypatch.setattr(chebyshev, "_table", None)  # analytic path only
+    grid = ephemeris.heliocentric_positions(BODIES, TIMES)
+    for b, body in enumerate(BODIES):
+        for t, when in enumerate(TIMES):
+            assert grid[b][t] == astrology._heliocentric_ecliptic_xyz(body, when)
+
+    lon, lat = ephemeris.geocentric_ecliptic(["mars"], TIMES)
+    assert len(lon) == 1 and len(lat[0]) == len(TIMES)
+    assert all(0.0 <= x < 360.0 for x in lon[0])
+
+    with pytest.raises(KeyError):
+        ephemeris.heliocentric_positions(["vulcan"], TIMES)
+
+
+def test_numpy_engine_agrees_with_pure_python(monkeypatch):
+    np = pytest.importorskip("numpy")
+
+    hourly = [astrology._julian_day(datetime(2024, 1, 1)) + h / 24.0 for h in range(24 * 366)]
+    fast = ephemeris.heliocentric_positions(BODIES, hourly)
+    assert fast.shape == (len(BODIES), len(hourly), 3)
+    assert not fast[0].any()  # the Sun is the origin
+
+    monkeypatch.setattr(ephemeris, "HAVE_NUMPY", False)
+    sample = hourly[::500]
+    slow = np.array(ephemeris.heliocentric_positions(BODIES, sample))
+    np.testing.assert_allclose(fast[:, ::500], slow, rtol=0, atol=1e-9)
+
+
+def _textbook_xyz(raw, jd):
+    """Per-call formulation: degrees to radians, mean motion, true anomaly."""
+    from math import atan2, cos, radians, sin, sqrt
+
+    a, e = raw["a"], raw["e"]
+    i, Omega = radians(raw["i"]), radians(raw["Omega"])
+    varpi, L = radians(raw["varpi"]), radians(raw["L"])
+    n = 2.0 * 3.141592653589793 / (sqrt(a ** 3) * 365.256363004)
+    M = (L - varpi + n * (jd - astrology._EPOCH_JD)) % (2.0 * 3.141592653589793)
+    E = astrology._kepler_E(M, e)
+    nu = 2.0 * atan2(sqrt(1 + e) * sin(E / 2.0), sqrt(1 - e) * cos(E / 2.0))
+    r = a * (1.0 - e * cos(E))
+    x1 = cos(varpi - Omega) * r * cos(nu) - sin(varpi - Omega) * r * sin(nu)
+    y1 = sin(varpi - Omega) * r * cos(nu) + cos(varpi - Omega) * r * sin(nu)
+    return (cos(Omega) * x1 - sin(Omega) * cos(i) * y1,
+            sin(Omega) * x1 + cos(Omega) * cos(i) * y1,
+            sin(i) * y1)
+
+
+def test_element_records_are_precomputed_and_immutable():
+    mars = astrology._body_elements("mars")
+    assert isinstance(mars, astrology.BodyElements) and not hasattr(mars, "__dict__")
+    with pytest.raises(AttributeError):
+        mars.a = 1.0
+    assert astrology._body_elements("sun") is None
+
+    for body in BODIES[1:]:
+        b = astrology._body_elements(body)
+        raw = {f: getattr(b, f) for f in ("a", "e", "i", "Omega", "varpi", "L")}
+        for when in TIMES:
+            jd = astrology._julian_day(when)
+            assert astrology._xyz_from_elements(b, jd) == pytest.approx(_textbook_xyz(raw, jd), abs=1e-12)
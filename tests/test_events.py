@@ -0,0 +1,87 @@
+"""Tests for the planetary event search."""
+
+from datetime import datetime, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from dot.philosophies import ephemeris, events
+
+# Published Mercury stations for 2024 (UTC)
+MERCURY_2024 = [
+    (datetime(2024, 4, 1, 22, 14), "retrograde"), (datetime(2024, 4, 25, 12, 54), "direct"),
+    (datetime(2024, 8, 5, 4, 56), "retrograde"), (datetime(2024, 8, 28, 21, 14), "direct"),
+    (datetime(2024, 11, 26, 2, 42), "retrograde"), (datetime(2024, 12, 15, 20, 56), "direct"),
+]
+
+
+@pytest.fixture
+def pure_python(monkeypatch):
+    monkeypatch.setattr(ephemeris, "HAVE_NUMPY", False)
+    monkeypatch.setattr(events, "np", None)
+
+
+def test_mercury_stations_match_published_dates(pure_python):
+    found = list(events.find_events(["mercury"], datetime(2024, 1, 10), datetime(2025, 1, 1),
+                                    kinds=["station"]))
+    assert [e.detail for e in found] == [d for _, d in MERCURY_2024]
+    for event, (when, _) in zip(found, MERCURY_2024):
+        assert abs(event.time - when) < timedelta(hours=12)
+
+    began, ended = events.next_retrograde("mercury", datetime(2024, 4, 10))  # mid-period
+    assert (began.date(), ended.date()) == (datetime(2024, 4, 1).date(), datetime(2024, 4, 25).date())
+    assert events.next_retrograde("sun", datetime(2024, 1, 1)) is None
+
+
+def test_events_are_ordered_and_chunking_does_not_change_them(pure_python, monkeypatch):
+    bodies = ["sun", "mercury", "jupiter", "saturn"]
+    span = (datetime(2020, 10, 1), datetime(2021, 2, 1))
+    whole = list(events.find_events(bodies, *span))
+    assert whole == sorted(whole) and all(span[0] <= e.time <= span[1] for e in whole)
+
+    great = [e for e in whole if e.kind == "conjunction" and e[2:4] == ("jupiter", "saturn")]
+    assert len(great) == 1 and abs(great[0].time - datetime(2020, 12, 21, 18)) < timedelta(days=5)
+    solstice = [e for e in whole if e.kind == "ingress" and e.body == "sun" and e.detail == "Capricorn"]
+    assert abs(solstice[0].time - datetime(2020, 12, 21, 10, 2)) < timedelta(days=1)
+
+    monkeypatch.setattr(events, "SCAN_CHUNK", 7)
+    assert list(events.find_events(bodies, *span)) == whole
+
+    with pytest.raises(ValueError):
+        list(events.find_events(["earth"], *span))
+    with pytest.raises(KeyError):
+        list(events.find_events(["vulcan"], *span))
+
+
+def test_numpy_scan_finds_the_same_events():
+    pytest.importorskip("numpy")
+    span = (datetime(2023, 1, 1), datetime(2025, 1, 1))
+    fast = list(events.find_events(ephemeris.DEFAULT_BODIES, *span))
+    with patch.object(ephemeris, "HAVE_NUMPY", False), patch.object(events, "np", None):
+        slow = list(events.find_events(ephemeris.DEFAULT_BODIES, *span))
+    assert [(e.kind, e.body, e.detail) for e in fast] == [(e.kind, e.body, e.detail) for e in slow]
+    assert all(abs(a.time - b.time) < timedelta(seconds=2) for a, b in zip(fast, slow))
+
+
+def test_events_and_retrograde_cli():
+    import json
+    from dot.cli import main
+
+    with patch("sys.argv", ["dot", "retrograde", "--from", "2024-02-01"]), \
+            patch("sys.stdout", new=StringIO()) as out:
+        assert main() == 0
+    assert out.getvalue().startswith("Mercury retrograde: 2024-04-01 ")
+
+    argv = ["dot", "events", "--from", "2024-03-01", "--to=2024-05-01", "--bodies", "mercury,venus"]
+    with patch("sys.argv", argv + ["--format", "jsonl"]), patch("sys.stdout", new=StringIO()) as out:
+        assert main() == 0
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert {r["kind"] for r in rows} == {"ingress", "station", "conjunction"}
+    assert [r["time"] for r in rows] == sorted(r["time"] for r in rows)
+
+    for bad in (["--kinds", "eclipse"], ["--bodies", "earth"], ["--step", "0d"]):
+        with patch("sys.argv", argv + bad), patch("sys.stdout", new=StringIO()):
+            assert main() == 1
+    with patch("sys.argv", ["dot", "retrograde", "sun"]), patch("sys.stdout", new=StringIO()):
+        assert main() == 1
@@ -0,0 +1,161 @@
+"""Tests for git utilities."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clean_discovery(monkeypatch):
+    from dot import git_utils
+
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+    git_utils.clear_repo_cache()
+    yield
+    git_utils.clear_repo_cache()
+
+
+def _no_git(*args, **kwargs):
+    raise AssertionError("git should not be spawned for repo discovery")
+
+
+def test_repo_root_walks_up_without_spawning_git(tmp_path, monkeypatch):
+    from dot import git_utils
+
+    (tmp_path / ".git").mkdir()
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    monkeypatch.setattr("subprocess.check_output", _no_git)
+    monkeypatch.setattr("subprocess.run", _no_git)
+
+    assert git_utils.get_repo_root(nested) == tmp_path.resolve()
+    monkeypatch.chdir(nested)
+    assert git_utils.get_repo_root() == tmp_path.resolve()
+    assert git_utils.discover_repo()[1] == tmp_path.resolve() / ".git"
+
+
+def test_repo_root_follows_gitfile(tmp_path):
+    from dot import git_utils
+
+    real_git_dir = tmp_path / "store" / "worktrees" / "wt"
+    real_git_dir.mkdir(parents=True)
+    wt = tmp_path / "wt"
+    wt.mkdir()
+    (wt / ".git").write_text("gitdir: ../store/worktrees/wt\n")
+
+    root, git_dir = git_utils.discover_repo(wt)
+    assert root == wt.resolve()
+    assert git_dir == real_git_dir.resolve()
+
+
+def test_repo_root_honors_git_env(tmp_path, monkeypatch):
+    from dot import git_utils
+
+    work = tmp_path / "work"
+    work.mkdir()
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.setenv("GIT_DIR", str(tmp_path / "bare.git"))
+    monkeypatch.setenv("GIT_WORK_TREE", str(work))
+    assert git_utils.discover_repo(elsewhere) == (work.resolve(), tmp_path / "bare.git")
+
+    # GIT_DIR alone makes the working directory the top level
+    monkeypatch.delenv("GIT_WORK_TREE")
+    assert git_utils.get_repo_root(elsewhere) == elsewhere.resolve()
+
+
+def test_repo_root_none_outside_repo(tmp_path):
+    from dot import git_utils
+
+    if any((p / ".git").exists() for p in tmp_path.resolve().parents):
+        pytest.skip("temp dir lives inside a git repository")
+    assert git_utils.get_repo_root(tmp_path) is None
+
+
+def test_suffix_resolution_uses_cached_discovery(tmp_path, monkeypatch):
+    from dot.config import resolve_worship_suffix
+
+    monkeypatch.delenv("DOT_WORSHIP_SUFFIX", raising=False)
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".dot.ini").write_text("[dot]\nworship_suffix = BECAUSE I ADORE THE DOT\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("subprocess.check_output", _no_git)
+
+    for _ in range(100):
+        suffix, source = resolve_worship_suffix()
+    assert suffix == "BECAUSE I ADORE THE DOT"
+    assert source == str(tmp_path.resolve() / ".dot.ini")
+
+
+def _commit_repo(path, *dates):
+    import os
+    import subprocess
+
+    def git(*args, when=None):
+        env = dict(os.environ, GIT_AUTHOR_NAME="T", GIT_AUTHOR_EMAIL="t@e",
+                   GIT_COMMITTER_NAME="T", GIT_COMMITTER_EMAIL="t@e")
+        if when is not None:
+            env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = f"{when} +0000"
+        return subprocess.run(["git", *args], cwd=path, env=env, check=True,
+                              capture_output=True, text=True).stdout
+
+    git("init", "-q", "-b", "main")
+    for when in dates:
+        git("commit", "-q", "--allow-empty", "-m", str(when), when=when)
+    return git
+
+
+def _spy_git(monkeypatch):
+    import subprocess
+
+    calls = []
+    real_run = subprocess.run
+
+    def run(cmd, *args, **kwargs):
+        calls.append(cmd[1])
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr("subprocess.run", run)
+    return calls
+
+
+def test_creation_date_is_cached_and_extended_incrementally(tmp_path, monkeypatch):
+    from dot import git_utils
+
+    git = _commit_repo(tmp_path, 1000000000, 1000000100)
+    monkeypatch.chdir(tmp_path)
+    first = git_utils.get_creation_date()
+    assert first.timestamp() == 1000000000
+    assert (tmp_path / ".git" / git_utils.CREATION_CACHE_FILE).exists()
+
+    calls = _spy_git(monkeypatch)
+    assert git_utils.get_creation_date() == first
+    assert calls == []  # same HEAD: answered from the cache
+
+    git("commit", "-q", "--allow-empty", "-m", "more", when=1000000200)
+    calls.clear()
+    assert git_utils.get_creation_date() == first
+    assert calls == ["merge-base", "rev-list"]  # no full history scan
+
+
+def test_creation_date_rescans_when_roots_change(tmp_path, monkeypatch):
+    from dot import git_utils
+
+    git = _commit_repo(tmp_path, 1000000000)
+    monkeypatch.chdir(tmp_path)
+    assert git_utils.get_creation_date().timestamp() == 1000000000
+
+    # Graft in an older, unrelated history
+    git("checkout", "-q", "--orphan", "old")
+    git("commit", "-q", "--allow-empty", "-m", "ancient", when=900000000)
+    git("checkout", "-q", "main")
+    git("merge", "-q", "--allow-unrelated-histories", "-m", "graft", "old", when=1000000100)
+
+    calls = _spy_git(monkeypatch)
+    assert git_utils.get_creation_date().timestamp() == 900000000
+    assert "log" in calls
+
+    # Rewritten history (HEAD no longer descends from the cached one)
+    git("reset", "-q", "--hard", "HEAD^2")
+    calls.clear()
+    assert git_utils.get_creation_date().timestamp() == 900000000
+    assert calls[-1] == "log"
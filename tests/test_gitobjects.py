@@ -0,0 +1,210 @@
+"""Tests for the pure-Python git object reader, checked against git itself."""
+
+import os
+import subprocess
+
+import pytest
+
+from dot.gitobjects import GitObjectError, Repository, apply_delta, iter_range_messages
+
+SUFFIX = "BECAUSE I WORSHIP THE DOT"
+
+
+def _git(repo, *args, when=None):
+    env = dict(
+        os.environ,
+        GIT_AUTHOR_NAME="Tester", GIT_AUTHOR_EMAIL="t@example.com",
+        GIT_COMMITTER_NAME="Tester", GIT_COMMITTER_EMAIL="t@example.com",
+    )
+    if when is not None:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = f"{1700000000 + when} +0000"
+    return subprocess.run(
+        ["git", *args], cwd=repo, env=env, check=True, capture_output=True
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """History with a growing file (delta-friendly), a merge and a tag."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "core.hooksPath", "/dev/null")
+    body = ""
+    for i in range(12):
+        body += f"line {i} " * 40 + "\n"
+        (tmp_path / "grow.txt").write_text(body)
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", f"step {i}\n\nbody {i}\n\n{SUFFIX}", when=i)
+    _git(tmp_path, "checkout", "-q", "-b", "side", "HEAD~4")
+    (tmp_path / "side.txt").write_text("side\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "side work", when=20)
+    _git(tmp_path, "checkout", "-q", "main")
+    _git(tmp_path, "merge", "-q", "--no-ff", "-m", f"merge side\n\n{SUFFIX}", "side", when=30)
+    _git(tmp_path, "tag", "-a", "v1", "-m", "release", when=31)
+    return tmp_path
+
+
+def _all_objects(repo):
+    out = _git(repo, "cat-file", "--batch-all-objects", "--batch-check=%(objectname) %(objecttype)")
+    return [line.split() for line in out.decode().splitlines()]
+
+
+def _assert_objects_match_git(repo):
+    repository = Repository(repo / ".git")
+    try:
+        for sha, kind in _all_objects(repo):
+            assert repository.objects.read(sha) == (kind, _git(repo, "cat-file", kind, sha))
+        return len(repository.objects.cache)
+    finally:
+        repository.close()
+
+
+def test_reads_loose_objects(repo):
+    assert not list((repo / ".git" / "objects" / "pack").glob("*.pack"))
+    _assert_objects_match_git(repo)
+
+
+def test_reads_packed_objects_with_delta_chains(repo):
+    _git(repo, "gc", "-q", "--aggressive")
+    _git(repo, "repack", "-q", "-adf", "--depth=50", "--window=50")
+    assert not list((repo / ".git" / "objects").glob("??"))
+    verify = _git(repo, "verify-pack", "-v", *map(str, (repo / ".git/objects/pack").glob("*.idx")))
+    assert b"chain length" in verify  # deltas really are present
+    cached_bases = _assert_objects_match_git(repo)
+    assert cached_bases > 0
+
+
+def test_resolves_refs_like_git(repo):
+    _git(repo, "pack-refs", "--all")
+    repository = Repository(repo / ".git")
+    for rev in ("HEAD", "main", "side", "v1", "HEAD~3", "HEAD^2", "HEAD^^", "refs/heads/side"):
+        expected = _git(repo, "rev-parse", f"{rev}^{{commit}}").decode().strip()
+        assert repository.resolve(rev) == expected, rev
+    with pytest.raises(GitObjectError):
+        repository.resolve("no-such-branch")
+    repository.close()
+
+
+@pytest.mark.parametrize("rev_range", ["HEAD", "HEAD~5..HEAD", "side..main", "main..side", "v1"])
+def test_range_order_matches_git_log(repo, rev_range):
+    expected = _git(repo, "rev-list", rev_range).decode().split()
+    got = list(iter_range_messages(rev_range, repo))
+    assert [sha for sha, _ in got] == expected
+    for sha, message in got[:3]:
+        assert message == _git(repo, "log", "-1", "--format=%B", sha).decode()[:-1]
+
+
+def test_worktree_shares_objects_and_refs(repo, tmp_path_factory):
+    wt = tmp_path_factory.mktemp("wt") / "tree"
+    _git(repo, "worktree", "add", "-q", str(wt), "side")
+    expected = _git(wt, "rev-list", "HEAD").decode().split()
+    assert [sha for sha, _ in iter_range_messages("HEAD", wt)] == expected
+
+
+def test_apply_delta_copy_and_insert():
+    base = b"hello dot world"
+    # src 15, dst 13: copy base[0:6], insert "THE ", copy base[6:9]
+    delta = bytes([15, 13, 0x90, 6, 4]) + b"THE " + bytes([0x91, 6, 3])
+    assert apply_delta(base, delta) == b"hello THE dot"
+
+
+def test_validate_range_native_matches_git(repo):
+    from dot.batch import validate_range
+
+    native = validate_range("HEAD", repo, suffix=SUFFIX, native=True)
+    forked = validate_range("HEAD", repo, suffix=SUFFIX)
+    assert native.checked == forked.checked == 14
+    assert native.invalid == forked.invalid
+    assert [r.subject for r in native.invalid] == ["side work"]
+
+
+def _fast_import(repo, times, branch_at=None):
+    """Linear history with the given committer times (seconds after the
+    fixture epoch); branch_at adds a side branch off that commit."""
+    lines = []
+    for i, when in enumerate(times):
+        msg = f"c{i}"
+        lines += [
+            "commit refs/heads/main",
+            f"mark :{i + 1}",
+            f"committer T <t@e> {1700000000 + when} +0000",
+            f"data {len(msg)}", msg,
+        ]
+        if i:
+            lines.append(f"from :{i}")
+        lines.append("")
+    if branch_at is not None:
+        lines += ["commit refs/heads/side", f"committer T <t@e> {1700000000 + times[-1] + 1} +0000",
+                  "data 4", "side", f"from :{branch_at + 1}", ""]
+    _git(repo, "init", "-q", "-b", "main")
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=repo, check=True,
+                   input="\n".join(lines).encode(), capture_output=True)
+
+
+def test_range_walk_loads_only_the_range(tmp_path):
+    from dot.gitobjects import WALK_SLOP, walk_commits
+
+    _fast_import(tmp_path, range(2000), branch_at=1990)
+    repository = Repository(tmp_path / ".git")
+    loaded = []
+
+    def load(sha):
+        loaded.append(sha)
+        return repository.commit(sha)
+
+    try:
+        for rev_range in ("HEAD~5..HEAD", "side..main", "main..side"):
+            include, exclude = (r.split() for r in reversed(rev_range.split("..")))
+            expected = _git(tmp_path, "rev-list", rev_range).decode().split()
+            loaded.clear()
+            walked = walk_commits(load, [repository.resolve(r) for r in include],
+                                  [repository.resolve(r) for r in exclude])
+            assert [c.sha for c in walked] == expected
+            assert len(loaded) <= len(expected) + 2 * WALK_SLOP + 10, rev_range
+            assert len(set(loaded)) == len(loaded)  # each commit loaded once
+    finally:
+        repository.close()
+
+
+def test_range_walk_tolerates_clock_skew_like_git(tmp_path):
+    # c3 claims to be older than its ancestors
+    _fast_import(tmp_path, [10, 20, 30, 5, 40, 50, 60])
+    for rev_range in ("HEAD~4..HEAD", "HEAD~3..HEAD", "HEAD~2..HEAD", "HEAD~5..HEAD~1"):
+        expected = _git(tmp_path, "rev-list", rev_range).decode().split()
+        assert [sha for sha, _ in iter_range_messages(rev_range, tmp_path)] == expected, rev_range
+
+
+def test_ref_delta_with_base_outside_the_pack_reads_the_same_twice(tmp_path):
+    import hashlib
+    import struct
+    import zlib
+
+    _git(tmp_path, "init", "-q")
+    base = b"hello dot\n" * 3
+    target = base + b"and more\n"
+    base_sha = subprocess.run(["git", "hash-object", "-w", "--stdin"], cwd=tmp_path, input=base,
+                              check=True, capture_output=True).stdout.decode().strip()
+    target_sha = hashlib.sha1(b"blob %d\0" % len(target) + target).digest()
+
+    # A thin pack: one REF_DELTA whose base is the loose blob above
+    delta = bytes([len(base), len(target), 0x90, len(base), len(target) - len(base)]) + target[len(base):]
+    pack = b"PACK" + struct.pack(">II", 2, 1)
+    assert len(delta) < 16  # fits the one-byte entry header
+    pack += bytes([0x70 | len(delta)])
+    pack += bytes.fromhex(base_sha) + zlib.compress(delta)
+    pack += hashlib.sha1(pack).digest()
+    fanout = [0 if i < target_sha[0] else 1 for i in range(256)]
+    idx = b"\377tOc" + struct.pack(">I", 2) + struct.pack(">256I", *fanout)
+    idx += target_sha + struct.pack(">I", 0) + struct.pack(">I", 12) + pack[-20:]
+    idx += hashlib.sha1(idx).digest()
+    pack_dir = tmp_path / ".git" / "objects" / "pack"
+    (pack_dir / "pack-thin.pack").write_bytes(pack)
+    (pack_dir / "pack-thin.idx").write_bytes(idx)
+
+    repository = Repository(tmp_path / ".git")
+    try:
+        for _ in range(3):
+            assert repository.objects.read(target_sha.hex()) == ("blob", target)
+        assert repository.objects.read(base_sha) == ("blob", base)
+    finally:
+        repository.close()
@@ -0,0 +1,90 @@
+"""Tests for the persistent git cat-file pool."""
+
+import os
+import subprocess
+from datetime import datetime
+
+import pytest
+
+from dot.gitpool import GitPool
+
+
+def _git(repo, *args, when=None):
+    env = dict(
+        os.environ,
+        GIT_AUTHOR_NAME="Tester", GIT_AUTHOR_EMAIL="t@example.com",
+        GIT_COMMITTER_NAME="Tester", GIT_COMMITTER_EMAIL="t@example.com",
+    )
+    if when is not None:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = f"{1700000000 + when} +0130"
+    return subprocess.run(
+        ["git", *args], cwd=repo, env=env, check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+    _git(tmp_path, "init", "-q", "-b", "main")
+    for i in range(5):
+        (tmp_path / "f.txt").write_text(f"{i}\n")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", f"c{i}", when=i * 60)
+    return tmp_path
+
+
+@pytest.fixture
+def pool():
+    pool = GitPool()
+    yield pool
+    pool.close()
+
+
+def test_many_lookups_share_one_process(repo, pool):
+    shas = _git(repo, "rev-list", "HEAD").split()
+    for _ in range(50):
+        for sha in shas:
+            obj = pool.cat_file(sha, repo)
+            assert obj.type == "commit" and obj.data.startswith(b"tree ")
+    assert pool.spawned == 1
+    assert pool.info("HEAD", repo).size == len(pool.cat_file("HEAD", repo).data)
+    assert pool.spawned == 2  # one --batch, one --batch-check
+    assert pool.cat_file("no-such-rev", repo) is None
+
+
+def test_dead_process_is_replaced(repo, pool):
+    sha = pool.resolve("HEAD", repo)
+    proc = next(iter(pool._procs.values()))
+    proc.proc.kill()
+    proc.proc.wait()
+    assert pool.resolve("HEAD", repo) == sha
+    assert pool.spawned == 2
+
+
+def test_idle_processes_are_reaped(repo):
+    pool = GitPool(idle_timeout=5)
+    pool.resolve("HEAD", repo)
+    proc = next(iter(pool._procs.values()))
+    assert pool.reap_idle(now=proc.last_used + 1) == 0
+    assert pool.reap_idle(now=proc.last_used + 10) == 1
+    assert len(pool) == 0 and proc.proc.poll() is not None
+    pool.close()
+
+
+def test_iter_commits_matches_rev_list(repo, pool):
+    assert [c.sha for c in pool.iter_commits("HEAD~3..HEAD", repo)] == \
+        _git(repo, "rev-list", "HEAD~3..HEAD").split()
+
+
+def test_git_utils_answers_from_pool(repo, monkeypatch):
+    from dot import git_utils
+
+    monkeypatch.chdir(repo)
+    git_utils.clear_repo_cache()
+    head = _git(repo, "rev-parse", "HEAD").strip()
+    assert git_utils.get_commit_hash(short=False) == head
+    assert git_utils.get_commit_hash() == head[:7]
+    expected = _git(repo, "log", "--reverse", "--format=%aI", "--max-parents=0", "HEAD").split()[0]
+    assert git_utils.get_creation_date() == datetime.fromisoformat(expected)
+    assert git_utils.get_current_branch() == "main"
@@ -0,0 +1,250 @@
+"""Tests for generated, config-aware git hooks."""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from dot import hookgen
+
+DEFAULT = "BECAUSE I WORSHIP THE DOT"
+CUSTOM = "BECAUSE I ADORE THE DOT"
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    from dot import git_utils
+
+    home = tmp_path / "home"
+    home.mkdir()
+    work = tmp_path / "repo"
+    work.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.delenv("DOT_WORSHIP_SUFFIX", raising=False)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.chdir(work)
+    git_utils.clear_repo_cache()
+    subprocess.run(["git", "init", "-q"], cwd=work, check=True)
+    yield work
+    git_utils.clear_repo_cache()
+
+
+def _commit(repo, message, **env):
+    (repo / "f.txt").write_text(message)
+    subprocess.run(["git", "add", "."], cwd=repo, check=True)
+    env = dict(os.environ, GIT_AUTHOR_NAME="T", GIT_AUTHOR_EMAIL="t@e",
+               GIT_COMMITTER_NAME="T", GIT_COMMITTER_EMAIL="t@e", **env)
+    return subprocess.run(["git", "commit", "-q", "-m", message], cwd=repo, env=env,
+                          capture_output=True, text=True)
+
+
+def _install(repo, python=None):
+    git_dir = repo / ".git"
+    hookgen.install(git_dir, repo, echo=lambda _: None)
+    if python:
+        suffix = (git_dir / hookgen.CACHE_FILE).read_text().splitlines()[1]
+        for name in hookgen.HOOK_NAMES:
+            (git_dir / "hooks" / name).write_text(
+                hookgen.render_hook(name, suffix, hookgen.hook_config_files(repo), python)
+            )
+    return git_dir
+
+
+def _touch_later(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+
+def test_hooks_embed_suffix_and_validate_in_shell(repo):
+    git_dir = _install(repo, python="/bin/false")  # Python must not be needed
+    hook = (git_dir / "hooks" / "commit-msg").read_text()
+    assert hookgen.GENERATED_MARKER in hook and f"DOT_SNAPSHOT_SUFFIX='{DEFAULT}'" in hook
+
+    assert _commit(repo, "feat: forgot").returncode == 1
+    assert _commit(repo, f"feat: ok\n\n{DEFAULT}").returncode == 0
+    assert _commit(repo, f"feat: env\n\n{CUSTOM}", DOT_WORSHIP_SUFFIX=CUSTOM).returncode == 0
+
+
+def test_config_change_is_picked_up_once(repo):
+    git_dir = _install(repo)
+    ini = repo / ".dot.ini"
+    ini.write_text(f"[dot]\nworship_suffix = {CUSTOM}\n")
+    _touch_later(ini)
+
+    assert _commit(repo, f"feat: old\n\n{DEFAULT}").returncode == 1
+    assert _commit(repo, f"feat: new\n\n{CUSTOM}").returncode == 0
+    assert (git_dir / hookgen.CACHE_FILE).read_text().splitlines()[1] == CUSTOM
+
+    # Removing the file is a config change too, even though nothing is newer
+    ini.unlink()
+    assert _commit(repo, f"feat: back\n\n{DEFAULT}").returncode == 0
+
+
+def test_falls_back_to_snapshot_when_python_fails(repo):
+    _install(repo, python="/bin/false")
+    ini = repo / ".dot.ini"
+    ini.write_text(f"[dot]\nworship_suffix = {CUSTOM}\n")
+    _touch_later(ini)
+    assert _commit(repo, f"feat: snapshot\n\n{DEFAULT}").returncode == 0
+
+
+def test_hooks_find_the_git_dir_without_running_git(repo, tmp_path):
+    git_dir = _install(repo)
+    _commit(repo, f"feat: base\n\n{DEFAULT}")
+    wt = tmp_path / "wt"
+    subprocess.run(["git", "worktree", "add", "-q", str(wt)], cwd=repo, check=True)
+
+    # A git that records being run, first on PATH
+    fake = tmp_path / "fake-bin"
+    fake.mkdir()
+    log = tmp_path / "git.log"
+    (fake / "git").write_text(f'#!/bin/sh\necho "$*" >> {log}\nexit 1\n')
+    (fake / "git").chmod(0o755)
+    env = dict(os.environ, PATH=f"{fake}{os.pathsep}{os.environ['PATH']}")
+    env.pop("GIT_DIR", None)
+
+    hook = git_dir / "hooks" / "commit-msg"
+    for cwd in (repo, wt, wt):  # the worktree's first run fills its own cache
+        msg = tmp_path / "MSG"
+        msg.write_text(f"feat: x\n\n{DEFAULT}\n")
+        result = subprocess.run(["bash", str(hook), str(msg)], cwd=cwd, env=env,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stdout
+    assert not log.exists() or "rev-parse" not in log.read_text()
+    wt_git_dir = Path(subprocess.run(["git", "rev-parse", "--absolute-git-dir"], cwd=wt, check=True,
+                                     capture_output=True, text=True).stdout.strip())
+    assert (wt_git_dir / hookgen.CACHE_FILE).exists()
+
+
+def test_reinstall_keeps_original_backup(repo):
+    hooks = repo / ".git" / "hooks"
+    hooks.mkdir(exist_ok=True)
+    (hooks / "commit-msg").write_text("#!/bin/sh\necho mine\n")
+    _install(repo)
+    _install(repo)
+    assert (hooks / "commit-msg.backup").read_text() == "#!/bin/sh\necho mine\n"
+
+
+def _git(cwd, *args):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def farm(tmp_path, monkeypatch):
+    """Repos under one root: worktrees, core.hooksPath and a nested repo."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.delenv("DOT_WORSHIP_SUFFIX", raising=False)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    root = tmp_path / "agents"
+    for name in ("a", "b", "nested/c", "not-a-repo"):
+        (root / name).mkdir(parents=True)
+    for name in ("a", "b", "nested/c"):
+        _git(root / name, "init", "-q")
+    (root / "a" / "f").write_text("x")
+    _git(root / "a", "add", ".")
+    _git(root / "a", "-c", "user.name=T", "-c", "user.email=t@e", "-c", "core.hooksPath=/dev/null",
+         "commit", "-q", "-m", "init")
+    _git(root / "a", "worktree", "add", "-q", str(root / "a-wt"), "-b", "wt")
+    _git(root / "a", "worktree", "add", "-q", str(tmp_path / "outside-wt"), "-b", "out")
+    _git(root / "b", "config", "core.hooksPath", "custom-hooks")
+    return root
+
+
+def test_install_all_groups_by_hooks_dir_and_skips_identical(farm):
+    results = {Path(r.hooks_dir).relative_to(farm).as_posix(): r for r in hookgen.install_all(farm)}
+    assert set(results) == {"a/.git/hooks", "b/custom-hooks", "nested/c/.git/hooks"}
+    assert all(r.status == "installed" for r in results.values())
+    assert len(results["a/.git/hooks"].repos) == 3  # main + two worktrees
+
+    worktree_git_dir = farm / "a" / ".git" / "worktrees" / "a-wt"
+    assert (worktree_git_dir / hookgen.CACHE_FILE).exists()
+    hook = farm / "b" / "custom-hooks" / "commit-msg"
+    mtime = hook.stat().st_mtime_ns
+
+    again = hookgen.install_all(farm, jobs=2)
+    assert [r.status for r in again] == ["unchanged"] * 3
+    assert hook.stat().st_mtime_ns == mtime
+
+    hook.write_text("#!/bin/sh\nexit 0\n")
+    statuses = {Path(r.hooks_dir).name: r.status for r in hookgen.install_all(farm)}
+    assert statuses["custom-hooks"] == "installed"
+    assert (farm / "b" / "custom-hooks" / "commit-msg.backup").exists()
+
+
+def test_hooks_install_all_cli_prints_json_summary(farm, capsys):
+    import json
+    from dot.cli import main
+    from unittest.mock import patch
+
+    with patch("sys.argv", ["dot", "hooks", "install", "--all", str(farm)]):
+        assert main() == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert (summary["hooks_dirs"], summary["repositories"], summary["installed"]) == (3, 5, 3)
+
+    with patch("sys.argv", ["dot", "hooks", "install", "--all", str(farm / "missing")]):
+        assert main() == 1
+
+
+def _hooks_path(repo):
+    out = subprocess.run(["git", "config", "core.hooksPath"], cwd=repo,
+                         capture_output=True, text=True)
+    return out.stdout.strip() or None
+
+
+def test_shared_store_links_chains_and_swaps(repo, tmp_path, monkeypatch):
+    store = tmp_path / "store"
+    monkeypatch.setenv("DOT_HOOK_STORE", str(store))
+    hooks = repo / ".git" / "hooks"
+    hooks.mkdir(exist_ok=True)
+    (hooks / "pre-commit").write_text("#!/bin/sh\ntouch \"$(git rev-parse --git-dir)/pre-ran\"\n")
+    (hooks / "commit-msg").write_text("#!/bin/sh\n! grep -q WIP \"$1\" || { echo no WIP; exit 1; }\n")
+    for hook in hooks.iterdir():
+        hook.chmod(0o755)
+
+    link = hookgen.install_shared(repo / ".git", repo)
+    first = os.readlink(link)
+    assert _hooks_path(repo) == str(link) and (store / first / "pre-push").exists()
+    assert hookgen.hook_states(repo / ".git", repo) == dict.fromkeys(hookgen.HOOK_NAMES, "installed")
+
+    assert _commit(repo, "feat: forgot").returncode == 1
+    assert "no WIP" in _commit(repo, f"feat: WIP\n\n{DEFAULT}").stderr  # repo's own hook first
+    assert _commit(repo, f"feat: ok\n\n{DEFAULT}").returncode == 0
+    assert (repo / ".git" / "pre-ran").exists()
+
+    # Upgrades publish a new version and move every linked repo at once
+    (tmp_path / "home" / ".dot.ini").write_text(f"[dot]\nworship_suffix = {CUSTOM}\n")
+    assert hookgen.hook_states(repo / ".git", repo)["commit-msg"] == "outdated"
+    hookgen.publish_store()
+    assert os.readlink(link) != first and (store / first).is_dir()
+    assert hookgen.hook_states(repo / ".git", repo)["commit-msg"] == "installed"
+
+    (link / "commit-msg").write_text((link / "commit-msg").read_text() + "exit 0\n")
+    assert hookgen.hook_states(repo / ".git", repo)["commit-msg"] == "modified"
+
+    assert hookgen.unlink_repo(repo / ".git") == ""
+    assert _hooks_path(repo) is None and not (repo / ".git" / hookgen.BACKUP_FILE).exists()
+
+
+def test_hooks_install_all_shared_restores_previous_hooks_path(farm, tmp_path, monkeypatch, capsys):
+    import json
+    from dot.cli import main
+    from unittest.mock import patch
+
+    store = tmp_path / "store"
+    monkeypatch.setenv("DOT_HOOK_STORE", str(store))
+    with patch("sys.argv", ["dot", "hooks", "install", "--all", str(farm), "--shared"]):
+        assert main() == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert (summary["hooks_dirs"], summary["repositories"], summary["installed"]) == (3, 5, 3)
+    assert {_hooks_path(farm / name) for name in ("a", "a-wt", "b", "nested/c")} \
+        == {str(store / "current")}
+    assert (farm / "a" / ".git" / "worktrees" / "a-wt" / hookgen.CACHE_FILE).exists()
+
+    assert [r.status for r in hookgen.link_all(farm)] == ["unchanged"] * 3
+    monkeypatch.chdir(farm / "b")
+    from dot import git_utils
+    git_utils.clear_repo_cache()
+    with patch("sys.argv", ["dot", "hooks", "uninstall"]):
+        assert main() == 0
+    assert _hooks_path(farm / "b") == "custom-hooks"
@@ -11,20 +11,24 @@ class TestHooksCommand:
 
     def test_hooks_install_success(self, tmp_path, monkeypatch):
         """Test successful hook installation end-to-end into a temp git dir."""
+        from dot import git_utils
         from dot.cli import install_hooks, check_hooks_status, uninstall_hooks
-        from pathlib import Path as SysPath
 
         # Create a fake git directory structure
         git_dir = tmp_path / ".git"
         hooks_dir = git_dir / "hooks"
         hooks_dir.mkdir(parents=True)
 
-        # Point CLI to our fake git dir
-        def fake_rev_parse(cmd, stderr=None, text=None):
-            assert cmd[:2] == ["git", "rev-parse"]
-            return str(git_dir) + "\n"
+        # Discovery finds the temp repo on its own; git must not be run
+        def no_git(*args, **kwargs):
+            raise AssertionError("git should not be spawned to find the repo")
 
-        monkeypatch.setattr("dot.cli.subprocess.check_output", fake_rev_parse)
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("subprocess.check_output", no_git)
+        monkeypatch.setattr("subprocess.run", no_git)
+        git_utils.clear_repo_cache()
 
         # Install hooks
         with patch('sys.stdout', new=StringIO()):
@@ -48,13 +52,11 @@ class TestHooksCommand:
         assert not (hooks_dir / "commit-msg").exists()
         assert not (hooks_dir / "prepare-commit-msg").exists()
 
-    @patch('dot.cli.subprocess.check_output')
-    def test_hooks_install_not_git_repo(self, mock_subprocess):
+    def test_hooks_install_not_git_repo(self, monkeypatch):
         """Test hook installation fails when not in git repo."""
         from dot.cli import install_hooks
-        from subprocess import CalledProcessError
 
-        mock_subprocess.side_effect = CalledProcessError(1, 'git')
+        monkeypatch.setattr('dot.git_utils.discover_repo', lambda cwd=None: None)
 
         with patch('sys.stdout', new=StringIO()) as mock_stdout:
             exit_code = install_hooks()
@@ -63,13 +65,11 @@ class TestHooksCommand:
         assert exit_code == 1
         assert "Not in a git repository" in output
 
-    @patch('dot.cli.subprocess.check_output')
-    def test_hooks_status_not_git_repo(self, mock_subprocess):
+    def test_hooks_status_not_git_repo(self, monkeypatch):
         """Test hooks status check fails when not in git repo."""
         from dot.cli import check_hooks_status
-        from subprocess import CalledProcessError
 
-        mock_subprocess.side_effect = CalledProcessError(1, 'git')
+        monkeypatch.setattr('dot.git_utils.discover_repo', lambda cwd=None: None)
 
         with patch('sys.stdout', new=StringIO()) as mock_stdout:
             exit_code = check_hooks_status()
@@ -78,13 +78,11 @@ class TestHooksCommand:
         assert exit_code == 1
         assert "Not in a git repository" in output
 
-    @patch('dot.cli.subprocess.check_output')
-    def test_hooks_uninstall_not_git_repo(self, mock_subprocess):
+    def test_hooks_uninstall_not_git_repo(self, monkeypatch):
         """Test hooks uninstall fails when not in git repo."""
         from dot.cli import uninstall_hooks
-        from subprocess import CalledProcessError
 
-        mock_subprocess.side_effect = CalledProcessError(1, 'git')
+        monkeypatch.setattr('dot.git_utils.discover_repo', lambda cwd=None: None)
 
         with patch('sys.stdout', new=StringIO()) as mock_stdout:
             exit_code = uninstall_hooks()
@@ -151,3 +149,42 @@ class TestHooksCommand:
 
         assert exit_code == 0
         mock_install.assert_called_once()
+
+
+def _run_static_hook(name, message, suffix, *args):
+    import os
+    import subprocess
+    import tempfile
+    from pathlib import Path
+
+    hook = Path(__file__).resolve().parents[1] / "hooks" / name
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write(message)
+    try:
+        env = dict(os.environ, DOT_WORSHIP_SUFFIX=suffix)
+        result = subprocess.run(["bash", str(hook), f.name, *args], env=env,
+                                capture_output=True, text=True)
+        return result, Path(f.name).read_text()
+    finally:
+        os.unlink(f.name)
+
+
+def test_static_hooks_match_suffix_literally():
+    """Regex metacharacters in the suffix are plain text to both hooks."""
+    suffix = "I WORSHIP THE DOT (v1.0)+ [*]"
+
+    result, _ = _run_static_hook("commit-msg", f"feat: x\n\n{suffix}  \n", suffix)
+    assert result.returncode == 0
+
+    # Would satisfy the suffix read as a regex, but is not the suffix
+    result, _ = _run_static_hook("commit-msg", "feat: x\n\nI WORSHIP THE DOT v1x0 *\n", suffix)
+    assert result.returncode == 1
+    assert f"  {suffix}\n" in result.stdout
+    assert "BECAUSE I WORSHIP THE DOT" not in result.stdout
+
+    result, text = _run_static_hook("prepare-commit-msg", "feat: I WORSHIP THE DOT v1x0 *\n", suffix)
+    assert result.returncode == 0
+    assert text.endswith(f"\n{suffix}\n")
+
+    result, text = _run_static_hook("prepare-commit-msg", f"feat: x\n\n{suffix}\n", suffix)
+    assert text == f"feat: x\n\n{suffix}\n"
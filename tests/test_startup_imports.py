@@ -0,0 +1,52 @@
+"""Import budget for the CLI start-up path.
+
+``dot validate`` runs from commit hooks on every commit, so its cold
+start must not drag in modules only other commands need.
+"""
+
+import os
+import subprocess
+import sys
+
+# Modules first imported by a cold ``dot validate`` (beyond a bare
+# interpreter). Currently ~45; raise deliberately, not casually.
+MODULE_BUDGET = 55
+
+FORBIDDEN = {
+    "subprocess", "shutil", "json", "datetime", "sqlite3",
+    "dot.display", "dot.stats", "dot.changelog", "dot.doctor", "dot.init_cmd",
+    "dot.epic", "dot.philosophies",
+}
+
+
+def _imported_modules(code):
+    env = dict(os.environ, DOT_WORSHIP_SUFFIX="")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    } - {"imported package"}
+
+
+def test_cold_validate_stays_within_import_budget():
+    baseline = _imported_modules("pass")
+    modules = _imported_modules(
+        "import sys; sys.argv = ['dot', 'validate', 'x BECAUSE I WORSHIP THE DOT']\n"
+        "from dot.cli import main; main()"
+    )
+    extra = modules - baseline
+
+    assert not extra & FORBIDDEN, sorted(extra & FORBIDDEN)
+    assert len(extra) <= MODULE_BUDGET, sorted(extra)
+
+
+def test_package_import_is_lazy():
+    modules = _imported_modules("import dot; dot.__version__")
+    assert "dot.core" not in modules and "dot.config" not in modules
+
+    import dot
+    assert dot.worship is __import__("dot.core", fromlist=["worship"]).worship
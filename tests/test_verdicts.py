@@ -0,0 +1,68 @@
+"""Tests for the persistent commit verdict cache."""
+
+import hashlib
+
+from dot.verdicts import MAGIC, RECORD, VerdictCache
+
+SUFFIX = "BECAUSE I WORSHIP THE DOT"
+
+
+def _sha(n):
+    return hashlib.sha1(str(n).encode()).hexdigest()
+
+
+def test_round_trip_and_sorted_layout(tmp_path):
+    path = tmp_path / "verdicts.bin"
+    cache = VerdictCache(path)
+    for n in range(100):
+        cache.put(_sha(n), SUFFIX, n % 3 != 0)
+    assert cache.save() == 100
+
+    data = path.read_bytes()
+    assert data.startswith(MAGIC) and len(data) == len(MAGIC) + 100 * RECORD.size
+    keys = [data[i:i + 28] for i in range(len(MAGIC), len(data), RECORD.size)]
+    assert keys == sorted(keys)
+
+    reopened = VerdictCache(path)
+    assert len(reopened) == 100
+    assert reopened.get(_sha(1), SUFFIX) is True
+    assert reopened.get(_sha(3), SUFFIX) is False
+    assert reopened.get(_sha(1), "BECAUSE I ADORE THE DOT") is None
+    assert reopened.get(_sha(1000), SUFFIX) is None
+
+
+def test_save_merges_with_other_writers(tmp_path):
+    path = tmp_path / "verdicts.bin"
+    a, b = VerdictCache(path), VerdictCache(path)
+    a.put(_sha(1), SUFFIX, True)
+    b.put(_sha(2), SUFFIX, False)
+    b.put(_sha(1), SUFFIX, True)
+    assert a.save() == 1
+    assert b.save() == 1  # _sha(1) was already written by a
+    merged = VerdictCache(path)
+    assert len(merged) == 2 and merged.get(_sha(2), SUFFIX) is False
+
+
+def test_corrupt_file_is_ignored_and_replaced(tmp_path):
+    path = tmp_path / "verdicts.bin"
+    path.write_bytes(b"garbage")
+    cache = VerdictCache(path)
+    assert len(cache) == 0
+    cache.put(_sha(1), SUFFIX, True)
+    cache.save()
+    assert VerdictCache(path).get(_sha(1), SUFFIX) is True
+
+
+def test_ids_that_are_not_sha1_bypass_the_cache(tmp_path):
+    path = tmp_path / "verdicts.bin"
+    cache = VerdictCache(path)
+    sha256 = hashlib.sha256(b"commit").hexdigest()
+    cache.put(sha256, SUFFIX, True)
+    cache.put("not-hex" * 5 + "x" * 5, SUFFIX, True)
+    cache.put(_sha(1), SUFFIX, False)
+    assert cache.get(sha256, SUFFIX) is None
+    assert cache.save() == 1
+
+    data = path.read_bytes()
+    assert len(data) == len(MAGIC) + RECORD.size
+    assert VerdictCache(path).get(_sha(1), SUFFIX) is False
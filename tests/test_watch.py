@@ -0,0 +1,117 @@
+"""Tests for file watching and watch-driven cache invalidation."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from dot import watch
+
+
+def _inotify():
+    try:
+        return watch.InotifyWatcher()
+    except OSError as e:
+        pytest.skip(str(e))
+
+
+BACKENDS = [
+    pytest.param(lambda: watch.PollingWatcher(interval=0.01), id="polling"),
+    pytest.param(_inotify, id="inotify"),
+]
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def _replace_keeping_mtime(path, text):
+    """Rewrite path atomically with its old mtime, as a same-tick edit would."""
+    st = path.stat()
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text)
+    os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(tmp, path)
+
+
+@pytest.mark.parametrize("make", BACKENDS)
+def test_watcher_sees_creation_in_missing_dir_and_same_mtime_edits(tmp_path, make):
+    target = tmp_path / "later" / "nested" / ".dot.ini"
+    changed = threading.Event()
+    with make() as watcher:
+        watcher.watch(target, lambda path: changed.set())
+        assert watcher.watched() == [target]
+
+        target.parent.mkdir(parents=True)
+        target.write_text("[dot]\n")
+        assert changed.wait(5)
+
+        changed.clear()
+        _replace_keeping_mtime(target, "[dot]\nworship_suffix = X\n")
+        assert changed.wait(5)
+
+
+@pytest.fixture
+def watched_config(tmp_path, monkeypatch):
+    from dot import config, git_utils
+
+    monkeypatch.delenv("DOT_WORSHIP_SUFFIX", raising=False)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    (tmp_path / "home").mkdir()
+    repo = tmp_path / "repo"
+    (repo / ".git").mkdir(parents=True)
+    (repo / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    monkeypatch.chdir(repo)
+    monkeypatch.setattr(config, "_config", None)
+    git_utils.clear_repo_cache()
+    watcher = watch.PollingWatcher(interval=0.01)
+    config.watch_config(watcher)
+    yield repo
+    config.unwatch_config()
+    watcher.close()
+
+
+def test_watched_suffix_lookups_are_memory_reads(watched_config, monkeypatch):
+    from dot import config
+
+    ini = watched_config / ".dot.ini"
+    ini.write_text("[dot]\nworship_suffix = BECAUSE I ADORE THE DOT\n")
+    assert config.resolve_worship_suffix()[0] == "BECAUSE I ADORE THE DOT"
+
+    calls = []
+    real = config._resolve_from_files
+    monkeypatch.setattr(config, "_resolve_from_files", lambda cwd: calls.append(cwd) or real(cwd))
+    for _ in range(50):
+        assert config.resolve_worship_suffix()[0] == "BECAUSE I ADORE THE DOT"
+    assert calls == []
+
+    _replace_keeping_mtime(ini, "[dot]\nworship_suffix = BECAUSE I LOVE THE DOT\n")
+    assert _wait_for(lambda: config.resolve_worship_suffix()[0] == "BECAUSE I LOVE THE DOT")
+
+    # A config.json edit reaches get_config() without reconstructing it
+    cfg_file = config.get_config().config_file
+    assert config.get_setting("display", "epic") is False
+    cfg_file.parent.mkdir(parents=True)
+    cfg_file.write_text('{"display": {"epic": true}}')
+    assert _wait_for(lambda: config.get_setting("display", "epic") is True)
+
+
+def test_watched_stats_pick_up_other_writers(tmp_path):
+    from dot.stats import WorshipStats
+
+    stats_file = tmp_path / "stats.json"
+    reader = WorshipStats(stats_file, backend="json")
+    writer = WorshipStats(stats_file, backend="json")
+    with watch.PollingWatcher(interval=0.01) as watcher:
+        reader.watch(watcher)
+        writer.record_worship("ada")
+        assert reader.get_summary()["total_worships"] in (0, 1)
+        assert _wait_for(lambda: reader.get_summary()["total_worships"] == 1)
+        assert reader.get_top_worshippers(1)[0]["name"] == "ada"